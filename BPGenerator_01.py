@@ -29,10 +29,11 @@ else:
 
 #UI --------------------------------------------------------------
 
-import sys
 from functools import partial  # if you want to include args with UI method calls
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtWidgets import QApplication, QMainWindow, QPushButton, QWidget, QLineEdit, QLabel, QVBoxLayout, QSlider, QRadioButton, QButtonGroup, QComboBox, QDial
+from PySide6.QtWidgets import QMainWindow, QPushButton, QWidget, QLineEdit, QLabel, QVBoxLayout, QSlider, QRadioButton, QButtonGroup, QComboBox, QDial
+
+import tool_host
 
 
 
@@ -102,19 +103,16 @@ class UnrealWindow(QWidget):
     
 
 def launchWindow():
-    if QApplication.instance():
-        # Id any current instances of tool and destroy
-        for win in (QApplication.allWindows()):
-            if 'toolWindow' in win.objectName(): # update this name to match name below
-                win.destroy()
-    else:
-        QApplication(sys.argv)
+    # Keep one warm window: relaunching shows/raises it instead of destroying and rebuilding,
+    # and a new one is only built when this script has changed
+    UnrealWindow.window = tool_host.launch("BPGenerator_01", createWindow, source=globals().get("__file__"))
+
 
-    UnrealWindow.window = UnrealWindow()
-    UnrealWindow.window.show()
-    UnrealWindow.window.setWindowTitle("Blueprint Generator")
-    UnrealWindow.window.setObjectName("ToolWindow")
-    unreal.parent_external_window_to_slate(UnrealWindow.window.winId())
+def createWindow():
+    window = UnrealWindow()
+    window.setWindowTitle("Blueprint Generator")
+    window.setObjectName("ToolWindow")
+    return window
 
 
 
@@ -139,62 +137,36 @@ launchWindow()
 
 
 
-def ListMenu(num = 1000):
-    menuList = set()
+import menu_registry
+import tool_log
 
-    for i in range (num):
-        #try to find unreal objects at a specific "path" in memory
-        object = unreal.find_object(None, "/Engine/Transient.ToolMenu_0:RegisteredMenu_%s" % i)
+log = tool_log.get_logger("BPGenerator")
 
-        if not obj:
-            #legacy path used fpr tje transent tool menu objects <-- only adding this for backards compatibility
-            obj = unreal.find_object(None, f"/Engine/Transient.ToolsMenu_0:ToolMenu_{i}")
-            if not obj:
-                continue
-        menuName = str(obj.menu_name)
-        if menuName == "None":
-            continue
-
-        menuList.add(menuName)
-        print(menuList)
+def ListMenu(prefix = ""):
+    #enumerates every registered ToolMenu once (cached), instead of probing 1000 transient paths
+    menuList = menu_registry.search_menus(prefix)
+    #one record for the whole list, only formatted if debug logging is on
+    log.debug("%d menus: %s", len(menuList), menuList)
+    return menuList
 
 #ListMenu()
 
-tool_menus = unreal.ToolMenus.get()
-
-def createNewMainMenu():
-    mainMenu = tool_menus.find_menu("LevelEditor.MainMenu")
-    #New Menu -> Section Name
-    #Python Tool -> ID, Key used in the code internally
-    #Menu Name -> Name of menu used for identification
-    #Menu Label -> What we see in the UI
-    newMenu = mainMenu.add_sub_menu("New Menu", "Python Tool", "Menu Name", "Menu Label")
-    tool_menus.refresh_all_widgets()
-
-#createNewMainMenu()
-
-@unreal.uclass()
-class MyEditActionScript(unreal.ToolMenuEntryScript):
-    @unreal.ufunction(override=True)
-    def execute(self, context):
-        print ("M Edit Action Executed")
-
-
-def createEditAction():
-    editMenu = tool_menus.find_menu("LevelEditor.MainMenu.Edit")
-    #we need to create a scriptable object
-    MyEditAcionScriptObject = MyEditActionScript()
-    MyEditAcionScriptObject.init_entry(
-        owner_name=editMenu.menu_name,
-        menu = editMenu.menu_name,
-        section="EditMain",
-        name = "MyEditCustomName",
-        label = "My Edit Action",
-        tool_tips= "this is my Edit Acion!"
-
-    )
-
-    MyEditAcionScriptObject.register_menu_entry()
-    tool_menus.refresh_all_widgets
-
-createEditAction()
\ No newline at end of file
+import menu_manifest
+
+#every menu entry this script adds, registered in one batch with a single widget refresh
+#re-running the script with the same entries does nothing, so entries never stack up
+MENU_ENTRIES = [
+    {
+        "menu": "LevelEditor.MainMenu.Edit",
+        "section": "EditMain",
+        "name": "MyEditCustomName",
+        "label": "My Edit Action",
+        "tooltip": "this is my Edit Acion!",
+        "command": "print('M Edit Action Executed')",
+    },
+]
+
+def registerMenus():
+    menu_manifest.register_manifest("BPGenerator_01", MENU_ENTRIES)
+
+registerMenus()
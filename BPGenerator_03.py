@@ -1,11 +1,12 @@
 import unreal
-import sys
 from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
+    QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QCheckBox, QFrame, QSpacerItem, QSizePolicy, QGroupBox, QToolButton, QComboBox
 )
 
+import tool_host
+
 DestinationFolder = "/Game/GeneratedBlueprints"
 WindowWidth = 450
 WindowHeight = 450
@@ -255,8 +256,8 @@ class BatchBlueprintCreator(QWidget):
         #live selected count -------------------------------------------------------------------------------------
         #creating a variable to remember last number of selected assets to detect if anything has changed
         self._last_asset_count = 0
-        #creating a timer
-        self.timer = QTimer()
+        #creating a timer, parented to the window so it stops with it
+        self.timer = QTimer(self)
         #conection the timers timeout signal to the "update_selected_count" function
         self.timer.timeout.connect(self.update_selected_count)
         #setting it so the timer starts every 0.5 seconds
@@ -400,40 +401,10 @@ _global_window_ref = None
 def launch_window():
     #making sure we are modifying the correct variable not a new local one
     global _global_window_ref
-    #checking if there is a "QApplication" already running
-    app = QApplication.instance()
-    #if it isnt it creates a new one
-    if not app:
-        app = QApplication(sys.argv)
-
-    #checks if any instance of the tool is already open and if so it deletes/closes it
-    for win in QApplication.allWindows():
-        if isinstance(win, QWidget) and win.objectName() == "ToolWindow":
-            try:
-                win.close()
-                win.deleteLater()
-            except:
-                pass
-
-    #create and show the new window
-    #creating an instance of the tool UI
-    window = BatchBlueprintCreator()
-    #actually displaying it
-    window.show()
-    #bringing it to the front
-    window.raise_()
-    #making sure it gets focused
-    window.activateWindow()
-
-    #parent the tool to unreals editor
-    try:
-        unreal.parent_external_window_to_slate(window.winId())
-        #if it doesnt work it outputs an error
-    except Exception as e:
-        unreal.log_warning(f"Could not parent to slate: {e}")
-
-    #making sure it doesnt get garbageed by python
-    _global_window_ref = window
+    #keeps one warm window for the tool, so reopening it just shows and raises the existing one
+    #the window is only rebuilt when this script has been changed since it was created
+    #tool_host also takes care of parenting it to unreals editor and keeping it from being garbage collected
+    _global_window_ref = tool_host.launch("BPGenerator_03", BatchBlueprintCreator, source=globals().get("__file__"))
     #writes a message to output log so its clear it ran successfully
     unreal.log("YAY!!! Batch Blueprint Creator running.")
 
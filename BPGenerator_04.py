@@ -1,11 +1,13 @@
 import unreal
-import sys
 from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
+    QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QCheckBox, QFrame, QSpacerItem, QSizePolicy, QGroupBox, QToolButton, QComboBox
 )
 
+import bp_session
+import tool_host
+
 DESTINATION_FOLDER = "/Game/GeneratedBlueprints"
 WINDOW_WIDTH = 450
 WINDOW_HEIGHT = 450
@@ -207,7 +209,10 @@ class BatchBlueprintCreator(QWidget):
             return
 
         unreal.log(f"Generating blueprints for {len(assets)} assets...")
-        tools = unreal.AssetToolsHelpers.get_asset_tools()
+        #handles + factory cached for the editor session instead of rebuilt per click / per asset
+        session = bp_session.get()
+        tools = session.asset_tools
+        factory = session.factory(unreal.Actor)
 
         for asset in assets:
             try:
@@ -215,8 +220,6 @@ class BatchBlueprintCreator(QWidget):
                 unique_name = tools.create_unique_asset_name(f"{DESTINATION_FOLDER}/{bp_name}", "")
                 bp_name = unique_name[1] if isinstance(unique_name, (list, tuple)) else unique_name
 
-                factory = unreal.BlueprintFactory()
-                factory.set_editor_property("ParentClass", unreal.Actor)
                 bp = tools.create_asset(bp_name, DESTINATION_FOLDER, unreal.Blueprint, factory)
                 if not bp:
                     unreal.log_warning(f"Failed to create blueprint for {asset.get_name()}")
@@ -297,29 +300,8 @@ _global_window_ref = None
 
 def launch_window():
     global _global_window_ref
-    app = QApplication.instance()
-    if not app:
-        app = QApplication(sys.argv)
-
-    for win in QApplication.allWindows():
-        if isinstance(win, QWidget) and win.objectName() == "ToolWindow":
-            try:
-                win.close()
-                win.deleteLater()
-            except:
-                pass
-
-    window = BatchBlueprintCreator()
-    window.show()
-    window.raise_()
-    window.activateWindow()
-
-    try:
-        unreal.parent_external_window_to_slate(window.winId())
-    except Exception as e:
-        unreal.log_warning(f"Could not parent to slate: {e}")
-
-    _global_window_ref = window
+    # One warm window per tool: relaunching raises it, it is only rebuilt when this script changed
+    _global_window_ref = tool_host.launch("BPGenerator_04", BatchBlueprintCreator, source=globals().get("__file__"))
     unreal.log("✅ Batch Blueprint Creator running (checkboxes & live asset count fixed).")
 
 
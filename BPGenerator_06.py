@@ -1,11 +1,12 @@
 import unreal
-import sys
 from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
+    QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QCheckBox, QFrame, QSpacerItem, QSizePolicy, QGroupBox, QToolButton, QComboBox
 )
 
+import tool_host
+
 DESTINATION_FOLDER = "/Game/GeneratedBlueprints"
 WINDOW_WIDTH = 450
 WINDOW_HEIGHT = 450
@@ -299,29 +300,8 @@ _global_window_ref = None
 
 def launch_window():
     global _global_window_ref
-    app = QApplication.instance()
-    if not app:
-        app = QApplication(sys.argv)
-
-    for win in QApplication.allWindows():
-        if isinstance(win, QWidget) and win.objectName() == "ToolWindow":
-            try:
-                win.close()
-                win.deleteLater()
-            except:
-                pass
-
-    window = BatchBlueprintCreator()
-    window.show()
-    window.raise_()
-    window.activateWindow()
-
-    try:
-        unreal.parent_external_window_to_slate(window.winId())
-    except Exception as e:
-        unreal.log_warning(f"Could not parent to slate: {e}")
-
-    _global_window_ref = window
+    # One warm window per tool: relaunching raises it, it is only rebuilt when this script changed
+    _global_window_ref = tool_host.launch("BPGenerator_06", BatchBlueprintCreator, source=globals().get("__file__"))
     unreal.log("✅ Batch Blueprint Creator running.")
 
 
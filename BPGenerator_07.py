@@ -1,14 +1,32 @@
 import unreal
-import sys
+import os
+import uuid
 from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
-    QCheckBox, QFrame, QSpacerItem, QSizePolicy, QGroupBox, QToolButton, QComboBox
+    QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
+    QCheckBox, QFrame, QSpacerItem, QSizePolicy, QGroupBox, QToolButton, QComboBox, QSpinBox, QLineEdit, QMessageBox
 )
 
-DESTINATION_FOLDER = "/Game/GeneratedBlueprints"
+import bp_dashboard
+import bp_handlers
+import bp_harvest
+import bp_instancing
+import bp_layout
+import bp_manifest
+import bp_queue
+import bp_refresh
+import bp_rules
+import bp_validate
+import bp_watch
+import menu_manifest
+import tool_host
+import tool_log
+
+DESTINATION_FOLDER = bp_handlers.DESTINATION_FOLDER
 WINDOW_WIDTH = 450
-WINDOW_HEIGHT = 450
+WINDOW_HEIGHT = 830
+
+log = tool_log.get_logger("BPGenerator")
 
 # Ensure folder exists
 if not unreal.EditorAssetLibrary.does_directory_exist(DESTINATION_FOLDER):
@@ -120,6 +138,8 @@ class BatchBlueprintCreator(QWidget):
         inner.setSpacing(6)
         self.simple_collision_cb = self._add_option(inner, "Simple or Complex as Simple", inside=True)
         self.gen_overlap_cb = self._add_option(inner, "Generate overlap events", inside=True)
+        self.auto_collision_cb = self._add_option(inner, "Auto collision from mesh data", inside=True)
+        self.auto_collision_cb.setToolTip("Pick collision and physics per mesh from triangle count, simple collision and bounds")
 
         # Collision Preset Dropdown
         row = QHBoxLayout()
@@ -149,9 +169,97 @@ class BatchBlueprintCreator(QWidget):
         # CCD
         self.ccd_cb = self._add_option(content, "Continuous Collision Detection (CCD)")
 
+        # Rendering (StaticMesh LOD / shadows / culling / materials)
+        render_box = CollapsibleBox("Rendering settings")
+        inner = QVBoxLayout()
+        inner.setSpacing(6)
+        self.render_rules_cb = self._add_option(inner, "Auto LOD, shadows and culling by size", inside=True)
+        self.render_rules_cb.setToolTip("Pick cull distance, min LOD, shadows and Nanite fallback per mesh from its bounds")
+        self.cast_shadow_cb = self._add_option(inner, "Cast shadows", inside=True)
+        self.nanite_fallback_cb = self._add_option(inner, "Use Nanite fallback mesh", inside=True)
+        self.nanite_fallback_cb.setToolTip("Draw the fallback mesh instead of Nanite on these components (the mesh asset is not changed)")
+        self.cull_spin = self._add_spin(inner, "Cull distance (0 = by size / never)", 0, 1000000, 500)
+        self.forced_lod_spin = self._add_spin(inner, "Forced LOD (0 = auto)", 0, 8)
+        self.min_lod_spin = self._add_spin(inner, "Min LOD", 0, 7)
+        row = QHBoxLayout()
+        label = QLabel("Material overrides")
+        label.setProperty("class", "option")
+        self.materials_edit = QLineEdit()
+        self.materials_edit.setFixedWidth(180)
+        self.materials_edit.setPlaceholderText("Slot=/Game/Path/M_Mat, ...")
+        row.addWidget(label)
+        row.addStretch()
+        row.addWidget(self.materials_edit)
+        row.setContentsMargins(20, 0, 0, 0)
+        inner.addLayout(row)
+        render_box.content.setLayout(inner)
+        content.addWidget(render_box)
+
+        # Output mode
+        row = QHBoxLayout()
+        label = QLabel("Output mode")
+        label.setProperty("class", "option")
+        self.output_combo = QComboBox()
+        self.output_combo.setFixedWidth(180)
+        self.output_combo.addItems(["Blueprint per asset", "Instanced (ISM)", "Instanced (HISM)"])
+        row.addWidget(label)
+        row.addStretch()
+        row.addWidget(self.output_combo)
+        content.addLayout(row)
+        self.from_level_cb = self._add_option(content, "Instances from placed actors")
+
+        # Destination layout
+        row = QHBoxLayout()
+        label = QLabel("Output layout")
+        label.setProperty("class", "option")
+        self.layout_combo = QComboBox()
+        self.layout_combo.setFixedWidth(180)
+        self.layout_combo.addItems(["Flat", "Mirror source folders", "Hash buckets"])
+        self.layout_combo.setToolTip("Where Blueprints go under the destination folder")
+        row.addWidget(label)
+        row.addStretch()
+        row.addWidget(self.layout_combo)
+        content.addLayout(row)
+        row = QHBoxLayout()
+        label = QLabel("Max per folder")
+        label.setProperty("class", "option")
+        self.fanout_spin = QSpinBox()
+        self.fanout_spin.setRange(16, 10000)
+        self.fanout_spin.setValue(bp_layout.MAX_FANOUT)
+        self.fanout_spin.setFixedWidth(180)
+        row.addWidget(label)
+        row.addStretch()
+        row.addWidget(self.fanout_spin)
+        row.setContentsMargins(20, 0, 0, 0)
+        content.addLayout(row)
+
+        self.plan_only_cb = self._add_option(content, "Plan only (dry run)")
+        self.plan_only_cb.setToolTip("Write a generation plan from the asset registry without creating anything; the next Generate runs it")
+        self.scc_submit_cb = self._add_option(content, "Submit to source control")
+        self.scc_submit_cb.setToolTip("Check in everything a run writes as one change with a generated description")
+        self.watch_cb = self._add_option(content, "Watch import folders")
+        self.watch_cb.setToolTip("Queue new meshes under the watched folders (Saved/BlueprintGenerator/watch.json) with these options")
+
         # Spacer
         content.addItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
+        # Queue depth + throughput
+        self.queue_label = QLabel("Queue: 0 pending")
+        content.addWidget(self.queue_label)
+        dashboard_box = CollapsibleBox("Throughput")
+        inner = QVBoxLayout()
+        inner.setSpacing(4)
+        self.dashboard = bp_dashboard.ThroughputPanel()
+        inner.addWidget(self.dashboard)
+        report_row = QHBoxLayout()
+        report_row.addStretch()
+        self.report_btn = QPushButton("Export Report")
+        self.report_btn.clicked.connect(self.on_export_report)
+        report_row.addWidget(self.report_btn)
+        inner.addLayout(report_row)
+        dashboard_box.content.setLayout(inner)
+        content.addWidget(dashboard_box)
+
         # Info + Generate
         self.info_label = QLabel("Selected assets: 0")
         btn_row = QHBoxLayout()
@@ -163,16 +271,44 @@ class BatchBlueprintCreator(QWidget):
         self.generate_btn.clicked.connect(self.on_generate)
         btn_row.addWidget(self.generate_btn)
         content.addLayout(btn_row)
+
+        # Level actors -> Blueprints
+        harvest_row = QHBoxLayout()
+        harvest_row.addStretch()
+        self.harvest_btn = QPushButton("Harvest Level Actors")
+        self.harvest_btn.setProperty("class", "generate")
+        self.harvest_btn.setFixedWidth(180)
+        self.harvest_btn.setToolTip("Cluster the selected StaticMeshActors into Blueprints")
+        self.harvest_btn.clicked.connect(self.on_harvest)
+        self.harvest_level_btn = QPushButton("Harvest Whole Level")
+        self.harvest_level_btn.setToolTip("Cluster every StaticMeshActor in the level into Blueprints (asks first)")
+        self.harvest_level_btn.clicked.connect(self.on_harvest_level)
+        harvest_row.addWidget(self.harvest_level_btn)
+        harvest_row.addWidget(self.harvest_btn)
+        content.addLayout(harvest_row)
         main_layout.addLayout(content)
 
         # Live selection count
         self._last_asset_count = 0
+        self._plan = None
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_selected_count)
+        self.timer.timeout.connect(self.update_queue_label)
         self.timer.start(500)
 
-        for cb in [self.gravity_cb, self.simple_collision_cb, self.gen_overlap_cb, self.ccd_cb]:
+        # Generation runs in the background queue; we only hear back about our own jobs
+        self._jobs = {}  # job id -> [total, finished, failed]
+        bp_queue.add_listener(self.on_queue_outcomes)
+        self.destroyed.connect(lambda: bp_queue.remove_listener(self.on_queue_outcomes))
+        bp_queue.start()
+        bp_refresh.install()
+
+        for cb in [self.gravity_checkbox, self.simple_collision_cb, self.gen_overlap_cb, self.auto_collision_cb, self.ccd_cb, self.from_level_cb, self.plan_only_cb, self.scc_submit_cb]:
             cb.setCheckState(Qt.Unchecked)
+        self.cast_shadow_cb.setChecked(True)
+        self.watch_cb.setChecked(bp_watch.is_running())
+        self.output_combo.currentIndexChanged.connect(self.on_output_mode_changed)
+        self.watch_cb.toggled.connect(self.on_watch_toggled)
 
     def _add_option(self, parent_layout, text, inside=False):
         row = QHBoxLayout()
@@ -187,6 +323,30 @@ class BatchBlueprintCreator(QWidget):
         parent_layout.addLayout(row)
         return checkbox
 
+    def _add_spin(self, parent_layout, text, minimum, maximum, step=1):
+        row = QHBoxLayout()
+        label = QLabel(text)
+        label.setProperty("class", "option")
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setSingleStep(step)
+        spin.setFixedWidth(90)
+        row.addWidget(label)
+        row.addStretch()
+        row.addWidget(spin)
+        row.setContentsMargins(20, 0, 0, 0)
+        parent_layout.addLayout(row)
+        return spin
+
+    def material_overrides(self):
+        """'Slot=/Game/M_Mat, Slot2=...' -> {slot: path}"""
+        overrides = {}
+        for part in self.materials_edit.text().split(","):
+            slot, _, path = part.partition("=")
+            if slot.strip() and path.strip():
+                overrides[slot.strip()] = path.strip()
+        return overrides
+
     def update_selected_count(self):
         assets = unreal.EditorUtilityLibrary.get_selected_assets()
         count = len(assets)
@@ -194,23 +354,244 @@ class BatchBlueprintCreator(QWidget):
             self._last_asset_count = count
             self.info_label.setText(f"Selected assets: {count}")
 
+    def get_options(self):
+        return {
+            "enable_gravity": self.gravity_checkbox.isChecked(),
+            "simple_collision": self.simple_collision_cb.isChecked(),
+            "generate_overlap": self.gen_overlap_cb.isChecked(),
+            "ccd": self.ccd_cb.isChecked(),
+            "collision_preset": self.collision_combo.currentText(),
+            "auto_collision": self.auto_collision_cb.isChecked(),
+            "render_rules": self.render_rules_cb.isChecked(),
+            "cast_shadow": self.cast_shadow_cb.isChecked(),
+            "nanite_fallback": self.nanite_fallback_cb.isChecked(),
+            "cull_distance": float(self.cull_spin.value()),
+            "forced_lod": self.forced_lod_spin.value(),
+            "min_lod": self.min_lod_spin.value(),
+            "material_overrides": self.material_overrides(),
+            "output_mode": ("per_asset", "ism", "hism")[self.output_combo.currentIndex()],
+            "instances_from_level": self.from_level_cb.isChecked(),
+            "layout": bp_layout.LAYOUTS[self.layout_combo.currentIndex()],
+            "max_fanout": self.fanout_spin.value(),
+            "plan_only": self.plan_only_cb.isChecked(),
+            "scc_submit": self.scc_submit_cb.isChecked(),
+        }
+
     def on_generate(self):
-        assets = unreal.EditorUtilityLibrary.get_selected_assets()
-        if not assets:
-            unreal.log_warning("⚠️ No assets selected.")
+        options = self.get_options()
+        if options["plan_only"]:
+            if options["output_mode"] != "per_asset":
+                # Instanced output has no plan; a dry run must never write assets
+                log.warning("⚠️ Plan only works with Blueprint per asset output; nothing was generated.")
+                return
+            self.on_plan(options)
+            return
+
+        if self._plan is not None and self._plan_matches(options):
+            # Selection and options unchanged since the dry run: queue it instead of planning again
+            plan, self._plan = self._plan, None
+            log.info("🛠 Executing plan: %s", bp_manifest.summarize(plan))
+            job = self._new_job()
+            self._queued(job, *bp_queue.enqueue_plan(plan, job))
             return
 
-        unreal.log(f"🛠 Generating blueprints for {len(assets)} assets...")
-        
-        for asset in assets:
-            try:
-                if not isinstance(asset, unreal.StaticMesh):
-                    unreal.log_warning(f"Skipping {asset.get_name()} (not a StaticMesh).")
-                    continue
+        asset_datas = unreal.EditorUtilityLibrary.get_selected_asset_data()
+        if not asset_datas:
+            log.warning("⚠️ No assets selected.")
+            return
+        invalid = self._validate(asset_datas)
+
+        if options["output_mode"] != "per_asset":
+            # One Blueprint with an instanced component per unique mesh
+            assets = [a for a in unreal.EditorUtilityLibrary.get_selected_assets() if a.get_path_name() not in invalid]
+            bp, report = bp_instancing.consolidate(
+                assets, options, DESTINATION_FOLDER,
+                hierarchical=options["output_mode"] == "hism",
+                from_level=options["instances_from_level"],
+            )
+            if bp is None:
+                log.warning("⚠️ %s", report["error"])
+            return
+
+        if options["auto_collision"]:
+            self._classify_collision(options, asset_datas)
+
+        # Queued as interactive work; the background scheduler generates it ahead of bulk jobs
+        sources = [f"{ad.package_name}.{ad.asset_name}" for ad in asset_datas]
+        sources = [source for source in sources if source not in invalid]
+        job = self._new_job()
+        self._queued(job, *bp_queue.get_queue().enqueue(job, sources, options, DESTINATION_FOLDER, bp_queue.INTERACTIVE))
 
-            except Exception as e:
-                unreal.log_warning(f"⚠️ Error creating BP for {asset.get_name()}: {e}")
+    def _new_job(self):
+        return f"ui-{uuid.uuid4().hex[:8]}"
 
+    def _queued(self, job, added, merged):
+        if added:
+            self._jobs[job] = [added, 0, 0]
+        log.info("🛠 Queued %d assets for generation (%d already pending).", added, merged)
+        self.dashboard.tick()
+        self.update_queue_label()
+
+    def on_queue_outcomes(self, job, outcomes):
+        progress = self._jobs.get(job)
+        if progress is None:
+            return
+        for item_id, bp, message in outcomes:
+            if bp is None:
+                progress[2] += 1
+                log.warning("⚠️ Error creating BP (queue item %d): %s", item_id, message)
+        progress[1] += len(outcomes)
+        if progress[1] >= progress[0]:
+            del self._jobs[job]
+            log.info("✅ %d Blueprints generated, %d failed.", progress[0] - progress[2], progress[2])
+            tool_log.flush()
+
+    def update_queue_label(self):
+        stats = self.dashboard.sampler.queue
+        if not stats:
+            return
+        self.queue_label.setText(
+            f"Queue: {stats['pending'] + stats['running']} pending ({stats['interactive']} interactive), "
+            f"{stats['per_second']:.1f}/s"
+        )
+
+    def _validate(self, asset_datas):
+        # Header + tag checks for the whole selection before anything is created
+        invalid = bp_validate.validate(asset_datas)
+        for object_path, problems in invalid.items():
+            log.warning("⚠️ Skipping %s: %s", object_path, ", ".join(problems))
+        return invalid
+
+    def _classify_collision(self, options, asset_datas):
+        # Classified from registry tags, before anything is loaded for generation
+        meshes = [ad for ad in asset_datas if str(ad.asset_class_path.asset_name) == "StaticMesh"]
+        options["collision_rules"] = bp_rules.classify(meshes, options)
+        for package, rules in options["collision_rules"].items():
+            log.debug("   %s: %s, %s (%s)", package, rules["collision_preset"], rules["complexity"], "; ".join(rules["reasons"]) or "defaults")
+
+    def on_export_report(self):
+        path = bp_dashboard.export_report(self.dashboard.sampler)
+        report = self.dashboard.sampler.report()
+        busiest = sorted(report["stages"].items(), key=lambda kv: -kv[1]["total_ms"])[:3]
+        log.info("📊 %d assets at %s/s; time went to %s", report["assets"], report["assets_per_s"],
+                 ", ".join(f"{stage} {info['share_pct']}%" for stage, info in busiest))
+        log.info("   Report written to %s", path)
+
+    def on_plan(self, options):
+        asset_datas = unreal.EditorUtilityLibrary.get_selected_asset_data()
+        if not asset_datas:
+            log.warning("⚠️ No assets selected.")
+            return
+        invalid = self._validate(asset_datas)
+        if options["auto_collision"]:
+            self._classify_collision(options, asset_datas)
+        self._plan = bp_handlers.plan(asset_datas, options, DESTINATION_FOLDER, invalid)
+        path = bp_manifest.write_plan(self._plan)
+        log.info("📝 Plan for %d assets: %s", len(asset_datas), bp_manifest.summarize(self._plan))
+        log.info("   Written to %s. Untick 'Plan only' and Generate to run it.", path)
+
+    def _plan_matches(self, options):
+        selected = sorted(f"{ad.package_name}.{ad.asset_name}" for ad in unreal.EditorUtilityLibrary.get_selected_asset_data())
+        return (options["output_mode"] == "per_asset"
+                and bp_manifest.options_hash(options) == self._plan["options_hash"]
+                and selected == sorted(row["source"] for row in self._plan["rows"]))
+
+    def on_output_mode_changed(self, index):
+        # Only per-asset output can be planned
+        per_asset = index == 0
+        if not per_asset:
+            self.plan_only_cb.setChecked(False)
+        self.plan_only_cb.setEnabled(per_asset)
+
+    def on_watch_toggled(self, checked):
+        if checked:
+            bp_watch.start(options=self.get_options(), destination=DESTINATION_FOLDER)
+        else:
+            bp_watch.stop()
+            log.info("👀 Stopped watching import folders.")
+
+    def on_harvest(self):
+        selected = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_selected_level_actors()
+        if not selected:
+            log.warning("⚠️ No level actors selected; use Harvest Whole Level to harvest everything.")
+            return
+        report = bp_harvest.harvest(selected_only=True, destination=DESTINATION_FOLDER, scc_submit=self.scc_submit_cb.isChecked())
+        if not report["clusters"]:
+            log.warning("⚠️ No clusters of StaticMeshActors found to harvest.")
+
+    def on_harvest_level(self):
+        # Whole level replaces actors everywhere: show what would happen and ask first
+        preview = bp_harvest.preview(selected_only=False)
+        if not preview["clusters"]:
+            log.warning("⚠️ No clusters of StaticMeshActors found to harvest.")
+            return
+        answer = QMessageBox.question(
+            self, "Harvest whole level",
+            f"Replace {preview['actors_to_replace']} of {preview['actors_scanned']} StaticMeshActors "
+            f"({preview['clusters']} clusters) with {preview['blueprints']} new Blueprints?\n\n"
+            "This can be undone with one Undo.",
+        )
+        if answer == QMessageBox.Yes:
+            bp_harvest.harvest(selected_only=False, destination=DESTINATION_FOLDER, scc_submit=self.scc_submit_cb.isChecked())
+
+
+# ---------------- Menus ---------------- #
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MENU_ENTRIES = [
+    {
+        "menu": "LevelEditor.MainMenu.Tools",
+        "section": "BlueprintGenerator",
+        "name": "GenerateBlueprints",
+        "label": "Generate Blueprints",
+        "tooltip": "Open the Batch Blueprint Creator",
+        "command": f"import runpy; runpy.run_path(r'{os.path.join(_SCRIPT_DIR, 'BPGenerator_07.py')}', run_name='__main__')",
+    },
+    {
+        "menu": "LevelEditor.MainMenu.Tools",
+        "section": "BlueprintGenerator",
+        "name": "LightingTool",
+        "label": "Lighting Tool",
+        "tooltip": "Open the UE Lighting Tool",
+        "command": f"import runpy; runpy.run_path(r'{os.path.join(_SCRIPT_DIR, 'TestLight')}', run_name='__main__')",
+    },
+    {
+        "menu": "LevelEditor.MainMenu.Tools",
+        "section": "BlueprintGenerator",
+        "name": "RemoteGenerationServer",
+        "label": "Start Remote Generation Server",
+        "tooltip": "Accept generation jobs from pipeline scripts on localhost (see bp_remote.py)",
+        "command": f"import sys; sys.path.insert(0, r'{_SCRIPT_DIR}'); import bp_remote; bp_remote.start_server()",
+    },
+    {
+        "menu": "LevelEditor.MainMenu.Tools",
+        "section": "BlueprintGenerator",
+        "name": "WatchFolders",
+        "label": "Start Watch Folders",
+        "tooltip": "Generate Blueprints for new meshes in the folders listed in Saved/BlueprintGenerator/watch.json",
+        "command": f"import sys; sys.path.insert(0, r'{_SCRIPT_DIR}'); import bp_watch; bp_watch.start()",
+    },
+    {
+        "menu": "LevelEditor.MainMenu.Tools",
+        "section": "BlueprintGenerator",
+        "name": "AuditBlueprints",
+        "label": "Audit Generated Blueprints",
+        "tooltip": "Report duplicate/orphaned components, missing meshes and settings drift without changing anything",
+        "command": f"import sys; sys.path.insert(0, r'{_SCRIPT_DIR}'); import bp_audit; bp_audit.start()",
+    },
+    {
+        "menu": "LevelEditor.MainMenu.Tools",
+        "section": "BlueprintGenerator",
+        "name": "RepairBlueprints",
+        "label": "Repair Generated Blueprints",
+        "tooltip": "Audit, then fix every finding in one undoable step and save the repaired Blueprints; writes a report",
+        "command": f"import sys; sys.path.insert(0, r'{_SCRIPT_DIR}'); import bp_audit; bp_audit.start(fix=True)",
+    },
+]
+
+
+def register_menus():
+    menu_manifest.register_manifest("BlueprintGenerator", MENU_ENTRIES)
 
 
 # ---------------- Launcher ---------------- #
@@ -218,31 +599,11 @@ _global_window_ref = None
 
 def launch_window():
     global _global_window_ref
-    app = QApplication.instance()
-    if not app:
-        app = QApplication(sys.argv)
-
-    for win in QApplication.allWindows():
-        if isinstance(win, QWidget) and win.objectName() == "ToolWindow":
-            try:
-                win.close()
-                win.deleteLater()
-            except:
-                pass
-
-    window = BatchBlueprintCreator()
-    window.show()
-    window.raise_()
-    window.activateWindow()
-
-    try:
-        unreal.parent_external_window_to_slate(window.winId())
-    except Exception as e:
-        unreal.log_warning(f"Could not parent to slate: {e}")
-
-    _global_window_ref = window
-    unreal.log("✅ Batch Blueprint Creator running.")
+    # One warm window per tool: relaunching raises it, it is only rebuilt when this script changed
+    _global_window_ref = tool_host.launch("BPGenerator_07", BatchBlueprintCreator, source=globals().get("__file__"))
+    log.info("✅ Batch Blueprint Creator running.")
 
 
 if __name__ == "__main__":
+    register_menus()
     launch_window()
\ No newline at end of file
@@ -0,0 +1,446 @@
+"""
+Audit and repair of generated StaticMesh Blueprints.
+
+Older generators left broken or bloated Blueprints behind:
+    - BPGenerator_05 adds another StaticMeshComponent on every re-run
+    - BPGenerator_06 writes its component straight onto the class default
+      object instead of the component tree, so it isn't a real component
+inspect() walks every Blueprint under the destination folder in batches of
+BATCH_SIZE, reading each one's component tree with
+SubobjectDataSubsystem.k2_gather_subobject_data_for_blueprint, and records:
+    duplicate     more StaticMeshComponents with the same mesh and the same
+                  relative transform
+    orphan        subobject entries without an object, or mesh components
+                  with no mesh next to one that has it
+    cdo_component a StaticMeshComponent on the class default object
+    missing_mesh  no component has a mesh (fixed from the manifest source)
+    drift         component settings that differ from what the manifest's
+                  options would produce today
+Nothing is changed while inspecting; garbage is collected between batches so
+a whole library can be audited without holding it all in memory.
+
+Only Blueprints with a per-asset manifest entry are audited. Harvested and
+consolidated Blueprints hold several components on one mesh by design, and
+hand-made ones (or ones from generators that predate the manifest) have no
+record of what they should contain, so they are skipped and never repaired;
+regenerating such a Blueprint records it and brings it under the audit.
+
+repair() fixes every finding inside one editor transaction (one undo step),
+then compiles and saves each touched Blueprint once. The report compares
+package sizes on disk before and after (package_bytes_saved; this is file
+size, not memory) and estimates the load time saved from the load times
+measured while inspecting.
+
+start() runs the same steps from the slate tick, one batch per tick, so the
+editor stays responsive; the Audit menu entry only reports, the Repair entry
+also fixes. run() does it all in one call for scripts.
+
+    import bp_audit; bp_audit.start()          # report only
+    import bp_audit; bp_audit.start(fix=True)  # report and repair
+"""
+
+import json
+import os
+import time
+
+import unreal
+
+import bp_handlers
+import bp_manifest
+import bp_rules
+import bp_validate
+import tool_log
+
+BATCH_SIZE = 50
+
+log = tool_log.get_logger("BPGenerator")
+
+_MISSING = object()
+
+
+# ---------------- Reading components ---------------- #
+def read_setting(obj, path):
+    """Current value of a bp_handlers.apply_setting path, or _MISSING if it can't be read."""
+    if "." in path:
+        struct_name, field = path.split(".", 1)
+        try:
+            return read_setting(obj.get_editor_property(struct_name), field)
+        except Exception:
+            return _MISSING
+    try:
+        return obj.get_editor_property(path)
+    except Exception:
+        pass
+    # Physics flags set through set_<name>() live on the body instance
+    try:
+        return obj.get_editor_property("body_instance").get_editor_property(path)
+    except Exception:
+        pass
+    for getter in (f"get_{path}", f"is_{path}"):
+        if callable(getattr(obj, getter, None)):
+            try:
+                return getattr(obj, getter)()
+            except Exception:
+                pass
+    return _MISSING
+
+
+def _same(a, b):
+    if isinstance(a, float) or isinstance(b, float):
+        try:
+            return abs(float(a) - float(b)) < 1e-3
+        except (TypeError, ValueError):
+            return False
+    if isinstance(a, (list, tuple)) or isinstance(b, (list, tuple)):
+        a, b = list(a or []), list(b or [])
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if hasattr(a, "get_path_name") or hasattr(b, "get_path_name"):
+        return (a.get_path_name() if a else None) == (b.get_path_name() if b else None)
+    if isinstance(a, unreal.Name) or isinstance(b, unreal.Name):
+        return str(a) == str(b)
+    return a == b
+
+
+def expected_settings(entry, manifest, mesh):
+    """Settings generation would write today for a manifest entry (mesh loaded); None if its options are unknown."""
+    options = manifest["options"].get(entry["options"]) if entry else None
+    if options is None:
+        return None
+    handler = bp_handlers.HANDLERS["/Script/Engine.StaticMesh"]
+    settings = handler.component_settings(options)
+    tags = None
+    if options.get("auto_collision") or bp_rules.wants_render_rules(options):
+        tags = bp_rules.read_mesh_tags(unreal.EditorAssetLibrary.find_asset_data(mesh.get_path_name()))
+    if options.get("auto_collision"):
+        settings.update(bp_rules.component_settings(bp_rules.collision_rules(tags, options)))
+    if bp_rules.wants_render_rules(options):
+        settings.update(bp_rules.render_settings(bp_rules.render_rules(tags, options), mesh))
+    return settings
+
+
+# ---------------- Inspection ---------------- #
+def find_blueprints(root=bp_handlers.DESTINATION_FOLDER):
+    """Object paths of every Blueprint under root, from the registry (nothing loaded)."""
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    return sorted(
+        f"{ad.package_name}.{ad.asset_name}" for ad in registry.get_assets_by_path(root, recursive=True)
+        if str(ad.asset_class_path.asset_name) == "Blueprint"
+    )
+
+
+def per_asset_entry(manifest, bp_path):
+    """The manifest entry of a per-asset generated Blueprint, or None (not ours, harvested or consolidated)."""
+    entry = manifest["blueprints"].get(bp_path)
+    return entry if entry and not entry.get("output") else None
+
+
+def _placement(component):
+    """Relative (location, rotation, scale) of a component as plain floats."""
+    loc = component.get_editor_property("relative_location")
+    rot = component.get_editor_property("relative_rotation")
+    scale = component.get_editor_property("relative_scale3d")
+    return (loc.x, loc.y, loc.z), (rot.roll, rot.pitch, rot.yaw), (scale.x, scale.y, scale.z)
+
+
+def inspect_blueprint(bp_path, manifest, subsystem):
+    """Findings for one Blueprint: {bp, load_ms, bytes, findings: [{kind, detail, ...}]}.
+
+    Blueprints without a per-asset manifest entry come back with no findings and skipped set.
+    """
+    entry = per_asset_entry(manifest, bp_path)
+    if entry is None:
+        return {"bp": bp_path, "load_ms": 0.0, "bytes": 0, "findings": [], "skipped": True}
+    bfl = unreal.SubobjectDataBlueprintFunctionLibrary
+    started = time.perf_counter()
+    bp = unreal.EditorAssetLibrary.load_asset(bp_path)
+    record = {"bp": bp_path, "load_ms": round((time.perf_counter() - started) * 1000.0, 2), "findings": []}
+    package_file = bp_validate.package_file(bp_path.split(".", 1)[0])
+    record["bytes"] = os.path.getsize(package_file) if package_file and os.path.isfile(package_file) else 0
+    if bp is None:
+        record["findings"].append({"kind": "unloadable", "detail": "Blueprint failed to load"})
+        return record
+
+    expected = entry["source"].rsplit(".", 1)[-1]
+    handles = subsystem.k2_gather_subobject_data_for_blueprint(bp) or []
+    meshes = []  # (handle, component, mesh path or None)
+    for handle in handles[1:]:
+        obj = bfl.get_object(bfl.get_data(handle))
+        if obj is None:
+            record["findings"].append({"kind": "orphan", "detail": "subobject without an object", "handle": handle})
+        elif isinstance(obj, unreal.StaticMeshComponent):
+            mesh = obj.get_editor_property("static_mesh")
+            meshes.append((handle, obj, mesh.get_path_name() if mesh else None))
+
+    # Keep the component holding the expected mesh (else the first with any mesh)
+    keep = next((m for m in meshes if m[2] and m[2].rsplit(".", 1)[-1] == expected), None)
+    keep = keep or next((m for m in meshes if m[2]), None)
+    for m in meshes:
+        if m is keep:
+            continue
+        if m[2] is None and keep is not None:
+            record["findings"].append({"kind": "orphan", "detail": f"{m[1].get_name()} has no mesh", "handle": m[0]})
+        elif keep is not None and m[2] == keep[2] and _same(_placement(m[1]), _placement(keep[1])):
+            record["findings"].append({"kind": "duplicate", "detail": f"{m[1].get_name()} repeats {keep[2]} in the same place", "handle": m[0]})
+
+    try:
+        cdo = unreal.get_default_object(bp.generated_class())
+        strays = list(cdo.get_components_by_class(unreal.StaticMeshComponent) or [])
+    except Exception:
+        cdo, strays = None, []
+    for stray in strays:
+        mesh = stray.get_editor_property("static_mesh")
+        record["findings"].append({
+            "kind": "cdo_component", "detail": f"{stray.get_name()} lives on the class default object",
+            "component": stray, "cdo": cdo, "mesh": mesh.get_path_name() if mesh else None,
+        })
+
+    if keep is None:
+        record["findings"].append({"kind": "missing_mesh", "detail": "no component has a mesh", "source": entry["source"]})
+    else:
+        mesh = keep[1].get_editor_property("static_mesh")
+        settings = expected_settings(entry, manifest, mesh)
+        drift = {}
+        for path, value in (settings or {}).items():
+            current = read_setting(keep[1], path)
+            if current is not _MISSING and not _same(current, value):
+                drift[path] = value
+        if drift:
+            record["findings"].append({"kind": "drift", "detail": ", ".join(sorted(drift)), "settings": drift, "component": keep[1]})
+    record["handles"] = handles
+    record["blueprint"] = bp
+    return record
+
+
+def inspect_batches(root=bp_handlers.DESTINATION_FOLDER, batch_size=BATCH_SIZE):
+    """inspect() in steps: yields (done, total, records with findings so far) after each batch."""
+    manifest = bp_manifest.load_manifest()
+    subsystem = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    found = find_blueprints(root)
+    paths = [bp_path for bp_path in found if per_asset_entry(manifest, bp_path)]
+    if len(paths) < len(found):
+        log.info("🩺 Skipping %d Blueprints that weren't generated per asset (harvested, consolidated or not in the manifest).",
+                 len(found) - len(paths))
+    records = []
+    for start in range(0, len(paths), batch_size):
+        for bp_path in paths[start:start + batch_size]:
+            try:
+                record = inspect_blueprint(bp_path, manifest, subsystem)
+            except Exception as e:
+                record = {"bp": bp_path, "load_ms": 0.0, "bytes": 0, "findings": [{"kind": "error", "detail": str(e)}]}
+            if record["findings"]:
+                records.append(record)
+        # Only Blueprints with findings stay referenced; let the rest go
+        unreal.SystemLibrary.collect_garbage()
+        yield min(start + batch_size, len(paths)), len(paths), records
+
+
+def inspect(root=bp_handlers.DESTINATION_FOLDER):
+    records, total = [], 0
+    for _, total, records in inspect_batches(root):
+        pass
+    return records, total
+
+
+# ---------------- Repair ---------------- #
+def _add_mesh_component(record, mesh, subsystem):
+    bfl = unreal.SubobjectDataBlueprintFunctionLibrary
+    params = unreal.AddNewSubobjectParams(record["handles"][0], unreal.StaticMeshComponent, record["blueprint"])
+    handle, fail_reason = subsystem.add_new_subobject(params)
+    if not bfl.is_handle_valid(handle):
+        raise RuntimeError(f"could not add a StaticMeshComponent: {fail_reason}")
+    subsystem.rename_subobject(handle, unreal.Text(f"{mesh.get_name()}_Component"))
+    component = bfl.get_object(bfl.get_data(handle))
+    component.set_editor_property("static_mesh", mesh)
+    return component
+
+
+def repair_record(record, subsystem):
+    """Fix one Blueprint's findings; returns the list of fixes made."""
+    bp = record["blueprint"]
+    context = record["handles"][0]
+    fixed = []
+    for finding in record["findings"]:
+        kind = finding["kind"]
+        if kind in ("duplicate", "orphan") and "handle" in finding:
+            subsystem.delete_subobject(context, finding["handle"], bp)
+            fixed.append(kind)
+        elif kind == "cdo_component":
+            # Its mesh is re-added as a real component by the missing_mesh finding
+            cdo = finding["cdo"]
+            try:
+                cdo.modify()
+                if cdo.get_editor_property("root_component") == finding["component"]:
+                    cdo.set_editor_property("root_component", None)
+                finding["component"].destroy_component(cdo)
+                fixed.append(kind)
+            except Exception as e:
+                log.warning("⚠️ %s: could not remove %s from the class default object: %s", record["bp"], finding["component"].get_name(), e)
+        elif kind == "missing_mesh":
+            mesh = unreal.EditorAssetLibrary.load_asset(finding["source"]) if finding["source"] else None
+            if mesh is None:
+                log.warning("⚠️ %s: no mesh and no source to restore it from.", record["bp"])
+                continue
+            _add_mesh_component(record, mesh, subsystem)
+            fixed.append(kind)
+        elif kind == "drift":
+            finding["component"].modify()
+            for path, value in finding["settings"].items():
+                try:
+                    bp_handlers.apply_setting(finding["component"], path, value)
+                except Exception as e:
+                    log.warning("%s: could not reset %s: %s", record["bp"], path, e)
+            fixed.append(kind)
+    return fixed
+
+
+def repair(records):
+    """Fix all findings in one transaction, then compile and save each touched Blueprint once."""
+    touched = fix_findings(records)
+    save_repaired(touched)
+    return touched
+
+
+def fix_findings(records):
+    """Fix all findings in one transaction (one undo step); returns the touched records, not yet saved."""
+    subsystem = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    touched = []
+    with unreal.ScopedEditorTransaction("Repair generated Blueprints"):
+        for record in records:
+            if "blueprint" not in record:
+                continue
+            try:
+                record["fixed"] = repair_record(record, subsystem)
+            except Exception as e:
+                record["fixed"] = []
+                log.error("%s: repair failed: %s", record["bp"], e)
+            if record["fixed"]:
+                touched.append(record)
+    return touched
+
+
+def save_repaired(touched):
+    """Compile and save repaired Blueprints, recording their package size after the save."""
+    for record in touched:
+        unreal.BlueprintEditorLibrary.compile_blueprint(record["blueprint"])
+        unreal.EditorAssetLibrary.save_loaded_asset(record["blueprint"])
+        package_file = bp_validate.package_file(record["bp"].split(".", 1)[0])
+        record["bytes_after"] = os.path.getsize(package_file) if package_file and os.path.isfile(package_file) else record["bytes"]
+
+
+# ---------------- Report ---------------- #
+def report(records, total, repaired=False):
+    counts = {}
+    for record in records:
+        for finding in record["findings"]:
+            counts[finding["kind"]] = counts.get(finding["kind"], 0) + 1
+    touched = [r for r in records if r.get("fixed")]
+    before = sum(r["bytes"] for r in touched)
+    after = sum(r.get("bytes_after", r["bytes"]) for r in touched)
+    load_ms = sum(r["load_ms"] for r in touched)
+    return {
+        "audited": total,
+        "with_findings": len(records),
+        "findings": counts,
+        "repaired": len(touched) if repaired else 0,
+        "components_removed": sum(r.get("fixed", []).count(k) for r in touched for k in ("duplicate", "orphan", "cdo_component")),
+        "package_bytes_saved": before - after,
+        # Load time scales with package size well enough for an estimate
+        "est_load_ms_saved": round(load_ms * (before - after) / before, 1) if before else 0.0,
+        "blueprints": [
+            {"bp": r["bp"], "findings": [f"{f['kind']}: {f['detail']}" for f in r["findings"]], "fixed": r.get("fixed", []),
+             "bytes": r["bytes"], "bytes_after": r.get("bytes_after", r["bytes"]), "load_ms": r["load_ms"]}
+            for r in records
+        ],
+    }
+
+
+def export_report(data, path=None):
+    path = path or os.path.join(bp_manifest.data_dir(), "reports", time.strftime("audit_%Y%m%d_%H%M%S.json"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def _finish(records, total, fix):
+    data = report(records, total, repaired=fix)
+    path = export_report(data)
+    log.info(
+        "🩺 Audited %d Blueprints: %d with findings %s; %d repaired, %d components removed, "
+        "%d KB smaller on disk (~%.0f ms load). Report: %s",
+        total, data["with_findings"], data["findings"], data["repaired"], data["components_removed"],
+        data["package_bytes_saved"] / 1024.0, data["est_load_ms_saved"], path,
+    )
+    return data
+
+
+def steps(root=bp_handlers.DESTINATION_FOLDER, fix=False):
+    """The whole audit in small steps: one inspect batch, the fix transaction, or one save batch per step."""
+    records, total = [], 0
+    for done, total, records in inspect_batches(root):
+        log.info("🩺 Inspected %d/%d Blueprints.", done, total)
+        yield
+    if fix:
+        touched = fix_findings(records)
+        yield
+        for start in range(0, len(touched), BATCH_SIZE):
+            save_repaired(touched[start:start + BATCH_SIZE])
+            log.info("🩺 Saved %d/%d repaired Blueprints.", min(start + BATCH_SIZE, len(touched)), len(touched))
+            yield
+    _finish(records, total, fix)
+
+
+def run(root=bp_handlers.DESTINATION_FOLDER, fix=False):
+    """Audit root (and repair when asked) in one call; logs a summary and writes the report. Returns the report."""
+    records, total = inspect(root)
+    if fix:
+        repair(records)
+    return _finish(records, total, fix)
+
+
+# ---------------- Background ---------------- #
+# Kept on the unreal module so a reload of this module can't start a second tick
+_STATE_ATTR = "_bpg_audit_state"
+
+
+def _state():
+    state = getattr(unreal, _STATE_ATTR, None)
+    if state is None:
+        state = {"tick": None, "steps": None}
+        setattr(unreal, _STATE_ATTR, state)
+    return state
+
+
+def is_running():
+    return _state()["tick"] is not None
+
+
+def start(root=bp_handlers.DESTINATION_FOLDER, fix=False):
+    """Run the audit (and repair when fix) from the slate tick, one step per tick; False if one is already running."""
+    state = _state()
+    if state["tick"] is not None:
+        log.warning("⚠️ An audit is already running.")
+        return False
+    state["steps"] = steps(root, fix)
+    state["tick"] = unreal.register_slate_post_tick_callback(_on_tick)
+    log.info("🩺 %s generated Blueprints under %s...", "Repairing" if fix else "Auditing", root)
+    return True
+
+
+def _on_tick(delta_seconds):
+    state = _state()
+    try:
+        next(state["steps"])
+        return
+    except StopIteration:
+        pass
+    except Exception as e:
+        log.error("Audit failed: %s", e)
+    stop()
+
+
+def stop():
+    state = _state()
+    if state["tick"] is not None:
+        unreal.unregister_slate_post_tick_callback(state["tick"])
+    state.update(tick=None, steps=None)
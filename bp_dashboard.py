@@ -0,0 +1,216 @@
+"""
+Throughput dashboard for the Batch Blueprint Creator window.
+
+Sampler reads cheap counters at a fixed rate: bp_handlers.STAGE_TOTALS (per
+stage call counts and milliseconds), the bp_queue counts and process memory.
+Each series lives in a pre-allocated ring buffer, so sampling allocates
+nothing. ThroughputPanel repaints the sparklines with QPainter from the
+same timer, and only while it is visible.
+
+export_report() writes what the sampler saw since it started (assets/s,
+where the time went per stage, memory, queue counts, the recent series) to
+Saved/BlueprintGenerator/reports/ as JSON.
+"""
+
+import array
+import ctypes
+import json
+import os
+import sys
+import time
+
+from PySide6.QtCore import QPointF, QTimer, Qt
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+import bp_handlers
+import bp_manifest
+import bp_queue
+
+HISTORY = 120          # samples kept per series
+SAMPLE_MS = 250
+STAGES = ("create", "load", "component", "settings", "compile", "save")
+
+
+# ---------------- Sampling ---------------- #
+class Ring:
+    """Fixed-size float ring buffer"""
+    def __init__(self, size=HISTORY):
+        self.data = array.array("d", [0.0] * size)
+        self.size = size
+        self.index = 0
+        self.count = 0
+
+    def push(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def last(self):
+        return self.data[(self.index - 1) % self.size] if self.count else 0.0
+
+    def values(self):
+        """Oldest to newest."""
+        if self.count < self.size:
+            return self.data[:self.count].tolist()
+        return (self.data[self.index:] + self.data[:self.index]).tolist()
+
+
+class _PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong), ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def memory_mb():
+    """Resident memory of the editor process in MB, or 0 if it can't be read."""
+    try:
+        if sys.platform == "win32":
+            counters = _PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / 1048576.0
+            return 0.0
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576.0
+    except Exception:
+        return 0.0
+
+
+class Sampler:
+    def __init__(self):
+        self.started = time.time()
+        self.rate = Ring()
+        self.memory = Ring()
+        self.stage_ms = {stage: Ring() for stage in STAGES}
+        self.queue = {}
+        self.peak_rate = 0.0
+        self.peak_memory = 0.0
+        self._baseline = self._totals()
+        self._previous = dict(self._baseline)
+        self._previous_time = time.perf_counter()
+        self.start_memory = memory_mb()
+
+    def _totals(self):
+        return {stage: tuple(bp_handlers.STAGE_TOTALS.get(stage, (0, 0.0))) for stage in STAGES}
+
+    def sample(self):
+        now = time.perf_counter()
+        totals = self._totals()
+        elapsed = max(now - self._previous_time, 1e-6)
+        saved = totals["save"][0] - self._previous["save"][0]
+        rate = saved / elapsed
+        self.rate.push(rate)
+        self.peak_rate = max(self.peak_rate, rate)
+        for stage in STAGES:
+            count = totals[stage][0] - self._previous[stage][0]
+            ms = totals[stage][1] - self._previous[stage][1]
+            # Hold the last mean while a stage is idle so the line doesn't drop to zero between chunks
+            self.stage_ms[stage].push(ms / count if count else self.stage_ms[stage].last())
+        mem = memory_mb()
+        self.memory.push(mem)
+        self.peak_memory = max(self.peak_memory, mem)
+        self.queue = bp_queue.get_queue().stats()
+        self._previous = totals
+        self._previous_time = now
+
+    def report(self):
+        totals = self._totals()
+        duration = max(time.time() - self.started, 1e-6)
+        stages = {}
+        spent = sum(totals[s][1] - self._baseline[s][1] for s in STAGES) or 1.0
+        for stage in STAGES:
+            count = totals[stage][0] - self._baseline[stage][0]
+            ms = totals[stage][1] - self._baseline[stage][1]
+            stages[stage] = {
+                "count": count,
+                "total_ms": round(ms, 1),
+                "mean_ms": round(ms / count, 2) if count else None,
+                "share_pct": round(100.0 * ms / spent, 1),
+            }
+        assets = totals["save"][0] - self._baseline["save"][0]
+        return {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "duration_s": round(duration, 1),
+            "assets": assets,
+            "assets_per_s": round(assets / duration, 2),
+            "peak_assets_per_s": round(self.peak_rate, 2),
+            "stages": stages,
+            "memory_mb": {"start": round(self.start_memory), "peak": round(self.peak_memory), "now": round(self.memory.last())},
+            "queue": self.queue,
+            "series": {
+                "assets_per_s": [round(v, 2) for v in self.rate.values()],
+                "memory_mb": [round(v) for v in self.memory.values()],
+                **{f"{stage}_ms": [round(v, 2) for v in ring.values()] for stage, ring in self.stage_ms.items()},
+            },
+        }
+
+
+def export_report(sampler, path=None):
+    path = path or os.path.join(bp_manifest.data_dir(), "reports", time.strftime("run_%Y%m%d_%H%M%S.json"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sampler.report(), f, indent=2)
+    return path
+
+
+# ---------------- Panel ---------------- #
+class ThroughputPanel(QWidget):
+    """Counts + sparklines, redrawn at SAMPLE_MS"""
+    ROW = 16
+    LABEL_W = 78
+    VALUE_W = 70
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sampler = Sampler()
+        self.setMinimumHeight(self.ROW * (3 + len(STAGES)) + 8)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(SAMPLE_MS)
+
+    def tick(self):
+        self.sampler.sample()
+        if self.isVisible():
+            self.update()
+
+    def _sparkline(self, p, ring, x, y, w, h, color):
+        values = ring.values()
+        if len(values) < 2:
+            return
+        top = max(values) or 1.0
+        step = w / float(HISTORY - 1)
+        x0 = x + w - step * (len(values) - 1)
+        poly = QPolygonF([QPointF(x0 + i * step, y + h - (v / top) * h) for i, v in enumerate(values)])
+        p.setPen(QPen(color, 1.2))
+        p.drawPolyline(poly)
+
+    def paintEvent(self, _):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        w = self.width()
+        spark_w = w - self.LABEL_W - self.VALUE_W - 8
+        s = self.sampler
+        q = s.queue
+
+        y = 2
+        p.setPen(QColor("#0b2540"))
+        p.drawText(4, y, w - 8, self.ROW, Qt.AlignLeft | Qt.AlignVCenter,
+                   f"queued {q.get('pending', 0) + q.get('running', 0)}   done {q.get('done', 0)}   failed {q.get('failed', 0)}")
+        y += self.ROW
+
+        rows = [("assets/s", s.rate, f"{s.rate.last():.1f}", QColor("#0b2540")),
+                ("memory", s.memory, f"{s.memory.last():.0f} MB", QColor("#8b5e34"))]
+        rows += [(stage, s.stage_ms[stage], f"{s.stage_ms[stage].last():.1f} ms", QColor("#6096ba")) for stage in STAGES]
+        for label, ring, value, color in rows:
+            p.setPen(QColor("#0b2540"))
+            p.drawText(4, y, self.LABEL_W, self.ROW, Qt.AlignLeft | Qt.AlignVCenter, label)
+            p.drawText(w - self.VALUE_W - 4, y, self.VALUE_W, self.ROW, Qt.AlignRight | Qt.AlignVCenter, value)
+            self._sparkline(p, ring, self.LABEL_W + 4, y + 2, spark_w, self.ROW - 4, color)
+            y += self.ROW
+        p.end()
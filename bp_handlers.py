@@ -0,0 +1,456 @@
+"""
+Asset-type handlers for the Batch Blueprint Creator (BPGenerator_07).
+
+A handler turns one kind of source asset into an Actor Blueprint with a
+matching component (StaticMesh -> StaticMeshComponent, NiagaraSystem ->
+NiagaraComponent, ...). Handlers are registered under the asset class paths
+they accept. generate() groups the selection by class in one pass and hands
+each group to its handler, which builds a template (factory, component class,
+option-derived settings) once and then processes the whole group with it.
+
+Options are a plain dict, as returned by BatchBlueprintCreator.get_options():
+    enable_gravity, simple_collision, generate_overlap, ccd (bools); simple_collision and
+        auto_collision's complexity are mesh settings, only reported (bp_rules.complexity_mismatch)
+    collision_preset (collision profile name)
+    scc_submit (bool): submit everything written as one change (see bp_scc)
+    auto_collision (bool): pick StaticMesh collision/physics per mesh with bp_rules
+    collision_rules: optional {package path: rules} already classified by the caller
+    layout, max_fanout: destination folder layout (see bp_layout)
+    render_rules (bool): LOD/shadow/cull/Nanite fallback per StaticMesh size class (bp_rules)
+    cast_shadow, nanite_fallback (bools), cull_distance (float, 0 = none), forced_lod, min_lod (ints, 0 = off)
+    material_overrides: optional {material slot name: material path}
+"""
+
+import time
+
+import unreal
+
+import bp_layout
+import bp_manifest
+import bp_rules
+import bp_scc
+import bp_session
+import tool_log
+
+DESTINATION_FOLDER = "/Game/GeneratedBlueprints"
+
+log = tool_log.get_logger("BPGenerator")
+
+HANDLERS = {}  # asset class path -> handler instance
+
+MISSING_SOURCE = "Source asset no longer exists."
+NO_HANDLER = "No handler for this asset type."
+STAGE_TOTALS = {}  # stage -> [count, total ms] for the whole session (sampled by bp_dashboard)
+
+
+def register_handler(*class_paths):
+    """Class decorator: register one handler instance for the given asset class paths."""
+    def decorator(cls):
+        handler = cls()
+        for path in class_paths:
+            HANDLERS[path] = handler
+        return cls
+    return decorator
+
+
+def class_path_of(asset):
+    return asset.get_class().get_path_name()
+
+
+def group_by_class(assets):
+    """Split a selection into {class path: [assets]} and a list of unsupported assets, in one pass."""
+    groups = {}
+    unsupported = []
+    for asset in assets:
+        path = class_path_of(asset)
+        handler = HANDLERS.get(path)
+        if handler is None or not handler.accepts(asset):
+            unsupported.append(asset)
+            continue
+        groups.setdefault(path, []).append(asset)
+    return groups, unsupported
+
+
+def apply_setting(obj, path, value):
+    """Set one component setting.
+
+    Prefers the component's set_<name>() function when it has one (it keeps the
+    body instance in sync); "body_instance.use_ccd" style paths read the struct,
+    set the field and write the struct back.
+    """
+    if "." in path:
+        struct_name, field = path.split(".", 1)
+        struct = obj.get_editor_property(struct_name)
+        apply_setting(struct, field, value)
+        obj.set_editor_property(struct_name, struct)
+        return
+    setter = getattr(obj, f"set_{path}", None)
+    if callable(setter) and not isinstance(obj, unreal.StructBase):
+        setter(value)
+    else:
+        obj.set_editor_property(path, value)
+
+
+# ---------------- Base Handler ---------------- #
+class AssetHandler:
+    """Creates one Actor Blueprint per asset, with a single component referencing the asset"""
+    component_class_name = "SceneComponent"
+    asset_properties = ()   # component properties that can hold the asset, first match wins
+    suffix = "_BP"
+
+    def accepts(self, asset):
+        return True
+
+    def component_settings(self, options):
+        """Editor properties applied to every component of the group (dotted paths reach into structs)."""
+        return {}
+
+    def asset_settings(self, asset, template):
+        """Per-asset overrides merged over the group settings."""
+        return {}
+
+    def make_template(self, options):
+        # Per-class setup, paid once per group; the factory and handles come from the session
+        session = bp_session.get()
+        return {
+            "factory": session.factory(unreal.Actor),
+            "component_class": getattr(unreal, self.component_class_name),
+            "settings": self.component_settings(options),
+            "options": options,
+            "timings": {},  # stage -> [count, total ms], folded into the manifest after the run
+            "failed_settings": set(),
+            "asset_tools": session.asset_tools,
+            "subsystem": session.subsystem,
+        }
+
+    def generate(self, assets, options, destination=DESTINATION_FOLDER, manifest=None, folders=None):
+        """Build Blueprints for a group of same-class assets; returns [(asset name, blueprint or None, message)].
+
+        With a manifest, each Blueprint written and the stage timings are recorded in it.
+        folders ({source path: folder}, from bp_layout) places each Blueprint; the
+        folders must already exist. Without it everything goes in destination.
+        """
+        results = []
+        for chunk in self.generate_chunks(assets, options, destination, manifest, max(1, len(assets)), folders):
+            results.extend(chunk)
+        return results
+
+    def generate_chunks(self, assets, options, destination=DESTINATION_FOLDER, manifest=None, chunk_size=25, folders=None):
+        """generate() in steps, yielding the results of each chunk_size assets; the template is still built once."""
+        template = self.make_template(options)
+        for start in range(0, len(assets), chunk_size):
+            yield self.generate_with(template, assets[start:start + chunk_size], destination, manifest, folders)
+        if manifest is not None:
+            bp_manifest.record_timings(manifest, template["timings"])
+
+    def generate_with(self, template, assets, destination=DESTINATION_FOLDER, manifest=None, folders=None):
+        """Build Blueprints for assets with an existing template; returns [(asset name, blueprint or None, message)]."""
+        folders = folders or {}
+        results = []
+        for asset in assets:
+            try:
+                folder = folders.get(asset.get_path_name(), destination)
+                bp, message = self.create_blueprint(asset, template, folder)
+            except Exception as e:
+                bp, message = None, str(e)
+            results.append((asset.get_name(), bp, message))
+            if manifest is not None and bp is not None:
+                bp_manifest.record_blueprint(
+                    manifest, bp.get_path_name(), asset.get_path_name(), class_path_of(asset), template["options"], destination
+                )
+        return results
+
+    def blueprint_path(self, asset, destination):
+        return self.blueprint_path_for(asset.get_name(), destination)
+
+    def blueprint_path_for(self, asset_name, destination):
+        bp_name = f"{asset_name}{self.suffix}"
+        return f"{destination}/{bp_name}.{bp_name}"
+
+    def create_blueprint(self, asset, template, destination):
+        timings = template["timings"]
+
+        def stage_done(stage, started):
+            ms = (time.perf_counter() - started) * 1000.0
+            for totals in (timings, STAGE_TOTALS):
+                entry = totals.setdefault(stage, [0, 0.0])
+                entry[0] += 1
+                entry[1] += ms
+            return time.perf_counter()
+
+        t = time.perf_counter()
+        bp_name = f"{asset.get_name()}{self.suffix}"
+        full_path = self.blueprint_path(asset, destination)
+        if unreal.EditorAssetLibrary.does_asset_exist(full_path):
+            bp = unreal.EditorAssetLibrary.load_asset(full_path)
+            created = False
+            t = stage_done("load", t)
+        else:
+            bp = template["asset_tools"].create_asset(bp_name, destination, unreal.Blueprint, template["factory"])
+            created = True
+            t = stage_done("create", t)
+        if not bp:
+            return None, "Failed to create Blueprint."
+
+        component = self.find_or_add_component(bp, asset, template)
+        if component is None:
+            # No bp on failure: callers treat a returned Blueprint as generated and record it
+            return None, "Failed to add component."
+        self.assign_asset(component, asset)
+        t = stage_done("component", t)
+        settings = dict(template["settings"], **self.asset_settings(asset, template))
+        for path, value in settings.items():
+            try:
+                apply_setting(component, path, value)
+            except Exception as e:
+                # Once per run per setting: a property this engine build lacks fails on every asset
+                if path not in template["failed_settings"]:
+                    template["failed_settings"].add(path)
+                    log.warning("%s: could not set %s: %s", bp_name, path, e)
+        t = stage_done("settings", t)
+
+        unreal.BlueprintEditorLibrary.compile_blueprint(bp)
+        t = stage_done("compile", t)
+        unreal.EditorAssetLibrary.save_loaded_asset(bp)
+        stage_done("save", t)
+        return bp, "Created." if created else "Updated."
+
+    def find_or_add_component(self, bp, asset, template):
+        """Reuse the Blueprint's existing component of our class, so re-runs don't stack duplicates."""
+        subsystem = template["subsystem"]
+        bfl = unreal.SubobjectDataBlueprintFunctionLibrary
+        handles = subsystem.k2_gather_subobject_data_for_blueprint(bp)
+        if not handles:
+            return None
+        for handle in handles[1:]:
+            obj = bfl.get_object(bfl.get_data(handle))
+            if isinstance(obj, template["component_class"]):
+                return obj
+        params = unreal.AddNewSubobjectParams(handles[0], template["component_class"], bp)
+        handle, fail_reason = subsystem.add_new_subobject(params)
+        if not bfl.is_handle_valid(handle):
+            log.warning("Could not add %s to %s: %s", self.component_class_name, bp.get_name(), fail_reason)
+            return None
+        subsystem.rename_subobject(handle, unreal.Text(f"{asset.get_name()}_Component"))
+        return bfl.get_object(bfl.get_data(handle))
+
+    def assign_asset(self, component, asset):
+        for prop in self.asset_properties:
+            try:
+                component.set_editor_property(prop, asset)
+                return
+            except Exception:
+                continue
+        raise RuntimeError(f"{self.component_class_name} has none of {self.asset_properties}")
+
+
+# ---------------- Handlers ---------------- #
+@register_handler("/Script/Engine.StaticMesh")
+class StaticMeshHandler(AssetHandler):
+    component_class_name = "StaticMeshComponent"
+    asset_properties = ("static_mesh",)
+
+    def component_settings(self, options):
+        simulate = options.get("enable_gravity", False) or options.get("ccd", False)
+        settings = {
+            "simulate_physics": simulate,
+            "enable_gravity": options.get("enable_gravity", False),
+            "body_instance.use_ccd": options.get("ccd", False),
+            "generate_overlap_events": options.get("generate_overlap", False),
+        }
+        if options.get("collision_preset"):
+            settings["collision_profile_name"] = unreal.Name(options["collision_preset"])
+        return settings
+
+    def asset_settings(self, asset, template):
+        options = template["options"]
+        settings = {}
+        tags = None
+        wanted = "simple_as_complex" if options.get("simple_collision") else None
+        if options.get("auto_collision"):
+            package = asset.get_outermost().get_name()
+            rules = options.get("collision_rules", {}).get(package)
+            if rules is None:
+                tags = bp_rules.read_mesh_tags(unreal.EditorAssetLibrary.find_asset_data(asset.get_path_name()))
+                rules = bp_rules.collision_rules(tags, options)
+            if rules.get("needs_simple_collision"):
+                log.warning("%s: high-poly with no simple collision, add some before simulating it.", asset.get_name())
+            settings.update(bp_rules.component_settings(rules))
+            wanted = rules["complexity"]
+        current = bp_rules.complexity_mismatch(asset, wanted) if wanted else None
+        if current:
+            # The trace flag lives on the mesh's BodySetup; a component can't override it
+            log.warning("⚠️ %s: collision complexity is %s on the mesh, %s wanted; change it on the mesh.",
+                        asset.get_name(), current, wanted)
+        if bp_rules.wants_render_rules(options):
+            if tags is None:
+                tags = bp_rules.read_mesh_tags(unreal.EditorAssetLibrary.find_asset_data(asset.get_path_name()))
+            rules = bp_rules.render_rules(tags, options)
+            settings.update(bp_rules.render_settings(rules, asset))
+        return settings
+
+
+@register_handler("/Script/Engine.SkeletalMesh")
+class SkeletalMeshHandler(AssetHandler):
+    component_class_name = "SkeletalMeshComponent"
+    asset_properties = ("skeletal_mesh_asset", "skeletal_mesh")
+
+    def component_settings(self, options):
+        settings = {"generate_overlap_events": options.get("generate_overlap", False)}
+        if options.get("collision_preset"):
+            settings["collision_profile_name"] = unreal.Name(options["collision_preset"])
+        return settings
+
+
+@register_handler("/Script/Niagara.NiagaraSystem")
+class NiagaraSystemHandler(AssetHandler):
+    component_class_name = "NiagaraComponent"
+    asset_properties = ("asset",)
+
+
+@register_handler("/Script/Engine.SoundCue", "/Script/Engine.SoundWave")
+class SoundHandler(AssetHandler):
+    component_class_name = "AudioComponent"
+    asset_properties = ("sound",)
+
+
+@register_handler("/Script/Engine.Material", "/Script/Engine.MaterialInstanceConstant")
+class DecalMaterialHandler(AssetHandler):
+    component_class_name = "DecalComponent"
+    asset_properties = ("decal_material",)
+
+    def accepts(self, asset):
+        # Only deferred-decal materials make sense on a DecalComponent
+        try:
+            base = asset.get_base_material()
+            return base.get_editor_property("material_domain") == unreal.MaterialDomain.MD_DEFERRED_DECAL
+        except Exception:
+            return False
+
+
+# ---------------- Entry Points ---------------- #
+def generate(assets, options, destination=DESTINATION_FOLDER):
+    """Group the selection by class and run each group through its handler in a batch."""
+    for _, _, results, unsupported in generate_chunks(assets, options, destination, chunk_size=max(1, len(assets))):
+        pass
+    return results, unsupported
+
+
+def generate_chunks(assets, options, destination=DESTINATION_FOLDER, chunk_size=25):
+    """generate() in steps: yields (done, total, results so far, unsupported) once up front and after every chunk.
+
+    Lets a caller spread a run over editor ticks; iterate it to the end, the
+    manifest and source control batch are finished after the last chunk.
+    """
+    groups, unsupported = group_by_class(assets)
+    for asset in unsupported:
+        log.warning("Skipping %s (%s has no handler).", asset.get_name(), asset.get_class().get_name())
+    manifest = bp_manifest.load_manifest()
+    sources = [a.get_path_name() for group in groups.values() for a in group]
+    folders = bp_layout.assign(
+        sources, destination, options, bp_manifest.generated_under(manifest, destination),
+        bp_manifest.recorded_folders(manifest, sources, destination),
+    )
+    made = bp_layout.ensure_folders(folders.values(), destination)
+    if made:
+        log.info("Created %d destination folders.", made)
+    targets = [HANDLERS[c].blueprint_path(a, folders[a.get_path_name()]) for c, group in groups.items() for a in group]
+    results = []
+    yield 0, len(targets), results, unsupported
+    # Source control status, checkout and add are done once for the whole run
+    with bp_scc.SourceControlBatch(targets, destination, submit=options.get("scc_submit", False)):
+        for class_path, group in groups.items():
+            log.info("%s: generating %d Blueprints...", class_path, len(group))
+            for chunk in HANDLERS[class_path].generate_chunks(group, options, destination, manifest, chunk_size, folders):
+                results.extend(chunk)
+                yield len(results), len(targets), results, unsupported
+    bp_manifest.save_manifest(manifest)
+
+
+def _registry_class(source):
+    """Asset class path of a source object path from the registry (nothing loaded), or None if it doesn't exist."""
+    asset_data = unreal.EditorAssetLibrary.find_asset_data(source)
+    if asset_data is None or not asset_data.is_valid():
+        return None
+    return f"{asset_data.asset_class_path.package_name}.{asset_data.asset_class_path.asset_name}"
+
+
+def generate_sources(sources, options, destination=DESTINATION_FOLDER, chunk_size=25, scc=None):
+    """generate_chunks() from source object paths, for the background queue.
+
+    Yields (done, total, outcomes) once up front and after every chunk, where
+    outcomes are the [(source path, blueprint or None, message)] decided since
+    the last yield, so results are attributed by path, never by asset name.
+    Sources are grouped by class from the registry and each chunk's assets are
+    only loaded right before that chunk is generated. scc is an open
+    bp_scc.SourceControlBatch to add this run to (one per queued job); the
+    caller finishes it. Without one the run gets its own batch.
+    """
+    outcomes = []
+    groups = {}
+    for source in sources:
+        class_path = _registry_class(source)
+        if class_path is None:
+            outcomes.append((source, None, MISSING_SOURCE))
+        elif class_path not in HANDLERS:
+            outcomes.append((source, None, NO_HANDLER))
+        else:
+            groups.setdefault(class_path, []).append(source)
+    manifest = bp_manifest.load_manifest()
+    # Sources generated before (refreshes, re-runs) go back to the folder their Blueprint is in,
+    # executed plans to the folder the plan showed
+    generating = [s for group in groups.values() for s in group]
+    recorded = bp_manifest.recorded_folders(manifest, generating, destination)
+    planned = options.get("folders", {})
+    recorded.update((s, planned[s]) for s in generating if s in planned)
+    folders = bp_layout.assign(
+        generating, destination, options, bp_manifest.generated_under(manifest, destination), recorded,
+    )
+    made = bp_layout.ensure_folders(folders.values(), destination)
+    if made:
+        log.info("Created %d destination folders.", made)
+    targets = [HANDLERS[c].blueprint_path_for(s.rsplit(".", 1)[-1], folders[s]) for c, group in groups.items() for s in group]
+    done = len(outcomes)
+    yield done, len(sources), outcomes
+
+    owned = scc is None
+    if owned:
+        scc = bp_scc.SourceControlBatch([], destination, submit=options.get("scc_submit", False))
+    scc.add(targets)
+    ok = False
+    try:
+        for class_path, group in groups.items():
+            handler = HANDLERS[class_path]
+            template = handler.make_template(options)
+            for start in range(0, len(group), chunk_size):
+                outcomes = []
+                loaded = []
+                for source in group[start:start + chunk_size]:
+                    asset = unreal.EditorAssetLibrary.load_asset(source)
+                    if asset is None:
+                        outcomes.append((source, None, MISSING_SOURCE))
+                    elif not handler.accepts(asset):
+                        outcomes.append((source, None, NO_HANDLER))
+                    else:
+                        loaded.append((source, asset))
+                results = handler.generate_with(template, [asset for _, asset in loaded], destination, manifest, folders)
+                outcomes.extend((source, bp, message) for (source, _), (_, bp, message) in zip(loaded, results))
+                done += len(outcomes)
+                yield done, len(sources), outcomes
+            bp_manifest.record_timings(manifest, template["timings"])
+        ok = True
+    finally:
+        if owned:
+            scc.finish(ok)
+    bp_manifest.save_manifest(manifest)
+
+
+def plan(asset_datas, options, destination=DESTINATION_FOLDER, invalid=None):
+    """Dry run: what generate() would do for these AssetData, without loading or creating anything."""
+    sources = [f"{ad.package_name}.{ad.asset_name}" for ad in asset_datas]
+    manifest = bp_manifest.load_manifest()
+    folders = bp_layout.assign(
+        sources, destination, options, bp_manifest.generated_under(manifest, destination),
+        bp_manifest.recorded_folders(manifest, sources, destination),
+    )
+    return bp_manifest.build_plan(asset_datas, options, destination, HANDLERS, manifest, invalid, folders)
@@ -0,0 +1,246 @@
+"""
+Level actor harvesting for the Batch Blueprint Creator.
+
+Takes the selected (or all) StaticMeshActors in the level, clusters nearby
+actors with a spatial hash, and turns each cluster into a generated
+Blueprint. Clusters with the same layout (same meshes, override materials
+and relative transforms) share one Blueprint. Layouts are compared with
+rounded transforms, but each Blueprint is built from the exact transforms
+and materials of one of its clusters, and the Blueprint actors are spawned
+at each cluster's exact pivot. The originals are replaced by Blueprint
+actors inside a single editor transaction, so one undo restores them.
+New Blueprints are saved through one bp_scc.SourceControlBatch and recorded
+in the manifest with the meshes they hold, like consolidated output.
+
+Actors are narrowed with EditorFilterLibrary (class / name filters run in
+C++ over the whole list). The mesh and transform of each surviving actor
+still have to be read one actor at a time: the Python API has no bulk
+property query for actors, so read_records() only makes sure each actor is
+read once.
+
+preview() clusters without creating or replacing anything, so a caller can
+show what a harvest would do before running it.
+"""
+
+import math
+
+import unreal
+
+import bp_handlers
+import bp_manifest
+import bp_scc
+import bp_session
+import tool_log
+
+CLUSTER_RADIUS = 500.0   # world units; actors closer than this end up in the same cluster
+MIN_CLUSTER_SIZE = 2
+
+log = tool_log.get_logger("BPGenerator")
+
+
+# ---------------- Collection ---------------- #
+def collect_actors(selected_only=True, name_filter=""):
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    actors = actor_subsystem.get_selected_level_actors() if selected_only else actor_subsystem.get_all_level_actors()
+    actors = unreal.EditorFilterLibrary.by_class(actors, unreal.StaticMeshActor)
+    if name_filter:
+        actors = unreal.EditorFilterLibrary.by_id_name(actors, name_filter)
+    return actors
+
+
+def _override_materials(component):
+    """Override material paths per slot (None = the mesh's own), without trailing empty slots."""
+    materials = [m.get_path_name() if m else None for m in component.get_editor_property("override_materials") or ()]
+    while materials and materials[-1] is None:
+        materials.pop()
+    return tuple(materials)
+
+
+def read_records(actors):
+    """(actor, mesh, location, rotator, scale, override materials) per actor; one mesh + transform read each."""
+    records = []
+    for actor in actors:
+        component = actor.static_mesh_component
+        mesh = component.static_mesh
+        if mesh is None:
+            continue
+        t = actor.get_actor_transform()
+        loc, rot, scale = t.translation, t.rotation.rotator(), t.scale3d
+        records.append((
+            actor, mesh, (loc.x, loc.y, loc.z), (rot.roll, rot.pitch, rot.yaw), (scale.x, scale.y, scale.z),
+            _override_materials(component),
+        ))
+    return records
+
+
+# ---------------- Clustering ---------------- #
+def cluster_records(records, radius=CLUSTER_RADIUS, min_size=MIN_CLUSTER_SIZE):
+    """Group record indices whose actors are within radius of each other (spatial hash + union-find)."""
+    parent = list(range(len(records)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    grid = {}
+    for i, record in enumerate(records):
+        x, y, z = record[2]
+        grid.setdefault((math.floor(x / radius), math.floor(y / radius), math.floor(z / radius)), []).append(i)
+
+    radius_sq = radius * radius
+    for (cx, cy, cz), members in grid.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    neighbours = grid.get((cx + dx, cy + dy, cz + dz))
+                    if not neighbours:
+                        continue
+                    for i in members:
+                        xi, yi, zi = records[i][2]
+                        for j in neighbours:
+                            if j <= i:
+                                continue
+                            xj, yj, zj = records[j][2]
+                            if (xi - xj) ** 2 + (yi - yj) ** 2 + (zi - zj) ** 2 <= radius_sq:
+                                ri, rj = find(i), find(j)
+                                if ri != rj:
+                                    parent[rj] = ri
+
+    clusters = {}
+    for i in range(len(records)):
+        clusters.setdefault(find(i), []).append(i)
+    return [members for members in clusters.values() if len(members) >= min_size]
+
+
+def cluster_parts(records, members):
+    """(pivot, parts): the cluster centre and each member's exact (mesh, relative location, rotator, scale, materials)."""
+    n = float(len(members))
+    pivot = tuple(sum(records[i][2][axis] for i in members) / n for axis in range(3))
+    parts = []
+    for i in members:
+        _, mesh, loc, rot, scale, materials = records[i]
+        parts.append((mesh.get_path_name(), tuple(loc[axis] - pivot[axis] for axis in range(3)), rot, scale, materials))
+    return pivot, parts
+
+
+def cluster_layout(records, members):
+    """(pivot, signature): the parts rounded and sorted, so equal layouts compare equal. Only for grouping."""
+    pivot, parts = cluster_parts(records, members)
+    signature = tuple(sorted(
+        (mesh, tuple(round(v) for v in loc), tuple(round(r) % 360 for r in rot), tuple(round(s, 2) for s in scale), materials)
+        for mesh, loc, rot, scale, materials in parts
+    ))
+    return pivot, signature
+
+
+# ---------------- Blueprint + replacement ---------------- #
+def _build_blueprint(parts, destination, bp_name, session):
+    """Blueprint with one StaticMeshComponent per part, at the part's exact transform and with its materials."""
+    subsystem = session.subsystem
+    bp = session.asset_tools.create_asset(bp_name, destination, unreal.Blueprint, session.factory(unreal.Actor))
+    if not bp:
+        return None
+    bfl = unreal.SubobjectDataBlueprintFunctionLibrary
+    root_handle = subsystem.k2_gather_subobject_data_for_blueprint(bp)[0]
+    for mesh_path, loc, rot, scale, materials in parts:
+        handle, _ = subsystem.add_new_subobject(unreal.AddNewSubobjectParams(root_handle, unreal.StaticMeshComponent, bp))
+        if not bfl.is_handle_valid(handle):
+            continue
+        comp = bfl.get_object(bfl.get_data(handle))
+        comp.set_editor_property("static_mesh", unreal.load_asset(mesh_path))
+        comp.set_editor_property("relative_location", unreal.Vector(*loc))
+        comp.set_editor_property("relative_rotation", unreal.Rotator(roll=rot[0], pitch=rot[1], yaw=rot[2]))
+        comp.set_editor_property("relative_scale3d", unreal.Vector(*scale))
+        if materials:
+            comp.set_editor_property("override_materials", [unreal.load_asset(m) if m else None for m in materials])
+    unreal.BlueprintEditorLibrary.compile_blueprint(bp)
+    unreal.EditorAssetLibrary.save_loaded_asset(bp)
+    return bp
+
+
+def _blueprint_names(signatures, destination, asset_tools):
+    """A unique Blueprint name per signature, decided up front so source control can be batched."""
+    names, taken = [], set()
+    for signature in signatures:
+        first_mesh = signature[0][0].rsplit(".", 1)[-1]
+        base, n = f"Harvest_{first_mesh}_BP", 0
+        _, bp_name = asset_tools.create_unique_asset_name(f"{destination}/{base}", "")
+        # Nothing is created until every name is picked, so names picked in this run can still repeat
+        while bp_name in taken:
+            n += 1
+            _, bp_name = asset_tools.create_unique_asset_name(f"{destination}/Harvest_{first_mesh}_{n}_BP", "")
+        taken.add(bp_name)
+        names.append(bp_name)
+    return names
+
+
+def _patterns(records, clusters):
+    patterns = {}  # signature -> [(exact pivot, members)]
+    for members in clusters:
+        pivot, signature = cluster_layout(records, members)
+        patterns.setdefault(signature, []).append((pivot, members))
+    return patterns
+
+
+def preview(selected_only=True, name_filter="", radius=CLUSTER_RADIUS, min_size=MIN_CLUSTER_SIZE):
+    """What harvest() would do, without creating or replacing anything."""
+    records = read_records(collect_actors(selected_only, name_filter))
+    clusters = cluster_records(records, radius, min_size)
+    return {
+        "actors_scanned": len(records),
+        "clusters": len(clusters),
+        "blueprints": len(_patterns(records, clusters)),
+        "actors_to_replace": sum(len(members) for members in clusters),
+    }
+
+
+def harvest(selected_only=True, name_filter="", radius=CLUSTER_RADIUS, min_size=MIN_CLUSTER_SIZE,
+            destination=bp_handlers.DESTINATION_FOLDER, replace=True, scc_submit=False):
+    """Convert clusters of level actors into Blueprints; returns a report dict."""
+    records = read_records(collect_actors(selected_only, name_filter))
+    clusters = cluster_records(records, radius, min_size)
+    patterns = _patterns(records, clusters)
+
+    session = bp_session.get()
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    names = _blueprint_names(patterns, destination, session.asset_tools)
+    targets = [f"{destination}/{name}.{name}" for name in names]
+    manifest = bp_manifest.load_manifest()
+    replaced = spawned = 0
+
+    with bp_scc.SourceControlBatch(targets, destination, submit=scc_submit):
+        with unreal.ScopedEditorTransaction("Harvest actors to Blueprints"):
+            for bp_name, (signature, placements) in zip(names, patterns.items()):
+                # Built from one cluster's exact transforms; the signature is rounded and only groups them
+                _, parts = cluster_parts(records, placements[0][1])
+                bp = _build_blueprint(parts, destination, bp_name, session)
+                if bp is None:
+                    log.warning("Could not create Blueprint for cluster pattern starting with %s", signature[0][0])
+                    continue
+                meshes = sorted({part[0] for part in parts})
+                bp_manifest.record_consolidated(manifest, bp.get_path_name(), meshes, {"output_mode": "harvest"}, destination)
+                if not replace:
+                    continue
+                originals = []
+                for pivot, members in placements:
+                    if actor_subsystem.spawn_actor_from_object(bp, unreal.Vector(*pivot)):
+                        spawned += 1
+                        originals.extend(records[i][0] for i in members)
+                actor_subsystem.destroy_actors(originals)
+                replaced += len(originals)
+    bp_manifest.save_manifest(manifest)
+
+    report = {
+        "actors_scanned": len(records),
+        "clusters": len(clusters),
+        "blueprints": len(patterns),
+        "actors_replaced": replaced,
+        "actors_spawned": spawned,
+    }
+    log.info(
+        "Harvested %d actors: %d clusters, %d Blueprints, %d actors replaced by %d",
+        len(records), len(clusters), len(patterns), replaced, spawned,
+    )
+    return report
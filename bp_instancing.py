@@ -0,0 +1,139 @@
+"""
+Instanced-mesh consolidation mode for the Batch Blueprint Creator.
+
+Instead of one Actor Blueprint per mesh, consolidate() builds a single
+Blueprint holding one InstancedStaticMeshComponent (or Hierarchical ISM) per
+unique mesh. Optionally the instances are filled in from StaticMeshActors
+already placed in the level that use those meshes, positioned relative to
+their common centre.
+
+The returned report compares actor count and estimated draw calls (one per
+material section per placed mesh vs. one per section per instanced component);
+meshes with no placed actors count as none before. The Blueprint is saved
+through a bp_scc.SourceControlBatch and recorded in the manifest with every
+mesh it holds, like per-asset output.
+"""
+
+import unreal
+
+import bp_handlers
+import bp_manifest
+import bp_scc
+import bp_session
+import tool_log
+
+log = tool_log.get_logger("BPGenerator")
+
+
+def _num_sections(mesh):
+    try:
+        return max(1, len(mesh.get_editor_property("static_materials")))
+    except Exception:
+        return 1
+
+
+def gather_level_instances(meshes):
+    """{mesh path: [actor transforms]} for placed StaticMeshActors using one of meshes."""
+    wanted = {m.get_path_name() for m in meshes}
+    actors = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors()
+    found = {}
+    for actor in unreal.EditorFilterLibrary.by_class(actors, unreal.StaticMeshActor):
+        mesh = actor.static_mesh_component.static_mesh
+        if mesh is None:
+            continue
+        path = mesh.get_path_name()
+        if path in wanted:
+            found.setdefault(path, []).append(actor.get_actor_transform())
+    return found
+
+
+def _pivot(transforms):
+    if not transforms:
+        return unreal.Vector(0, 0, 0)
+    x = y = z = 0.0
+    for t in transforms:
+        loc = t.translation
+        x += loc.x
+        y += loc.y
+        z += loc.z
+    n = float(len(transforms))
+    return unreal.Vector(x / n, y / n, z / n)
+
+
+def consolidate(meshes, options, destination=bp_handlers.DESTINATION_FOLDER, name="Consolidated_BP",
+                hierarchical=False, from_level=False):
+    """Build one Blueprint with an (H)ISM component per unique mesh; returns (blueprint, report)."""
+    if options.get("plan_only"):
+        return None, {"error": "Instanced output can't be planned; untick plan only to consolidate."}
+    unique = {}
+    for mesh in meshes:
+        if isinstance(mesh, unreal.StaticMesh):
+            unique.setdefault(mesh.get_path_name(), mesh)
+    if not unique:
+        return None, {"error": "No static meshes to consolidate."}
+
+    instances = gather_level_instances(unique.values()) if from_level else {}
+    pivot = _pivot([t for ts in instances.values() for t in ts])
+
+    session = bp_session.get()
+    _, bp_name = session.asset_tools.create_unique_asset_name(f"{destination}/{name}", "")
+    target = f"{destination}/{bp_name}.{bp_name}"
+    with bp_scc.SourceControlBatch([target], destination, submit=options.get("scc_submit", False)):
+        bp = session.asset_tools.create_asset(bp_name, destination, unreal.Blueprint, session.factory(unreal.Actor))
+        if not bp:
+            return None, {"error": f"Failed to create {bp_name}."}
+        report = _fill(bp, bp_name, unique, instances, pivot, options, session, hierarchical)
+        unreal.BlueprintEditorLibrary.compile_blueprint(bp)
+        unreal.EditorAssetLibrary.save_loaded_asset(bp)
+
+    manifest = bp_manifest.load_manifest()
+    bp_manifest.record_consolidated(manifest, bp.get_path_name(), list(unique), options, destination)
+    bp_manifest.save_manifest(manifest)
+
+    report = dict(report, blueprint=bp.get_path_name(), unique_meshes=len(unique), actors_after=1)
+    log.info(
+        "Consolidated %d meshes into %s: actors %d -> 1, estimated draw calls %d -> %d",
+        len(unique), bp_name, report["actors_before"], report["draw_calls_before"], report["draw_calls_after"],
+    )
+    return bp, report
+
+
+def _fill(bp, bp_name, unique, instances, pivot, options, session, hierarchical):
+    """Add the (H)ISM components and instances; returns the before/after counts."""
+    component_class = unreal.HierarchicalInstancedStaticMeshComponent if hierarchical else unreal.InstancedStaticMeshComponent
+    settings = bp_handlers.HANDLERS["/Script/Engine.StaticMesh"].component_settings(options)
+    subsystem = session.subsystem
+    bfl = unreal.SubobjectDataBlueprintFunctionLibrary
+    root_handle = subsystem.k2_gather_subobject_data_for_blueprint(bp)[0]
+
+    draws_before = actors_before = instance_total = draws_after = 0
+    for path, mesh in unique.items():
+        handle, fail_reason = subsystem.add_new_subobject(unreal.AddNewSubobjectParams(root_handle, component_class, bp))
+        if not bfl.is_handle_valid(handle):
+            log.warning("Could not add instanced component for %s: %s", mesh.get_name(), fail_reason)
+            continue
+        subsystem.rename_subobject(handle, unreal.Text(f"{mesh.get_name()}_Instances"))
+        ism = bfl.get_object(bfl.get_data(handle))
+        ism.set_editor_property("static_mesh", mesh)
+        for key, value in settings.items():
+            try:
+                bp_handlers.apply_setting(ism, key, value)
+            except Exception as e:
+                log.warning("%s: could not set %s: %s", bp_name, key, e)
+
+        placed = instances.get(path, [])
+        for t in placed:
+            ism.add_instance(unreal.Transform(t.translation - pivot, t.rotation.rotator(), t.scale3d))
+
+        sections = _num_sections(mesh)
+        actors_before += len(placed)
+        draws_before += len(placed) * sections
+        instance_total += len(placed)
+        draws_after += sections
+
+    return {
+        "instances": instance_total,
+        "actors_before": actors_before,
+        "draw_calls_before": draws_before,
+        "draw_calls_after": draws_after,
+    }
@@ -0,0 +1,127 @@
+"""
+Destination folder layouts for generated Blueprints.
+
+Options (same dict as the rest of the generator):
+    layout      "flat"   - everything in the destination root (the old behaviour)
+                "mirror" - mirror the source package folders under the root
+                "hash"   - hash-prefix buckets under the root
+    max_fanout  most entries wanted per folder (default MAX_FANOUT, at least 16)
+
+Buckets are named by the leading hex characters of a hash of the asset name.
+hash_shape() uses as many characters as it takes for the leaves to be about
+half full on average (so hash skew stays under the cap), split over as few
+levels as keep every level under the cap. With "hash" the count is every
+Blueprint under the root, including the ones being added: 20k assets at 500
+is one level of 256 folders, at 16 it is three levels of 16, at 10000 it is
+one level of 16. With "mirror", a source folder holding more than max_fanout
+assets is split the same way into b-prefixed buckets (/Props/bab).
+
+The bucket of an asset depends only on its name and the shape, and the shape
+only changes when a count crosses a capacity step (a factor of 16), so assets
+don't move between buckets as folders grow. Sources generated before stay
+where the manifest recorded their Blueprint (recorded), so a regenerated or
+refreshed Blueprint is updated in place even after a layout change.
+
+assign() maps sources to folders and ensure_folders() creates every missing
+folder in one pre-pass (one registry listing of the root, then one
+make_directory per missing folder), so nothing is checked per asset.
+"""
+
+import hashlib
+
+import unreal
+
+MAX_FANOUT = 500
+MIN_FANOUT = 16  # one hex character per level
+LAYOUTS = ("flat", "mirror", "hash")
+
+
+def _digest(name):
+    return hashlib.sha1(name.lower().encode("utf-8")).hexdigest()
+
+
+def _split(source):
+    """'/Game/Props/SM_Rock.SM_Rock' -> ('/Game/Props', 'SM_Rock')"""
+    package = source.split(".", 1)[0]
+    folder, _, name = package.rpartition("/")
+    return folder, name
+
+
+def _mirror_relative(folder):
+    parts = folder.strip("/").split("/")
+    if parts and parts[0] == "Game":
+        parts = parts[1:]
+    return "/".join(parts)
+
+
+def _folder_sizes(folders):
+    """Asset count per source folder (not recursive), one registry query per folder."""
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    return {folder: len(registry.get_assets_by_path(folder, recursive=False)) for folder in folders}
+
+
+def hash_shape(count, max_fanout):
+    """Hex characters per bucket level, so count assets average at most half of max_fanout per leaf."""
+    total = 1  # hex characters needed across all levels
+    while 16 ** total * max_fanout < 2 * count:
+        total += 1
+    per_level = 1  # most characters one level can use and stay under the cap
+    while 16 ** (per_level + 1) <= max_fanout:
+        per_level += 1
+    levels = -(-total // per_level)
+    return tuple(total // levels + (1 if i < total % levels else 0) for i in range(levels))
+
+
+def _buckets(name, shape, prefix=""):
+    digest = _digest(name)
+    parts, start = [], 0
+    for chars in shape:
+        parts.append(prefix + digest[start:start + chars])
+        start += chars
+    return "/".join(parts)
+
+
+def assign(sources, root, options, existing=0, recorded=None):
+    """{source object path: destination folder} for the configured layout.
+
+    existing is how many Blueprints are already under root (sizes the hash
+    layout). recorded ({source: folder}, bp_manifest.recorded_folders) keeps
+    sources generated before in the folder their Blueprint is in.
+    """
+    folders = dict(recorded or {})
+    sources = [source for source in sources if source not in folders]
+    layout = options.get("layout", "flat")
+    max_fanout = max(MIN_FANOUT, int(options.get("max_fanout", MAX_FANOUT)))
+    if layout == "flat":
+        folders.update((source, root) for source in sources)
+        return folders
+
+    if layout == "hash":
+        shape = hash_shape(existing + len(sources), max_fanout)
+        folders.update((source, f"{root}/{_buckets(_split(source)[1], shape)}") for source in sources)
+        return folders
+
+    # mirror
+    split = {source: _split(source) for source in sources}
+    sizes = _folder_sizes({folder for folder, _ in split.values()})
+    for source, (folder, name) in split.items():
+        relative = _mirror_relative(folder)
+        target = f"{root}/{relative}" if relative else root
+        if sizes.get(folder, 0) > max_fanout:
+            target += "/" + _buckets(name, hash_shape(sizes[folder], max_fanout), "b")
+        folders[source] = target
+    return folders
+
+
+def ensure_folders(folders, root):
+    """Create the missing folders among folders in one pass; returns how many were made."""
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    existing = {str(path) for path in registry.get_sub_paths(root, True) or []}
+    existing.add(root)
+    made = 0
+    for folder in sorted(set(folders)):
+        if folder not in existing:
+            unreal.EditorAssetLibrary.make_directory(folder)
+            existing.add(folder)
+            made += 1
+    return made
@@ -0,0 +1,258 @@
+"""
+Generation manifest and dry-run plans for the Batch Blueprint Creator.
+
+The manifest (Saved/BlueprintGenerator/manifest.json) remembers every
+Blueprint the generator wrote: its source asset, asset class and the hash of
+the options it was built with. It also keeps running per-stage timings
+(create, load, component, settings, compile, save) so plans can estimate how
+long a run will take.
+
+It also keeps the reverse index, source object path -> generated Blueprints
+("sources"), so a changed source maps straight to the Blueprints built from
+it (see bp_refresh), and the options behind each options hash ("options"),
+so those Blueprints can be rebuilt the way they were made. Consolidated
+(instanced) and harvested Blueprints are recorded with every mesh they hold
+("sources") and their output mode, and indexed under each of those meshes.
+
+build_plan() works from AssetData and the manifest only - nothing is loaded or
+created. Each row says what will happen to one source asset:
+    create  - no Blueprint yet
+    update  - Blueprint exists but was built with other options (or not by us)
+    skip    - up to date, invalid source, or no handler for the asset class
+The plan is plain JSON; bp_handlers.plan() builds one against the handler
+registry and bp_queue.enqueue_plan() queues its create/update rows as-is,
+each with the folder the plan put it in.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import unreal
+
+# Rough per-stage costs (ms) used until the manifest has real timings
+DEFAULT_STAGE_MS = {"create": 40.0, "load": 15.0, "component": 10.0, "settings": 2.0, "compile": 60.0, "save": 30.0}
+ACTION_STAGES = {
+    "create": ("create", "component", "settings", "compile", "save"),
+    "update": ("load", "component", "settings", "compile", "save"),
+    "skip": (),
+}
+
+# Keys that don't change what gets written into a per-asset Blueprint
+_UNHASHED_OPTIONS = ("collision_rules", "output_mode", "instances_from_level", "plan_only", "scc_submit", "folders")
+
+
+# ---------------- Manifest ---------------- #
+def data_dir():
+    return os.path.join(unreal.Paths.project_saved_dir(), "BlueprintGenerator")
+
+
+def manifest_path():
+    return os.path.join(data_dir(), "manifest.json")
+
+
+def load_manifest(path=None):
+    path = path or manifest_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("blueprints", {})  # bp object path -> {source, class, options, generated}
+    manifest.setdefault("timings", {})     # stage -> [count, total ms]
+    manifest.setdefault("options", {})     # options hash -> options
+    if "sources" not in manifest:          # source path -> [bp object paths]
+        rebuild_index(manifest)
+    return manifest
+
+
+def save_manifest(manifest, path=None):
+    path = path or manifest_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def options_hash(options):
+    relevant = {k: v for k, v in options.items() if k not in _UNHASHED_OPTIONS}
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def record_blueprint(manifest, bp_path, source_path, class_path, options, destination=None):
+    previous = manifest["blueprints"].get(bp_path)
+    if previous:
+        for old in entry_sources(previous):
+            if old != source_path:
+                _unindex(manifest, old, bp_path)
+    digest = options_hash(options)
+    manifest["options"].setdefault(digest, {k: v for k, v in options.items() if k not in _UNHASHED_OPTIONS})
+    manifest["blueprints"][bp_path] = {
+        "source": source_path,
+        "class": class_path,
+        "options": digest,
+        "destination": destination,
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    bps = manifest["sources"].setdefault(source_path, [])
+    if bp_path not in bps:
+        bps.append(bp_path)
+
+
+def record_consolidated(manifest, bp_path, source_paths, options, destination=None):
+    """Record one Blueprint built from several meshes (bp_instancing.consolidate, bp_harvest.harvest)."""
+    source_paths = sorted(source_paths)
+    forget_blueprint(manifest, bp_path)
+    record_blueprint(manifest, bp_path, source_paths[0], "/Script/Engine.StaticMesh", options, destination)
+    entry = manifest["blueprints"][bp_path]
+    entry["sources"] = source_paths
+    entry["output"] = options.get("output_mode", "ism")
+    for source in source_paths[1:]:
+        bps = manifest["sources"].setdefault(source, [])
+        if bp_path not in bps:
+            bps.append(bp_path)
+
+
+def entry_sources(entry):
+    """Every source a manifest entry was built from (several for consolidated Blueprints)."""
+    return entry.get("sources") or [entry["source"]]
+
+
+def forget_blueprint(manifest, bp_path):
+    entry = manifest["blueprints"].pop(bp_path, None)
+    if entry:
+        for source in entry_sources(entry):
+            _unindex(manifest, source, bp_path)
+
+
+def _unindex(manifest, source_path, bp_path):
+    bps = manifest["sources"].get(source_path, [])
+    if bp_path in bps:
+        bps.remove(bp_path)
+    if not bps:
+        manifest["sources"].pop(source_path, None)
+
+
+def rebuild_index(manifest):
+    """Derive the source -> Blueprints index from the blueprint entries (manifests written before it existed)."""
+    manifest["sources"] = {}
+    for bp_path, entry in manifest["blueprints"].items():
+        for source in entry_sources(entry):
+            manifest["sources"].setdefault(source, []).append(bp_path)
+
+
+def generated_under(manifest, destination):
+    """How many per-asset Blueprints the manifest has under destination (sizes bp_layout's hash layout)."""
+    return sum(1 for entry in manifest["blueprints"].values() if entry.get("destination") == destination and not entry.get("output"))
+
+
+def recorded_folders(manifest, sources, destination):
+    """{source: folder} where per-asset Blueprints of sources were already generated under destination."""
+    folders = {}
+    for source in sources:
+        for bp_path in manifest["sources"].get(source, ()):
+            entry = manifest["blueprints"][bp_path]
+            if entry["source"] == source and entry.get("destination") == destination and not entry.get("output"):
+                folders[source] = bp_path.rsplit("/", 1)[0]
+    return folders
+
+
+def dependents(manifest, source_path):
+    """Blueprints the manifest says were generated from source_path."""
+    return list(manifest["sources"].get(source_path, ()))
+
+
+def record_timings(manifest, timings):
+    """Fold {stage: [count, total ms]} from a run into the running totals."""
+    for stage, (count, total) in timings.items():
+        entry = manifest["timings"].setdefault(stage, [0, 0.0])
+        entry[0] += count
+        entry[1] += total
+
+
+def stage_ms(manifest, stage):
+    count, total = manifest["timings"].get(stage, (0, 0.0))
+    return total / count if count else DEFAULT_STAGE_MS.get(stage, 0.0)
+
+
+# ---------------- Plans ---------------- #
+def _class_path(asset_data):
+    return f"{asset_data.asset_class_path.package_name}.{asset_data.asset_class_path.asset_name}"
+
+
+def build_plan(asset_datas, options, destination, handlers, manifest=None, invalid=None, folders=None):
+    """Plan a per-asset run from registry data and the manifest, without loading or creating anything.
+
+    handlers maps asset class paths to handlers (bp_handlers.HANDLERS); invalid
+    maps object paths to validation problems (bp_validate.validate), those rows are skipped;
+    folders maps object paths to their destination folder (bp_layout.assign).
+    """
+    invalid = invalid or {}
+    folders = folders or {}
+    manifest = manifest if manifest is not None else load_manifest()
+    digest = options_hash(options)
+    stage_cost = {stage: stage_ms(manifest, stage) for stage in DEFAULT_STAGE_MS}
+
+    rows = []
+    counts = {"create": 0, "update": 0, "skip": 0}
+    total_ms = 0.0
+    for ad in asset_datas:
+        class_path = _class_path(ad)
+        source = f"{ad.package_name}.{ad.asset_name}"
+        handler = handlers.get(class_path)
+        if handler is None:
+            row = {"source": source, "class": class_path, "action": "skip", "reason": "no handler"}
+        elif source in invalid:
+            row = {"source": source, "class": class_path, "action": "skip", "reason": "invalid: " + ", ".join(invalid[source])}
+        else:
+            bp_name = f"{ad.asset_name}{handler.suffix}"
+            bp_path = f"{folders.get(source, destination)}/{bp_name}.{bp_name}"
+            entry = manifest["blueprints"].get(bp_path)
+            if not unreal.EditorAssetLibrary.does_asset_exist(bp_path):
+                action, reason = "create", ""
+            elif entry and entry["source"] == source and entry["options"] == digest:
+                action, reason = "skip", "up to date"
+            else:
+                action, reason = "update", "options changed" if entry else "not in manifest"
+            row = {"source": source, "class": class_path, "bp": bp_path, "action": action, "reason": reason}
+        row["est_ms"] = round(sum(stage_cost[s] for s in ACTION_STAGES[row["action"]]), 1)
+        counts[row["action"]] += 1
+        total_ms += row["est_ms"]
+        rows.append(row)
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "destination": destination,
+        "options": {k: v for k, v in options.items() if k != "plan_only"},
+        "options_hash": digest,
+        "rows": rows,
+        "counts": counts,
+        "estimate_s": round(total_ms / 1000.0, 1),
+    }
+
+
+def write_plan(plan, path=None):
+    """Write a plan as JSON (one row per line, so it diffs and greps like a table); returns the path."""
+    path = path or os.path.join(data_dir(), "plans", time.strftime("plan_%Y%m%d_%H%M%S.json"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    header = {k: v for k, v in plan.items() if k != "rows"}
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"header":' + json.dumps(header, separators=(",", ":")) + ',"rows":[\n')
+        f.write(",\n".join(json.dumps(row, separators=(",", ":")) for row in plan["rows"]))
+        f.write("\n]}\n")
+    return path
+
+
+def read_plan(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    plan = dict(data["header"])
+    plan["rows"] = data["rows"]
+    return plan
+
+
+def summarize(plan):
+    c = plan["counts"]
+    return f"{c['create']} create, {c['update']} update, {c['skip']} skip, ~{plan['estimate_s']}s estimated"
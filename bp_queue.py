@@ -0,0 +1,328 @@
+"""
+Persistent generation queue for the Batch Blueprint Creator.
+
+Every Generate click, remote job or watch-folder batch becomes one row per
+source asset in Saved/BlueprintGenerator/jobs.db (SQLite), so queued work
+survives an editor restart. A pending row is unique per (source, options
+hash, destination): queueing the same asset with the same options again
+only raises the existing row's priority instead of adding work.
+
+The scheduler runs on the slate tick. It takes up to RUN_SIZE pending rows
+that share options and destination, highest priority first (INTERACTIVE
+before BULK), and generates them a CHUNK_SIZE chunk per tick through
+bp_handlers.generate_sources(), which only loads each chunk's assets when
+that chunk runs. Outcomes come back keyed by source path, so sources with
+the same name in different folders are never mixed up. Higher-priority work
+that arrives during a run is picked up at the next run boundary.
+
+A run never mixes jobs. Each job keeps one bp_scc.SourceControlBatch open
+across its runs (one mark-for-add and one submit per job, not per run),
+finished once the job has no pending or running items left, or at stop().
+Finished items are kept for PURGE_AFTER and purged when the queue is opened.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+import unreal
+
+import bp_handlers
+import bp_manifest
+import bp_scc
+import tool_log
+
+INTERACTIVE = 100
+BULK = 0
+
+RUN_SIZE = 100
+CHUNK_SIZE = 10
+THROUGHPUT_WINDOW = 60.0  # seconds
+STATS_TTL = 5.0  # seconds a stats() snapshot is reused while no item changes state
+PURGE_AFTER = 7 * 24 * 3600  # seconds finished items are kept
+
+log = tool_log.get_logger("BPGenerator")
+
+
+# ---------------- Queue ---------------- #
+class JobQueue:
+    """Pending/running/done generation items, one row per source asset"""
+    def __init__(self, path=None):
+        path = path or os.path.join(bp_manifest.data_dir(), "jobs.db")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " id INTEGER PRIMARY KEY, job TEXT NOT NULL, source TEXT NOT NULL,"
+            " options_hash TEXT NOT NULL, options TEXT NOT NULL, destination TEXT NOT NULL,"
+            " priority INTEGER NOT NULL, state TEXT NOT NULL DEFAULT 'pending',"
+            " enqueued REAL NOT NULL, finished REAL, blueprint TEXT, message TEXT);"
+            "CREATE UNIQUE INDEX IF NOT EXISTS pending_work ON items (source, options_hash, destination)"
+            " WHERE state = 'pending';"
+            "CREATE INDEX IF NOT EXISTS by_state ON items (state, priority, id);"
+            "CREATE INDEX IF NOT EXISTS by_job ON items (job);"
+        )
+        # Items that were running when the editor went away go back in the queue
+        self.db.execute("UPDATE items SET state = 'pending' WHERE state = 'running'")
+        self.db.commit()
+        self._stats = None  # (time taken, stats()) until an item changes state
+
+    def enqueue(self, job, sources, options, destination=bp_handlers.DESTINATION_FOLDER, priority=BULK):
+        """Queue sources under job; returns (new items, duplicates merged into pending ones)."""
+        digest = bp_manifest.options_hash(options)
+        rules = options.get("collision_rules", {})
+        folders = options.get("folders", {})
+        shared = {k: v for k, v in options.items() if k not in ("collision_rules", "folders")}
+        now = time.time()
+        added = 0
+        for source in sources:
+            existing = self.db.execute(
+                "SELECT id FROM items WHERE state = 'pending' AND source = ? AND options_hash = ? AND destination = ?",
+                (source, digest, destination),
+            ).fetchone()
+            if existing:
+                self.db.execute("UPDATE items SET priority = max(priority, ?) WHERE id = ?", (priority, existing[0]))
+                continue
+            item_options = dict(shared)
+            package = source.split(".", 1)[0]
+            if package in rules:
+                item_options["collision_rules"] = {package: rules[package]}
+            if source in folders:
+                item_options["folders"] = {source: folders[source]}
+            self.db.execute(
+                "INSERT INTO items (job, source, options_hash, options, destination, priority, enqueued)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job, source, digest, json.dumps(item_options), destination, priority, now),
+            )
+            added += 1
+        self.db.commit()
+        self._stats = None
+        return added, len(sources) - added
+
+    def take_run(self, limit=RUN_SIZE):
+        """Mark up to limit pending items sharing job/options/destination as running; returns their rows."""
+        head = self.db.execute(
+            "SELECT options_hash, destination, job FROM items WHERE state = 'pending' ORDER BY priority DESC, id LIMIT 1"
+        ).fetchone()
+        if head is None:
+            return []
+        rows = self.db.execute(
+            "SELECT id, job, source, options FROM items"
+            " WHERE state = 'pending' AND options_hash = ? AND destination = ? AND job = ?"
+            " ORDER BY priority DESC, id LIMIT ?",
+            (head[0], head[1], head[2], limit),
+        ).fetchall()
+        self.db.executemany("UPDATE items SET state = 'running' WHERE id = ?", [(r[0],) for r in rows])
+        self.db.commit()
+        self._stats = None
+        return [{"id": r[0], "job": r[1], "source": r[2], "options": json.loads(r[3]), "destination": head[1]} for r in rows]
+
+    def finish(self, outcomes):
+        """outcomes: [(item id, blueprint path or None, message)]"""
+        now = time.time()
+        self.db.executemany(
+            "UPDATE items SET state = ?, finished = ?, blueprint = ?, message = ? WHERE id = ?",
+            [("done" if bp else "failed", now, bp, message, item_id) for item_id, bp, message in outcomes],
+        )
+        self.db.commit()
+        self._stats = None
+
+    def stats(self):
+        """{pending, interactive, running, done, failed (all time), per_second (recent throughput)}
+
+        Counted again only after items change state, or every STATS_TTL seconds
+        so per_second decays while the queue is idle; the dashboard samples it
+        several times a second.
+        """
+        now = time.time()
+        if self._stats is not None and now - self._stats[0] < STATS_TTL:
+            return dict(self._stats[1])
+        counts = dict(self.db.execute("SELECT state, count(*) FROM items GROUP BY state").fetchall())
+        interactive = self.db.execute(
+            "SELECT count(*) FROM items WHERE state = 'pending' AND priority >= ?", (INTERACTIVE,)
+        ).fetchone()[0]
+        recent = self.db.execute(
+            "SELECT count(*) FROM items WHERE state IN ('done', 'failed') AND finished >= ?",
+            (now - THROUGHPUT_WINDOW,),
+        ).fetchone()[0]
+        stats = {
+            "pending": counts.get("pending", 0),
+            "interactive": interactive,
+            "running": counts.get("running", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "per_second": recent / THROUGHPUT_WINDOW,
+        }
+        self._stats = (now, stats)
+        return dict(stats)
+
+    def job_open(self, job):
+        """True while job still has pending or running items."""
+        return self.db.execute(
+            "SELECT count(*) FROM items WHERE job = ? AND state IN ('pending', 'running')", (job,)
+        ).fetchone()[0] > 0
+
+    def job_items(self, job):
+        rows = self.db.execute("SELECT source, state, blueprint, message FROM items WHERE job = ? ORDER BY id", (job,))
+        return [{"source": r[0], "state": r[1], "blueprint": r[2], "message": r[3]} for r in rows]
+
+    def purge(self, older_than=PURGE_AFTER):
+        """Drop finished items older than older_than seconds; returns how many went."""
+        removed = self.db.execute(
+            "DELETE FROM items WHERE state IN ('done', 'failed') AND finished < ?", (time.time() - older_than,)
+        ).rowcount
+        self.db.commit()
+        self._stats = None
+        return removed
+
+    def close(self):
+        self.db.close()
+
+
+# ---------------- Scheduler ---------------- #
+_state = {"queue": None, "run": None, "listeners": [], "batches": {}}
+# The tick handle is kept on the unreal module: after importlib.reload() of
+# this module start() still sees the old tick and replaces it instead of
+# registering a second scheduler
+_TICK_ATTR = "_bpg_queue_tick"
+
+
+def get_queue():
+    if _state["queue"] is None:
+        _state["queue"] = JobQueue()
+        # Once per editor session, so jobs.db only holds the last PURGE_AFTER of history
+        removed = _state["queue"].purge()
+        if removed:
+            log.info("Purged %d finished queue items.", removed)
+    return _state["queue"]
+
+
+def enqueue_plan(plan, job, priority=INTERACTIVE):
+    """Queue a plan's create/update rows (bp_handlers.plan()) with its options and planned folders.
+
+    Returns (new items, duplicates merged into pending ones).
+    """
+    rows = [row for row in plan["rows"] if row["action"] != "skip"]
+    options = dict(plan["options"])
+    options["folders"] = {row["source"]: row["bp"].rsplit("/", 1)[0] for row in rows}
+    return get_queue().enqueue(job, [row["source"] for row in rows], options, plan["destination"], priority)
+
+
+def add_listener(fn):
+    """fn(job, outcomes) is called on the game thread after each chunk with that chunk's outcomes for job."""
+    if fn not in _state["listeners"]:
+        _state["listeners"].append(fn)
+
+
+def remove_listener(fn):
+    if fn in _state["listeners"]:
+        _state["listeners"].remove(fn)
+
+
+def _start_run(items):
+    options = dict(items[0]["options"])
+    rules = {}
+    folders = {}
+    for item in items:
+        rules.update(item["options"].get("collision_rules", {}))
+        folders.update(item["options"].get("folders", {}))
+    if rules:
+        options["collision_rules"] = rules
+    if folders:
+        options["folders"] = folders
+
+    job = items[0]["job"]
+    if job not in _state["batches"]:
+        batch = bp_scc.SourceControlBatch([], items[0]["destination"], submit=options.get("scc_submit", False))
+        _state["batches"][job] = {"batch": batch, "ok": True}
+
+    # Nothing is loaded here; generate_sources() loads each chunk when it runs
+    return {
+        "job": job,
+        "items": items,
+        "by_source": {item["source"]: item for item in items},
+        "steps": bp_handlers.generate_sources(
+            [item["source"] for item in items], options, items[0]["destination"], chunk_size=CHUNK_SIZE,
+            scc=_state["batches"][job]["batch"],
+        ),
+    }
+
+
+def _finish_batch(job):
+    entry = _state["batches"].pop(job, None)
+    if entry is not None:
+        entry["batch"].finish(entry["ok"])
+
+
+def _on_tick(delta_seconds):
+    run = _state["run"]
+    if run is None:
+        items = get_queue().take_run()
+        if not items:
+            return
+        run = _state["run"] = _start_run(items)
+    outcomes = []
+    try:
+        _, _, results = next(run["steps"])
+    except StopIteration:
+        outcomes += _leftovers(run, "Not generated.")
+        _state["run"] = None
+    except Exception as e:
+        log.error("Queued generation failed: %s", e)
+        outcomes += _leftovers(run, str(e))
+        _state["batches"][run["job"]]["ok"] = False
+        _state["run"] = None
+    else:
+        for source, bp, message in results:
+            item = run["by_source"].pop(source)
+            outcomes.append((item["id"], bp.get_path_name() if bp else None, message))
+    _deliver(run, outcomes)
+    if _state["run"] is None and not get_queue().job_open(run["job"]):
+        _finish_batch(run["job"])
+
+
+def _deliver(run, outcomes):
+    if not outcomes:
+        return
+    get_queue().finish(outcomes)
+    jobs = {item["id"]: item["job"] for item in run["items"]}
+    by_job = {}
+    for outcome in outcomes:
+        by_job.setdefault(jobs[outcome[0]], []).append(outcome)
+    for job, job_outcomes in by_job.items():
+        for fn in list(_state["listeners"]):
+            try:
+                fn(job, job_outcomes)
+            except Exception as e:
+                log.warning("Queue listener failed: %s", e)
+
+
+def _leftovers(run, message):
+    leftovers = [(item["id"], None, message) for item in run["by_source"].values()]
+    run["by_source"] = {}
+    return leftovers
+
+
+def start():
+    """Run the scheduler on the slate tick (once per editor session)."""
+    get_queue()
+    tick = getattr(unreal, _TICK_ATTR, None)
+    if tick is not None and tick[0] is _on_tick:
+        return
+    if tick is not None:
+        # Registered by a previous import of this module
+        unreal.unregister_slate_post_tick_callback(tick[1])
+    setattr(unreal, _TICK_ATTR, (_on_tick, unreal.register_slate_post_tick_callback(_on_tick)))
+
+
+def stop():
+    tick = getattr(unreal, _TICK_ATTR, None)
+    if tick is not None:
+        unreal.unregister_slate_post_tick_callback(tick[1])
+        setattr(unreal, _TICK_ATTR, None)
+    # The paused run's batch stays open; it carries on if the scheduler is started again
+    running = _state["run"]["job"] if _state["run"] else None
+    for job in list(_state["batches"]):
+        if job != running:
+            _finish_batch(job)
@@ -0,0 +1,166 @@
+"""
+Incremental refresh of generated Blueprints when their source assets change.
+
+The manifest keeps a reverse index, source -> generated Blueprints
+(bp_manifest.dependents), so finding what to rebuild after a reimport is a
+lookup per changed source instead of a scan of the destination folder. The
+index is cross-checked against AssetRegistry.get_referencers() for the
+source package:
+    - indexed Blueprints that are gone are dropped from the manifest
+    - indexed Blueprints that no longer reference the source (someone swapped
+      the mesh by hand) are left alone and reported
+    - manifest Blueprints that reference the source but were missing from the
+      index are picked up again
+
+install() hooks the ImportSubsystem reimport event. Reimports arriving in the
+same burst are collected and handed to bp_queue as BULK work on the next
+slate tick, each Blueprint with the options and destination it was built
+with, so the work done is proportional to what changed. Generation puts a
+source it has built before back in the folder the manifest recorded for its
+Blueprint (bp_manifest.recorded_folders), so the Blueprint is rebuilt in
+place even if the folder layout would now pick another folder.
+
+    import bp_refresh; bp_refresh.install()
+"""
+
+import uuid
+
+import unreal
+
+import bp_manifest
+import bp_queue
+import tool_log
+
+log = tool_log.get_logger("BPGenerator")
+
+# Kept on the unreal module so a reload of this module replaces the hook instead of adding a second one
+_STATE_ATTR = "_bpg_refresh_state"
+
+
+def _state():
+    """hook (delegate, callback), tick (callback, handle) and the reimported sources not yet handled"""
+    state = getattr(unreal, _STATE_ATTR, None)
+    if state is None:
+        state = {"hook": None, "tick": None, "pending": set()}
+        setattr(unreal, _STATE_ATTR, state)
+    return state
+
+
+def _package(object_path):
+    return object_path.split(".", 1)[0]
+
+
+def _referencers(source):
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    options = unreal.AssetRegistryDependencyOptions(
+        include_soft_package_references=True, include_hard_package_references=True
+    )
+    return {str(name) for name in registry.get_referencers(_package(source), options) or []}
+
+
+def affected(sources, manifest=None):
+    """{source: [bp object paths to rebuild]} for the given source object paths, index checked against the registry.
+
+    The manifest is updated in place (dropped and re-indexed Blueprints); the caller saves it.
+    """
+    manifest = manifest if manifest is not None else bp_manifest.load_manifest()
+    packages = {_package(bp_path): bp_path for bp_path in manifest["blueprints"]}
+    found = {}
+    for source in sources:
+        referencers = _referencers(source)
+        indexed = bp_manifest.dependents(manifest, source)
+        confirmed = []
+        for bp_path in indexed:
+            if _package(bp_path) in referencers:
+                confirmed.append(bp_path)
+            elif not unreal.EditorAssetLibrary.does_asset_exist(bp_path):
+                bp_manifest.forget_blueprint(manifest, bp_path)
+                log.info("Dropped %s from the manifest (deleted).", bp_path)
+            else:
+                log.warning("⚠️ %s no longer references %s; not refreshing it.", bp_path, source)
+        # Referencers the index missed, but only ones we generated from this source
+        for package in referencers:
+            bp_path = packages.get(package)
+            if bp_path and bp_path not in indexed and source in bp_manifest.entry_sources(manifest["blueprints"][bp_path]):
+                manifest["sources"].setdefault(source, []).append(bp_path)
+                confirmed.append(bp_path)
+        if confirmed:
+            found[source] = confirmed
+    return found
+
+
+def refresh(sources, priority=bp_queue.BULK):
+    """Queue the Blueprints generated from sources for rebuilding; returns (job id, items queued)."""
+    manifest = bp_manifest.load_manifest()
+    found = affected(sources, manifest)
+    bp_manifest.save_manifest(manifest)
+
+    # One enqueue per (options, destination) the Blueprints were built with
+    batches = {}
+    for source, bp_paths in found.items():
+        for bp_path in bp_paths:
+            entry = manifest["blueprints"][bp_path]
+            options = manifest["options"].get(entry["options"])
+            if entry.get("output"):
+                # Rebuilding through the queue would make per-asset Blueprints instead
+                log.warning("⚠️ %s is a consolidated or harvested Blueprint; rebuild it from the window.", bp_path)
+                continue
+            if options is None or not entry.get("destination"):
+                # Generated before options and destinations were recorded
+                log.warning("⚠️ Don't know how %s was built; regenerate it from the window.", bp_path)
+                continue
+            batches.setdefault((entry["options"], entry["destination"]), (options, set()))[1].add(source)
+
+    job = f"reimport-{uuid.uuid4().hex[:8]}"
+    queued = 0
+    for (_, destination), (options, batch) in batches.items():
+        added, _ = bp_queue.get_queue().enqueue(job, sorted(batch), options, destination, priority)
+        queued += added
+    if queued:
+        log.info("🔁 %d changed sources queued to refresh %d Blueprints (%s).", queued, sum(len(v) for v in found.values()), job)
+    return job, queued
+
+
+# ---------------- Reimport hook ---------------- #
+def _on_reimport(asset):
+    if asset is not None:
+        _state()["pending"].add(asset.get_path_name())
+
+
+def _on_tick(delta_seconds):
+    state = _state()
+    if not state["pending"]:
+        return
+    sources, state["pending"] = sorted(state["pending"]), set()
+    try:
+        refresh(sources)
+    except Exception as e:
+        log.error("Refresh after reimport failed: %s", e)
+
+
+def install():
+    """Refresh generated Blueprints whenever a source asset is reimported (once per editor session)."""
+    state = _state()
+    if state["tick"] is not None and state["tick"][0] is _on_tick:
+        return
+    # Installed by a previous import of this module: swap its callbacks for this one's
+    _release(state)
+    delegate = unreal.get_editor_subsystem(unreal.ImportSubsystem).on_asset_reimport
+    delegate.add_callable(_on_reimport)
+    state["hook"] = (delegate, _on_reimport)
+    state["tick"] = (_on_tick, unreal.register_slate_post_tick_callback(_on_tick))
+    bp_queue.start()
+
+
+def _release(state):
+    if state["hook"] is not None:
+        state["hook"][0].remove_callable(state["hook"][1])
+    if state["tick"] is not None:
+        unreal.unregister_slate_post_tick_callback(state["tick"][1])
+    state.update(hook=None, tick=None)
+
+
+def uninstall():
+    state = _state()
+    _release(state)
+    state["pending"] = set()
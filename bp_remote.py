@@ -0,0 +1,257 @@
+"""
+Remote control for Blueprint generation in a running editor.
+
+A local TCP server speaking newline-delimited JSON lets pipeline scripts and
+DCC exporters queue generation jobs in one warm editor instead of starting a
+commandlet per batch. Inside the editor:
+
+    import bp_remote; bp_remote.start_server()
+
+(also in Tools > Start Remote Generation Server). From any other process:
+
+    python bp_remote.py /Game/Meshes/SM_Rock /Game/Meshes/SM_Tree --option ccd=true
+
+Requests, one JSON object per line:
+    {"cmd": "generate", "assets": [package or object paths], "options": {...}, "destination": "/Game/..."}
+    {"cmd": "status"}
+    {"cmd": "ping"}
+Replies stream back on the same connection:
+    {"event": "queued", "job": "remote-1a2b3c4d", "added": 120, "merged": 0, "rejected": [], "position": 130}
+    {"event": "progress", "job": "remote-1a2b3c4d", "done": 10, "total": 120, "failed": 0}
+    {"event": "done", "job": "remote-1a2b3c4d", "results": [{"asset", "blueprint", "message"}], "unsupported": [...]}
+
+Sockets are served on background threads. Requests are handed to the
+persistent bp_queue on the game thread as BULK work, and its scheduler
+generates them a chunk per slate tick, so the editor stays responsive.
+Each requested path is first resolved to its object path through the asset
+registry (/Game/Meshes/SM_Rock -> /Game/Meshes/SM_Rock.SM_Rock), so layouts,
+source control targets and queue dedupe all see one spelling per asset;
+paths that don't resolve are rejected and reported as failed.
+Assets already pending with the same options are "merged": they are
+generated once, under the job that queued them first.
+"""
+
+import argparse
+import json
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import uuid
+
+import tool_log
+
+try:
+    import unreal
+    import bp_handlers
+    import bp_queue
+    UNREAL_AVAILABLE = True
+except Exception:
+    # Client side, outside the editor
+    UNREAL_AVAILABLE = False
+
+HOST = "127.0.0.1"
+PORT = 9876
+
+log = tool_log.get_logger("BPGenerator")
+
+_inbox = queue.Queue()  # filled by socket threads, drained on the game thread
+_open_jobs = {}         # job id -> job, until its items are all finished
+_server = {"server": None, "thread": None, "tick": None}
+
+
+# ---------------- Server side ---------------- #
+class _Client:
+    """Write side of one connection, shared between the socket thread and the game thread"""
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.lock = threading.Lock()
+        self.alive = True
+
+    def send(self, message):
+        if not self.alive:
+            return
+        try:
+            with self.lock:
+                self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+                self.wfile.flush()
+        except OSError:
+            self.alive = False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        client = _Client(self.wfile)
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                cmd = request.get("cmd")
+            except ValueError:
+                client.send({"event": "error", "message": "invalid JSON"})
+                continue
+            if cmd == "ping":
+                client.send({"event": "pong"})
+            elif cmd == "status":
+                client.send({"event": "status", "waiting": _inbox.qsize(), "open_jobs": sorted(_open_jobs)})
+            elif cmd == "generate":
+                job = {
+                    "id": f"remote-{uuid.uuid4().hex[:8]}",
+                    "assets": list(request.get("assets", [])),
+                    "options": dict(request.get("options", {})),
+                    "destination": request.get("destination"),
+                    "client": client,
+                }
+                _inbox.put(job)
+            else:
+                client.send({"event": "error", "message": f"unknown cmd {cmd!r}"})
+        client.alive = False
+
+
+def _resolve(paths):
+    """(object paths, rejected paths): each path as the registry spells its object path, once, in request order."""
+    resolved, rejected = [], []
+    for path in paths:
+        asset_data = unreal.EditorAssetLibrary.find_asset_data(path)
+        if asset_data is None or not asset_data.is_valid():
+            rejected.append(path)
+            continue
+        object_path = f"{asset_data.package_name}.{asset_data.asset_name}"
+        if object_path not in resolved:
+            resolved.append(object_path)
+    return resolved, rejected
+
+
+def _on_tick(delta_seconds):
+    """Game thread: hand new requests to the persistent queue (its scheduler does the generating)."""
+    while True:
+        try:
+            job = _inbox.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            sources, rejected = _resolve(job["assets"])
+            added, merged = bp_queue.get_queue().enqueue(
+                job["id"], sources, job["options"], job["destination"] or bp_handlers.DESTINATION_FOLDER, bp_queue.BULK
+            )
+        except Exception as e:
+            job["client"].send({"event": "error", "job": job["id"], "message": str(e)})
+            continue
+        stats = bp_queue.get_queue().stats()
+        job["client"].send({
+            "event": "queued", "job": job["id"], "added": added, "merged": merged, "rejected": rejected,
+            "position": stats["pending"],
+        })
+        job.update(total=added, done=0, failed=0, rejected=rejected)
+        _open_jobs[job["id"]] = job
+        if not added:
+            _finish(job)
+
+
+def _on_outcomes(job_id, outcomes):
+    job = _open_jobs.get(job_id)
+    if job is None:
+        return
+    job["done"] += len(outcomes)
+    job["failed"] += sum(1 for _, bp, _ in outcomes if bp is None)
+    job["client"].send({"event": "progress", "job": job_id, "done": job["done"], "total": job["total"], "failed": job["failed"]})
+    if job["done"] >= job["total"]:
+        _finish(job)
+
+
+def _finish(job):
+    _open_jobs.pop(job["id"], None)
+    items = bp_queue.get_queue().job_items(job["id"])
+    job["client"].send({
+        "event": "done",
+        "job": job["id"],
+        "results": [
+            {"asset": item["source"], "blueprint": item["blueprint"], "message": item["message"]}
+            for item in items if item["state"] in ("done", "failed")
+        ] + [{"asset": path, "blueprint": None, "message": bp_handlers.MISSING_SOURCE} for path in job["rejected"]],
+        "unsupported": [item["source"] for item in items if item["state"] == "failed" and item["message"] == bp_handlers.NO_HANDLER],
+    })
+
+
+def start_server(host=HOST, port=PORT):
+    """Start listening (once per editor session) and hook job execution into the slate tick."""
+    if _server["server"] is not None:
+        return _server["server"]
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    server = socketserver.ThreadingTCPServer((host, port), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="bp_remote", daemon=True)
+    thread.start()
+    bp_queue.add_listener(_on_outcomes)
+    bp_queue.start()
+    _server.update(server=server, thread=thread, tick=unreal.register_slate_post_tick_callback(_on_tick))
+    log.info("🛰 Remote generation server listening on %s:%d", host, port)
+    return server
+
+
+def stop_server():
+    if _server["server"] is None:
+        return
+    _server["server"].shutdown()
+    _server["server"].server_close()
+    unreal.unregister_slate_post_tick_callback(_server["tick"])
+    bp_queue.remove_listener(_on_outcomes)
+    _server.update(server=None, thread=None, tick=None)
+
+
+# ---------------- Client side ---------------- #
+def submit(assets, options=None, destination=None, host=HOST, port=PORT, on_event=None):
+    """Send one generation job and block until it is done; on_event(message) sees every streamed reply."""
+    request = {"cmd": "generate", "assets": list(assets), "options": options or {}}
+    if destination:
+        request["destination"] = destination
+    with socket.create_connection((host, port)) as sock:
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        for line in sock.makefile("r", encoding="utf-8"):
+            message = json.loads(line)
+            if on_event:
+                on_event(message)
+            if message["event"] in ("done", "error"):
+                return message
+    return {"event": "error", "message": "connection closed"}
+
+
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Queue Blueprint generation in a running editor")
+    parser.add_argument("assets", nargs="+", help="source asset paths")
+    parser.add_argument("--option", action="append", default=[], help="name=value, value parsed as JSON if possible")
+    parser.add_argument("--destination")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args(argv)
+
+    options = dict((k, _parse_value(v)) for k, v in (o.split("=", 1) for o in args.option))
+
+    def show(message):
+        if message["event"] == "progress":
+            print(f"job {message['job']}: {message['done']}/{message['total']} ({message['failed']} failed)")
+        elif message["event"] == "queued":
+            print(f"job {message['job']}: {message['added']} queued, {message['merged']} already pending, "
+                  f"{len(message['rejected'])} not found ({message['position']} in queue)")
+
+    result = submit(args.assets, options, args.destination, args.host, args.port, on_event=show)
+    if result["event"] == "error":
+        print(f"error: {result['message']}", file=sys.stderr)
+        return 1
+    failed = [r for r in result["results"] if r["blueprint"] is None]
+    for r in failed:
+        print(f"failed: {r['asset']}: {r['message']}", file=sys.stderr)
+    print(f"{len(result['results']) - len(failed)} Blueprints generated, {len(failed)} failed, "
+          f"{len(result['unsupported'])} skipped")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Per-mesh settings rules for the Batch Blueprint Creator.
+
+Classification reads only asset registry tags (AssetData), never the mesh
+itself, so a whole selection can be classified without loading anything.
+Static mesh tags used: Triangles, LODs, CollisionPrims, ApproxSize ("XxYxZ").
+
+collision_rules() starts from the tool options (the global checkboxes) and
+adjusts them per mesh:
+- debris-sized meshes and "_NoCol"/"_Decal"/"_Decor" names get no collision
+- "_Phys"/"_Prop" names simulate physics, large meshes never do
+- meshes without simple collision use complex-as-simple only while they are
+  low-poly; above HIGH_POLY_TRIANGLES that is a physics performance trap, so
+  they keep default complexity and are flagged as needing simple collision
+Collision complexity is not a component setting: it is the trace flag on the
+mesh's BodySetup, which every use of the mesh shares. Source meshes are never
+modified or saved, so the chosen complexity is not applied; generation
+reports meshes whose own complexity differs from it (complexity_mismatch)
+so they can be fixed on the mesh.
+
+render_rules() does the same for runtime cost, by size class of the largest
+bounds axis (SIZE_CLASSES): small meshes get shorter cull distances, tiny
+ones skip shadows and LOD0 and draw their Nanite fallback mesh, large ones
+are never culled. Explicit tool options (cast_shadow off, cull_distance,
+forced_lod, min_lod, nanite_fallback) always win over the size class.
+"""
+
+import unreal
+
+HIGH_POLY_TRIANGLES = 5000
+DEBRIS_SIZE = 20.0      # largest bounds axis, world units
+LARGE_SIZE = 2000.0
+
+NO_COLLISION_SUFFIXES = ("_nocol", "_decal", "_decor")
+PHYSICS_SUFFIXES = ("_phys", "_prop")
+
+# (class, largest axis up to), smallest first
+SIZE_CLASSES = (("tiny", 50.0), ("small", 250.0), ("medium", 1000.0), ("large", 5000.0), ("huge", float("inf")))
+RENDER_BY_SIZE = {
+    # cull 0 = never culled; nanite_fallback = draw the fallback mesh instead of Nanite
+    "tiny": {"cast_shadow": False, "cull_distance": 3000.0, "min_lod": 1, "nanite_fallback": True},
+    "small": {"cast_shadow": True, "cull_distance": 8000.0, "min_lod": 0, "nanite_fallback": False},
+    "medium": {"cast_shadow": True, "cull_distance": 20000.0, "min_lod": 0, "nanite_fallback": False},
+    "large": {"cast_shadow": True, "cull_distance": 0.0, "min_lod": 0, "nanite_fallback": False},
+    "huge": {"cast_shadow": True, "cull_distance": 0.0, "min_lod": 0, "nanite_fallback": False},
+}
+NO_RENDER_RULES = {"cast_shadow": True, "cull_distance": 0.0, "min_lod": 0, "nanite_fallback": False}
+
+COMPLEXITY = {
+    "default": "CTF_USE_DEFAULT",
+    "simple_as_complex": "CTF_USE_SIMPLE_AS_COMPLEX",
+    "complex_as_simple": "CTF_USE_COMPLEX_AS_SIMPLE",
+}
+
+
+def _int_tag(asset_data, tag, default=0):
+    try:
+        value = asset_data.get_tag_value(tag)
+        return int(float(value)) if value else default
+    except Exception:
+        return default
+
+
+def read_mesh_tags(asset_data):
+    """Mesh facts from registry tags only; missing tags come back as 0/None."""
+    size = None
+    try:
+        approx = asset_data.get_tag_value("ApproxSize")
+        if approx:
+            size = tuple(float(v) for v in approx.split("x"))
+    except Exception:
+        size = None
+    return {
+        "name": str(asset_data.asset_name),
+        "path": str(asset_data.package_name),
+        "triangles": _int_tag(asset_data, "Triangles"),
+        "lods": _int_tag(asset_data, "LODs", 1),
+        "collision_prims": _int_tag(asset_data, "CollisionPrims"),
+        "size": size,
+    }
+
+
+def collision_rules(tags, options):
+    """Pick collision/physics settings for one mesh; returns a dict with 'reasons' explaining the choice."""
+    name = tags["name"].lower()
+    largest = max(tags["size"]) if tags["size"] else None
+    has_simple = tags["collision_prims"] > 0
+    high_poly = tags["triangles"] > HIGH_POLY_TRIANGLES
+
+    rules = {
+        "collision_preset": options.get("collision_preset") or "BlockAllDynamic",
+        "simulate_physics": options.get("enable_gravity", False) or options.get("ccd", False),
+        "enable_gravity": options.get("enable_gravity", False),
+        "ccd": options.get("ccd", False),
+        "generate_overlap": options.get("generate_overlap", False),
+        "complexity": "simple_as_complex" if options.get("simple_collision") else "default",
+        "reasons": [],
+    }
+
+    if name.endswith(NO_COLLISION_SUFFIXES) or (largest is not None and largest < DEBRIS_SIZE):
+        rules.update(collision_preset="NoCollision", simulate_physics=False, generate_overlap=False)
+        rules["reasons"].append("no-collision name or debris-sized bounds")
+        return rules
+
+    if name.endswith(PHYSICS_SUFFIXES):
+        rules.update(collision_preset="PhysicsActor", simulate_physics=True, enable_gravity=True)
+        rules["reasons"].append("physics prop by name")
+
+    if largest is not None and largest > LARGE_SIZE and rules["simulate_physics"]:
+        rules["simulate_physics"] = False
+        rules["reasons"].append(f"too large to simulate ({largest:.0f} units)")
+
+    if not has_simple:
+        if high_poly:
+            # Never complex-as-simple on dense meshes: per-triangle physics queries
+            rules["complexity"] = "default"
+            rules["simulate_physics"] = False
+            rules["needs_simple_collision"] = True
+            rules["reasons"].append(f"{tags['triangles']} triangles and no simple collision")
+        else:
+            rules["complexity"] = "complex_as_simple"
+            rules["reasons"].append("low-poly without simple collision")
+    elif rules["complexity"] == "default" and high_poly:
+        rules["reasons"].append("high-poly, using its simple collision")
+
+    return rules
+
+
+def size_class(tags):
+    """Size class name from the bounds; "medium" when the registry has no size."""
+    if not tags["size"]:
+        return "medium"
+    largest = max(tags["size"])
+    return next(name for name, limit in SIZE_CLASSES if largest <= limit)
+
+
+def wants_render_rules(options):
+    """True when any render option differs from the engine defaults, so untouched runs skip the pass."""
+    return bool(
+        options.get("render_rules") or options.get("cast_shadow", True) is False or options.get("cull_distance")
+        or options.get("forced_lod") or options.get("min_lod") or options.get("material_overrides")
+        or options.get("nanite_fallback")
+    )
+
+
+def render_rules(tags, options):
+    """LOD/shadow/cull/Nanite settings for one mesh; 'reasons' explains anything the size class changed."""
+    size = size_class(tags)
+    by_size = RENDER_BY_SIZE[size] if options.get("render_rules") else NO_RENDER_RULES
+    rules = {
+        "size_class": size,
+        "cast_shadow": options.get("cast_shadow", True) and by_size["cast_shadow"],
+        "cull_distance": float(options.get("cull_distance") or by_size["cull_distance"]),
+        "forced_lod": int(options.get("forced_lod", 0)),
+        # MinLOD past the last LOD would hide the mesh
+        "min_lod": min(max(int(options.get("min_lod", 0)), by_size["min_lod"]), max(tags["lods"] - 1, 0)),
+        "nanite_fallback": bool(options.get("nanite_fallback") or by_size["nanite_fallback"]),
+        "material_overrides": dict(options.get("material_overrides") or {}),
+        "reasons": [],
+    }
+    if options.get("render_rules"):
+        rules["reasons"].append(f"{size} mesh")
+        if not by_size["cast_shadow"]:
+            rules["reasons"].append("too small to cast a useful shadow")
+    return rules
+
+
+def classify(asset_datas, options):
+    """{package path: rules} for a list of AssetData, without loading any asset."""
+    return {str(ad.package_name): collision_rules(read_mesh_tags(ad), options) for ad in asset_datas}
+
+
+def component_settings(rules):
+    """Rules -> component settings in bp_handlers.apply_setting form."""
+    return {
+        "simulate_physics": rules["simulate_physics"],
+        "enable_gravity": rules["enable_gravity"],
+        "body_instance.use_ccd": rules["simulate_physics"] and rules["ccd"],
+        "generate_overlap_events": rules["generate_overlap"],
+        "collision_profile_name": unreal.Name(rules["collision_preset"]),
+    }
+
+
+def complexity_flag(complexity):
+    """'simple_as_complex' -> unreal.CollisionTraceFlag.CTF_USE_SIMPLE_AS_COMPLEX"""
+    return getattr(unreal.CollisionTraceFlag, COMPLEXITY[complexity])
+
+
+def mesh_complexity(mesh):
+    """The loaded mesh's own complexity ('default', ...) from its BodySetup, or None if it can't be read."""
+    try:
+        flag = mesh.get_editor_property("body_setup").get_editor_property("collision_trace_flag")
+    except Exception:
+        return None
+    return next((name for name in COMPLEXITY if flag == complexity_flag(name)), None)
+
+
+def complexity_mismatch(mesh, wanted):
+    """The mesh's complexity when it should be reported against wanted, else None.
+
+    "default" is only a choice against complex-as-simple (dense meshes); a mesh
+    an artist set to simple-as-complex isn't reported for it.
+    """
+    current = mesh_complexity(mesh)
+    if current is None or current == wanted or (wanted == "default" and current != "complex_as_simple"):
+        return None
+    return current
+
+
+def render_settings(rules, mesh=None):
+    """Render rules -> StaticMeshComponent settings; with the mesh, slot overrides become override_materials."""
+    settings = {
+        "cast_shadow": rules["cast_shadow"],
+        "ld_max_draw_distance": rules["cull_distance"],
+        "forced_lod_model": rules["forced_lod"],
+        "override_min_lod": rules["min_lod"] > 0,
+        "min_lod": rules["min_lod"],
+        "disallow_nanite": rules["nanite_fallback"],
+    }
+    if mesh is not None and rules["material_overrides"]:
+        slots = [str(m.get_editor_property("material_slot_name")) for m in mesh.get_editor_property("static_materials")]
+        overrides = [None] * len(slots)
+        for slot, material_path in rules["material_overrides"].items():
+            if slot in slots:
+                overrides[slots.index(slot)] = unreal.EditorAssetLibrary.load_asset(material_path)
+        if any(overrides):
+            settings["override_materials"] = overrides
+    return settings
@@ -0,0 +1,179 @@
+"""
+Batched source control for generated Blueprints.
+
+Saving Blueprints one at a time with source control enabled costs a status
+query plus a checkout or mark-for-add round trip per asset. SourceControlBatch
+does it per batch instead (a Generate run, or a whole queued job):
+    one status query per run for just the packages about to be written
+    one checkout call per run for the existing packages that need it (before any save)
+    one mark-for-add call for the new packages (when the batch finishes)
+    optionally one submit of everything written, with a generated description
+
+The editor's Python API has no call to create a pending changelist, so
+"one changelist" is a single check_in_files() of the batch.
+
+provider() returns the editor's source control, a FakeProvider when the
+BPGEN_FAKE_SCC environment variable is set (in-memory, counts round trips,
+optional latency), or None when source control is off.
+"""
+
+import os
+import time
+
+import unreal
+
+import tool_log
+
+log = tool_log.get_logger("BPGenerator")
+
+
+# ---------------- Providers ---------------- #
+class UnrealProvider:
+    """unreal.SourceControl, one call per batch"""
+    name = "editor"
+
+    def query(self, packages):
+        return {pkg: state for pkg, state in zip(packages, unreal.SourceControl.query_file_states(packages))}
+
+    def check_out(self, packages):
+        return unreal.SourceControl.check_out_files(packages)
+
+    def mark_for_add(self, packages):
+        return unreal.SourceControl.mark_files_for_add(packages)
+
+    def submit(self, packages, description):
+        return unreal.SourceControl.check_in_files(packages, description)
+
+
+class FakeState:
+    def __init__(self, controlled=False, checked_out=False, added=False, other=False):
+        self.is_source_controlled = controlled
+        self.is_checked_out = checked_out
+        self.is_added = added
+        self.is_checked_out_other = other
+
+
+class FakeProvider:
+    """In-memory stand-in for testing batching without a server; round_trips counts calls"""
+    name = "fake"
+
+    def __init__(self, latency_ms=0.0):
+        self.latency_ms = latency_ms
+        self.files = {}  # package -> FakeState
+        self.round_trips = 0
+        self.submitted = []
+
+    def _trip(self):
+        self.round_trips += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+
+    def query(self, packages):
+        self._trip()
+        return {pkg: self.files.get(pkg, FakeState()) for pkg in packages}
+
+    def check_out(self, packages):
+        self._trip()
+        for pkg in packages:
+            self.files.setdefault(pkg, FakeState(controlled=True)).is_checked_out = True
+        return True
+
+    def mark_for_add(self, packages):
+        self._trip()
+        for pkg in packages:
+            self.files[pkg] = FakeState(controlled=True, added=True)
+        return True
+
+    def submit(self, packages, description):
+        self._trip()
+        for pkg in packages:
+            self.files[pkg] = FakeState(controlled=True)
+        self.submitted.append((description, list(packages)))
+        return True
+
+
+_fake = {}
+
+
+def provider():
+    if os.environ.get("BPGEN_FAKE_SCC"):
+        if "provider" not in _fake:
+            _fake["provider"] = FakeProvider(float(os.environ.get("BPGEN_FAKE_SCC_LATENCY_MS", "0")))
+        return _fake["provider"]
+    try:
+        if unreal.SourceControl.is_enabled():
+            return UnrealProvider()
+    except Exception:
+        pass
+    return None
+
+
+# ---------------- Batch ---------------- #
+def package_of(object_path):
+    return object_path.split(".", 1)[0]
+
+
+class SourceControlBatch:
+    """Batched checkout/add/submit around generated packages; a no-op when there is no provider.
+
+    targets are the Blueprint object paths about to be written. Used as a
+    context manager for a single run, or kept open across runs with add()
+    for each run's targets and finish() once at the end (one queued job).
+    Only the targets' packages are ever queried, never the whole destination.
+    """
+    def __init__(self, targets, destination, submit=False, description=None, scc=None):
+        self.scc = scc if scc is not None else provider()
+        self.destination = destination
+        self.initial = targets
+        self.targets = []
+        self.submit = submit
+        self.description = description
+        self.to_add = []
+        self.checked_out = []
+
+    def add(self, targets):
+        """One status query and at most one checkout for the packages in targets not seen yet."""
+        if self.scc is None:
+            return
+        new = sorted({package_of(t) for t in targets} - set(self.targets))
+        if not new:
+            return
+        self.targets += new
+        states = self.scc.query(new)
+        checkout = []
+        for pkg in new:
+            state = states.get(pkg)
+            if state is None or not state.is_source_controlled:
+                self.to_add.append(pkg)
+            elif state.is_checked_out_other:
+                log.warning("%s is checked out by someone else; it will be written locally only.", pkg)
+            elif not (state.is_checked_out or state.is_added):
+                checkout.append(pkg)
+        if checkout and not self.scc.check_out(checkout):
+            log.warning("Bulk checkout of %d packages failed.", len(checkout))
+        self.checked_out += checkout
+
+    def finish(self, ok=True):
+        """One mark-for-add for the new packages that were actually written, then the optional submit."""
+        if self.scc is None or not self.targets:
+            return
+        self.to_add = [pkg for pkg in self.to_add if unreal.EditorAssetLibrary.does_asset_exist(pkg)]
+        if self.to_add and not self.scc.mark_for_add(self.to_add):
+            log.warning("Bulk mark-for-add of %d packages failed.", len(self.to_add))
+        if self.submit and ok:
+            packages = self.to_add + self.checked_out
+            description = self.description or (
+                f"Generated Blueprints: {len(self.to_add)} added, {len(self.checked_out)} updated in {self.destination}"
+            )
+            if packages and not self.scc.submit(packages, description):
+                log.warning("Submit of %d generated packages failed.", len(packages))
+        log.info("Source control (%s): %d checked out, %d marked for add in one batch each.",
+                 self.scc.name, len(self.checked_out), len(self.to_add))
+
+    def __enter__(self):
+        self.add(self.initial)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.finish(exc_type is None)
+        return False
@@ -0,0 +1,140 @@
+"""
+Up-front validation of source assets for the Batch Blueprint Creator.
+
+Broken inputs (unreadable or truncated .uasset files, meshes with no LODs,
+no triangles, zero bounds or no material slots) are flagged before any
+Blueprint is created. Registry tags are read on the game thread in one pass;
+the file checks run in a ThreadPoolExecutor since they are plain disk I/O.
+
+Registry tags only count against a mesh when they are present with a bad
+value; a tag the registry didn't write is not a problem. Unreadable tags and
+unreadable files are reported as problems rather than raised.
+
+Results are cached in Saved/BlueprintGenerator/validation_cache.json keyed by
+a hash of the package header, size and mtime. Only the first HEADER_BYTES of
+a file are read, and only when its size or mtime changed, so a re-run
+validates just the files that changed.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import unreal
+
+import bp_manifest
+
+PACKAGE_MAGIC = 0x9E2A83C1
+HEADER_BYTES = 4096
+MAX_WORKERS = 8
+_MESH_TAGS = ("LODs", "Triangles", "ApproxSize", "Materials")
+
+
+def cache_path():
+    return os.path.join(bp_manifest.data_dir(), "validation_cache.json")
+
+
+def _load_cache():
+    try:
+        with open(cache_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}, "results": {}}  # files: path -> [size, mtime, hash]; results: hash -> problems
+
+
+def _save_cache(cache):
+    path = cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+
+
+def package_file(package_name):
+    """On-disk .uasset for a /Game package, or None for other mount points."""
+    if not package_name.startswith("/Game/"):
+        return None
+    content_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_content_dir())
+    return os.path.join(content_dir, package_name[len("/Game/"):] + ".uasset")
+
+
+def _tag_problems(asset_class, tags):
+    if asset_class != "StaticMesh":
+        return []
+    problems = []
+    for tag, problem in (("LODs", "no LODs"), ("Triangles", "no triangles"), ("Materials", "no material slots")):
+        value = tags.get(tag)
+        if not value:
+            continue  # not in the registry; nothing to judge
+        try:
+            if int(float(value)) < 1:
+                problems.append(problem)
+        except ValueError:
+            problems.append(f"unreadable {tag} tag")
+    size = tags.get("ApproxSize")
+    if size:
+        try:
+            axes = [float(v) for v in size.split("x")]
+        except ValueError:
+            problems.append("unreadable ApproxSize tag")
+        else:
+            if all(axis == 0.0 for axis in axes):
+                problems.append("zero bounds")
+    return problems
+
+
+def _check_file(path, known):
+    """Worker: (stat, hash, header problems or None when the cached result for this hash still applies)."""
+    if path is None:
+        return None, None, []
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None, ["package file missing on disk"]
+    stamp = [st.st_size, st.st_mtime]
+    if known and known[:2] == stamp:
+        return stamp, known[2], None
+
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER_BYTES)
+    except OSError as e:
+        return stamp, None, [f"package file unreadable ({e.strerror or e})"]
+    digest = hashlib.sha1(header)
+    digest.update(f"{st.st_size}:{st.st_mtime}".encode())
+    problems = []
+    if len(header) < 4 or struct.unpack("<I", header[:4])[0] != PACKAGE_MAGIC:
+        problems.append("not a valid package file (bad header)")
+    return stamp, digest.hexdigest(), problems
+
+
+def validate(asset_datas):
+    """{object path: [problems]} for the invalid entries of asset_datas; valid assets are left out."""
+    cache = _load_cache()
+
+    # Game thread: everything that touches the registry
+    jobs = []
+    for ad in asset_datas:
+        package = str(ad.package_name)
+        asset_class = str(ad.asset_class_path.asset_name)
+        tags = {tag: ad.get_tag_value(tag) for tag in _MESH_TAGS} if asset_class == "StaticMesh" else {}
+        jobs.append((f"{package}.{ad.asset_name}", package_file(package), asset_class, tags))
+
+    invalid = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        checks = pool.map(lambda job: _check_file(job[1], cache["files"].get(job[1])), jobs)
+        for (object_path, path, asset_class, tags), (stamp, digest, file_problems) in zip(jobs, checks):
+            if digest is None:
+                problems = file_problems + _tag_problems(asset_class, tags)
+            elif file_problems is None and digest in cache["results"]:
+                problems = cache["results"][digest]
+            else:
+                problems = (file_problems or []) + _tag_problems(asset_class, tags)
+                cache["files"][path] = stamp + [digest]
+                cache["results"][digest] = problems
+            if problems:
+                invalid[object_path] = problems
+
+    _save_cache(cache)
+    return invalid
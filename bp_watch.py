@@ -0,0 +1,200 @@
+"""
+Watch-folder mode: generate Blueprints for meshes as they land in content paths.
+
+Configured in Saved/BlueprintGenerator/watch.json:
+    {"paths": ["/Game/Imports"], "destination": "/Game/GeneratedBlueprints", "options": {...}}
+
+    import bp_watch; bp_watch.start()
+
+(also in Tools > Start Watch Folders, or the window's "Watch import folders"
+option, which watches with the window's current options).
+
+Asset added / renamed events for assets under the watched paths only record
+the object path. The slate tick then:
+    - waits until no new event has arrived for DEBOUNCE_S (an import of 10k
+      files is one batch, not 10k), or until MAX_WAIT_S has passed
+    - hands at most BATCH_SIZE sources per tick to bp_queue as BULK work
+    - holds back while the queue already has HIGH_WATER items pending, so a
+      huge import drains at the rate the generator keeps up with instead of
+      flooding the queue and stalling the editor
+Only asset classes with a handler are queued.
+
+AssetRegistry's added/renamed delegates are used when this engine build
+exposes them to Python; otherwise new imports come from
+ImportSubsystem.on_asset_post_import, and assets renamed or moved into a
+watched path are not seen (generate those from the window).
+
+The watch state, including the tick and delegate handles, lives on the
+unreal module, so after importlib.reload() of this module start() replaces
+the old callbacks instead of leaving them running next to new ones.
+"""
+
+import json
+import os
+import time
+import uuid
+
+import unreal
+
+import bp_handlers
+import bp_manifest
+import bp_queue
+import tool_log
+
+DEBOUNCE_S = 2.0
+MAX_WAIT_S = 30.0
+BATCH_SIZE = 200
+HIGH_WATER = 500
+
+log = tool_log.get_logger("BPGenerator")
+
+_STATE_ATTR = "_bpg_watch_state"
+
+
+def _state():
+    """config, tick (callback, handle), hooks [(delegate, callback)], pending {object path: class}, burst timing"""
+    state = getattr(unreal, _STATE_ATTR, None)
+    if state is None:
+        state = {"config": None, "tick": None, "hooks": [], "pending": {}, "first": 0.0, "last": 0.0, "job": None, "queued": 0}
+        setattr(unreal, _STATE_ATTR, state)
+    return state
+
+
+# ---------------- Config ---------------- #
+def config_path():
+    return os.path.join(bp_manifest.data_dir(), "watch.json")
+
+
+def load_config():
+    try:
+        with open(config_path(), "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        config = {}
+    config.setdefault("paths", ["/Game/Imports"])
+    config.setdefault("destination", bp_handlers.DESTINATION_FOLDER)
+    config.setdefault("options", {})
+    return config
+
+
+def save_config(config):
+    os.makedirs(os.path.dirname(config_path()), exist_ok=True)
+    with open(config_path(), "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+
+
+# ---------------- Events ---------------- #
+def _watched(object_path):
+    return any(object_path.startswith(path.rstrip("/") + "/") for path in _state()["config"]["paths"])
+
+
+def _class_path(asset_data):
+    return f"{asset_data.asset_class_path.package_name}.{asset_data.asset_class_path.asset_name}"
+
+
+def _note(object_path, class_path):
+    if class_path not in bp_handlers.HANDLERS or not _watched(object_path):
+        return
+    state = _state()
+    now = time.time()
+    if not state["pending"]:
+        state["first"] = now
+    state["pending"][object_path] = class_path
+    state["last"] = now
+
+
+def _on_asset_added(asset_data):
+    _note(f"{asset_data.package_name}.{asset_data.asset_name}", _class_path(asset_data))
+
+
+def _on_asset_renamed(asset_data, old_object_path):
+    _state()["pending"].pop(str(old_object_path), None)
+    _on_asset_added(asset_data)
+
+
+def _on_post_import(factory, created_object):
+    if created_object is not None:
+        _note(created_object.get_path_name(), created_object.get_class().get_path_name())
+
+
+# ---------------- Batching ---------------- #
+def _on_tick(delta_seconds):
+    state = _state()
+    pending = state["pending"]
+    if not pending:
+        return
+    now = time.time()
+    if now - state["last"] < DEBOUNCE_S and now - state["first"] < MAX_WAIT_S:
+        return  # still in a burst
+    queue = bp_queue.get_queue()
+    room = HIGH_WATER - queue.stats()["pending"]
+    if room <= 0:
+        return  # back-pressure: let the generator catch up first
+
+    if state["job"] is None:
+        state["job"] = f"watch-{uuid.uuid4().hex[:8]}"
+    batch = sorted(pending)[:min(BATCH_SIZE, room)]
+    for object_path in batch:
+        del pending[object_path]
+    config = state["config"]
+    added, merged = queue.enqueue(state["job"], batch, config["options"], config["destination"], bp_queue.BULK)
+    state["queued"] += added
+    log.info("👀 Watch: queued %d new assets (%d already pending, %d waiting).", added, merged, len(pending))
+    if not pending:
+        log.info("👀 Watch: import burst done, %d assets queued under %s.", state["queued"], state["job"])
+        state.update(job=None, queued=0)
+
+
+# ---------------- Start / stop ---------------- #
+def _hook(state, delegate, fn):
+    delegate.add_callable(fn)
+    state["hooks"].append((delegate, fn))
+
+
+def _unhook(state):
+    for delegate, fn in state["hooks"]:
+        delegate.remove_callable(fn)
+    if state["tick"] is not None:
+        unreal.unregister_slate_post_tick_callback(state["tick"][1])
+    state.update(tick=None, hooks=[])
+
+
+def start(paths=None, options=None, destination=None):
+    """Watch the configured paths (arguments override and are saved to watch.json)."""
+    config = load_config()
+    if paths is not None:
+        config["paths"] = list(paths)
+    if options is not None:
+        config["options"] = {k: v for k, v in options.items() if k not in ("plan_only", "output_mode", "instances_from_level")}
+    if destination is not None:
+        config["destination"] = destination
+    save_config(config)
+    state = _state()
+    state["config"] = config
+    if state["tick"] is not None and state["tick"][0] is _on_tick:
+        return config  # already running, now with the new config
+    # Callbacks left by a previous import of this module are swapped for this one's
+    _unhook(state)
+
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    if hasattr(registry, "on_asset_added") and hasattr(registry, "on_asset_renamed"):
+        _hook(state, registry.on_asset_added, _on_asset_added)
+        _hook(state, registry.on_asset_renamed, _on_asset_renamed)
+    else:
+        _hook(state, unreal.get_editor_subsystem(unreal.ImportSubsystem).on_asset_post_import, _on_post_import)
+    state["tick"] = (_on_tick, unreal.register_slate_post_tick_callback(_on_tick))
+    bp_queue.start()
+    log.info("👀 Watching %s for new assets.", ", ".join(config["paths"]))
+    return config
+
+
+def stop():
+    state = _state()
+    if state["tick"] is None:
+        return
+    _unhook(state)
+    state.update(pending={}, job=None, queued=0)
+
+
+def is_running():
+    return _state()["tick"] is not None
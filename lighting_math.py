@@ -0,0 +1,182 @@
+"""
+Shared lighting math for TestLight, ue_lighting_tool_pyside6_fixed and the
+timeline (lighting_timeline.py).
+
+Everything here takes scalars or NumPy arrays and broadcasts, so the same
+function maps one slider value or bakes thousands of timeline samples in a
+single call. Run this file directly for a benchmark against the scalar paths
+the tools used to compute inline.
+"""
+
+import math
+import time
+
+import numpy as np
+
+# HSV (0-1) used by the preview during sunrise (5h-8h) and sunset (18h-21h)
+SUNRISE_TOP = (0.08, 0.6, 0.9)
+SUNRISE_BOTTOM = (0.12, 0.5, 0.8)
+SUNSET_TOP = (0.85, 0.5, 0.8)
+SUNSET_BOTTOM = (0.9, 0.4, 0.7)
+
+
+# ---------------- Colour ----------------
+def normalize_rgb(rgb):
+    """0-255 colour(s), shape (..., 3) -> 0-1 floats"""
+    return np.asarray(rgb, dtype=np.float64) / 255.0
+
+
+def kelvin_to_rgb(kelvin):
+    """Colour temperature (1000K-40000K) -> 0-255 RGB, shape (..., 3).
+
+    Tanner Helland's fit of the blackbody curve; good enough for light tints.
+    """
+    t = np.clip(np.asarray(kelvin, dtype=np.float64), 1000.0, 40000.0) / 100.0
+    warm = t <= 66.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = np.where(warm, 255.0, 329.698727446 * np.power(t - 60.0, -0.1332047592))
+        g = np.where(
+            warm,
+            99.4708025861 * np.log(t) - 161.1195681661,
+            288.1221695283 * np.power(t - 60.0, -0.0755148492),
+        )
+        b = np.where(
+            t >= 66.0,
+            255.0,
+            np.where(t <= 19.0, 0.0, 138.5177312231 * np.log(t - 10.0) - 305.0447927307),
+        )
+    return np.clip(np.stack([r, g, b], axis=-1), 0.0, 255.0)
+
+
+# ---------------- Time of day ----------------
+def time_to_pitch(hours):
+    """Tool time (0-24h) -> DirectionalLight pitch in degrees (-80 at 0h, +80 at 24h)"""
+    return (np.asarray(hours, dtype=np.float64) / 24.0) * 160.0 - 80.0
+
+
+def unwrap_hours(hours):
+    """Make a sequence of hours continuous across midnight (22, 2 -> 22, 26); 12 hour steps go forward"""
+    hours = np.array(hours, dtype=np.float64)
+    if hours.size > 1:
+        step = 12.0 - (12.0 - np.diff(hours)) % 24.0
+        hours[1:] = hours[0] + np.cumsum(step)
+    return hours
+
+
+def brightness(hours):
+    """Preview brightness curve: 1 at noon, 0 at midnight"""
+    hours = np.asarray(hours, dtype=np.float64)
+    return (np.cos((hours - 12.0) / 24.0 * 2.0 * np.pi) + 1.0) / 2.0
+
+
+def sun_screen_pos(hours):
+    """Sun position in the preview as (x, y) fractions of width/height"""
+    frac = np.asarray(hours, dtype=np.float64) / 24.0
+    return frac, 0.7 - 0.5 * np.sin(frac * np.pi)
+
+
+def sky_gradient_hsv(hours, base_hsv):
+    """Top and bottom HSV of the preview sky, each shaped (..., 3).
+
+    Sunrise and sunset use fixed tints; otherwise the base sky colour is
+    darkened along the brightness curve.
+    """
+    hours = np.asarray(hours, dtype=np.float64)[..., None]
+    base = np.asarray(base_hsv, dtype=np.float64)
+    t = brightness(hours)
+    hue = np.broadcast_to(base[..., 0:1], t.shape)
+    sat = np.broadcast_to(base[..., 1:2], t.shape)
+    val = base[..., 2:3]
+    top = np.concatenate([hue, sat, val * (0.4 + 0.6 * t)], axis=-1)
+    bottom = np.concatenate([hue, sat * 0.8, val * (0.5 + 0.4 * t)], axis=-1)
+    sunrise = (hours >= 5.0) & (hours <= 8.0)
+    sunset = (hours >= 18.0) & (hours <= 21.0)
+    top = np.where(sunrise, SUNRISE_TOP, np.where(sunset, SUNSET_TOP, top))
+    bottom = np.where(sunrise, SUNRISE_BOTTOM, np.where(sunset, SUNSET_BOTTOM, bottom))
+    return top, bottom
+
+
+# ---------------- Physical sun ----------------
+def solar_position(latitude, day_of_year, hours, longitude=0.0, utc_offset=0.0):
+    """Sun elevation and azimuth in degrees (NOAA approximation).
+
+    latitude/longitude in degrees (east positive), day_of_year 1-366, hours
+    local clock time, utc_offset of the local clock in hours. Azimuth is
+    measured clockwise from north.
+    """
+    lat = np.radians(np.asarray(latitude, dtype=np.float64))
+    day = np.asarray(day_of_year, dtype=np.float64)
+    hours = np.asarray(hours, dtype=np.float64)
+
+    gamma = 2.0 * np.pi / 365.0 * (day - 1.0 + (hours - 12.0) / 24.0)
+    eq_time = 229.18 * (
+        0.000075 + 0.001868 * np.cos(gamma) - 0.032077 * np.sin(gamma)
+        - 0.014615 * np.cos(2 * gamma) - 0.040849 * np.sin(2 * gamma)
+    )
+    decl = (
+        0.006918 - 0.399912 * np.cos(gamma) + 0.070257 * np.sin(gamma)
+        - 0.006758 * np.cos(2 * gamma) + 0.000907 * np.sin(2 * gamma)
+        - 0.002697 * np.cos(3 * gamma) + 0.00148 * np.sin(3 * gamma)
+    )
+    solar_minutes = hours * 60.0 + eq_time + 4.0 * np.asarray(longitude, dtype=np.float64) - 60.0 * utc_offset
+    hour_angle = np.radians(solar_minutes / 4.0 - 180.0)
+
+    cos_zenith = np.sin(lat) * np.sin(decl) + np.cos(lat) * np.cos(decl) * np.cos(hour_angle)
+    zenith = np.arccos(np.clip(cos_zenith, -1.0, 1.0))
+    elevation = 90.0 - np.degrees(zenith)
+
+    sin_zenith = np.maximum(np.sin(zenith), 1e-9)
+    cos_az = (np.sin(decl) - np.sin(lat) * np.cos(zenith)) / (np.cos(lat) * sin_zenith)
+    azimuth = np.degrees(np.arccos(np.clip(cos_az, -1.0, 1.0)))
+    azimuth = np.where(hour_angle > 0.0, 360.0 - azimuth, azimuth)
+    return elevation, azimuth
+
+
+def sun_rotation(elevation, azimuth):
+    """Sun elevation/azimuth (degrees) -> DirectionalLight (pitch, yaw); the light points away from the sun."""
+    return -np.asarray(elevation, dtype=np.float64), (np.asarray(azimuth, dtype=np.float64) + 180.0) % 360.0
+
+
+def day_of_year(month, day):
+    """Day number (1-365) for a month/day in a non-leap year"""
+    starts = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334])
+    return starts[np.asarray(month) - 1] + np.asarray(day)
+
+
+# ---------------- Benchmark ----------------
+def _scalar_sample(hours, rgb):
+    # What TestLight/PreviewWidget computed inline, one sample at a time
+    lc = (rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+    pitch = (hours / 24.0) * 160.0 - 80.0
+    t = (math.cos((hours - 12) / 24.0 * 2 * math.pi) + 1) / 2
+    sun_y = 0.7 - 0.5 * math.sin((hours / 24.0) * math.pi)
+    return lc, pitch, t, sun_y
+
+
+def benchmark(samples=10000, repeats=5):
+    hours = np.linspace(0.0, 24.0, samples)
+    rgb = np.random.default_rng(0).integers(0, 256, size=(samples, 3))
+    rgb_list = rgb.tolist()
+    hours_list = hours.tolist()
+
+    def best(fn):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    scalar = best(lambda: [_scalar_sample(h, c) for h, c in zip(hours_list, rgb_list)])
+    vector = best(lambda: (normalize_rgb(rgb), time_to_pitch(hours), brightness(hours), sun_screen_pos(hours)))
+    print(f"{samples} samples  scalar: {scalar * 1000:.2f} ms  numpy: {vector * 1000:.2f} ms  ({scalar / vector:.1f}x)")
+
+    sky = best(lambda: sky_gradient_hsv(hours, (0.6, 0.45, 1.0)))
+    sun = best(lambda: solar_position(51.5, day_of_year(6, 21), hours))
+    kelvin = best(lambda: kelvin_to_rgb(np.linspace(1000, 12000, samples)))
+    print(f"sky gradient: {sky * 1000:.2f} ms  solar position: {sun * 1000:.2f} ms  kelvin->rgb: {kelvin * 1000:.2f} ms")
+    return scalar, vector
+
+
+if __name__ == "__main__":
+    benchmark()
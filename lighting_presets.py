@@ -0,0 +1,162 @@
+"""
+Lighting preset library shared by TestLight and ue_lighting_tool_pyside6_fixed.
+
+Each preset is a small JSON file; a SQLite catalogue next to them indexes
+name, owning tool, modification time and a PNG thumbnail, so listing presets
+never touches the JSON files. File names are the sanitised name plus a short
+hash of the exact name, so "a b", "a_b" and "a/b" never share a file; the
+display name lives in the catalogue and the JSON. Loaded presets are cached in memory until their
+file changes, and diff_state() lets the scene facades write only the values
+that differ from what they last wrote.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+
+from PySide6 import QtCore
+
+try:
+    import unreal
+    UNREAL_AVAILABLE = True
+except Exception:
+    UNREAL_AVAILABLE = False
+
+
+def default_preset_dir():
+    if UNREAL_AVAILABLE:
+        return os.path.join(unreal.Paths.project_saved_dir(), "LightingPresets")
+    return os.path.join(os.path.expanduser("~"), ".ue_lighting_tool", "presets")
+
+
+def _normalise(value):
+    # JSON hands back lists; the tools pass tuples
+    if isinstance(value, list):
+        return tuple(_normalise(v) for v in value)
+    return value
+
+
+def diff_state(current, target):
+    """Return the entries of target that differ from (or are missing in) current."""
+    changed = {}
+    for key, value in target.items():
+        value = _normalise(value)
+        if key not in current or _normalise(current[key]) != value:
+            changed[key] = value
+    return changed
+
+
+def pixmap_to_png(pixmap):
+    data = QtCore.QByteArray()
+    buf = QtCore.QBuffer(data)
+    buf.open(QtCore.QIODevice.WriteOnly)
+    pixmap.save(buf, "PNG")
+    buf.close()
+    return bytes(data)
+
+
+# ---------------- Preset Store ----------------
+class PresetStore:
+    """JSON presets indexed by a SQLite catalogue"""
+    def __init__(self, tool, root=None):
+        self.tool = tool
+        self.root = root or default_preset_dir()
+        os.makedirs(self.root, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(self.root, "catalogue.db"))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS presets ("
+            " tool TEXT NOT NULL, name TEXT NOT NULL, file TEXT NOT NULL,"
+            " modified REAL NOT NULL, thumbnail BLOB,"
+            " PRIMARY KEY (tool, name))"
+        )
+        self.db.commit()
+        self._cache = {}  # name -> (modified, values)
+
+    def _file_for(self, name):
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "preset"
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.root, f"{self.tool}__{safe}_{digest}.json")
+
+    def names(self):
+        rows = self.db.execute("SELECT name FROM presets WHERE tool = ? ORDER BY name", (self.tool,))
+        return [r[0] for r in rows]
+
+    def save(self, name, values, thumbnail_png=None):
+        path = self._file_for(name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"name": name, "tool": self.tool, "values": values}, f, indent=2)
+        previous = self.db.execute(
+            "SELECT file FROM presets WHERE tool = ? AND name = ?", (self.tool, name)
+        ).fetchone()
+        if previous and previous[0] != path:
+            self._drop_file(previous[0], name)
+        modified = os.path.getmtime(path)
+        self.db.execute(
+            "INSERT OR REPLACE INTO presets (tool, name, file, modified, thumbnail) VALUES (?, ?, ?, ?, ?)",
+            (self.tool, name, path, modified, thumbnail_png),
+        )
+        self.db.commit()
+        self._cache[name] = (modified, {k: _normalise(v) for k, v in values.items()})
+
+    def load(self, name):
+        row = self.db.execute(
+            "SELECT file, modified FROM presets WHERE tool = ? AND name = ?", (self.tool, name)
+        ).fetchone()
+        if row is None:
+            return None
+        path, modified = row
+        try:
+            on_disk = os.path.getmtime(path)
+        except OSError:
+            return None
+        cached = self._cache.get(name)
+        if cached and cached[0] == on_disk:
+            return dict(cached[1])
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                values = json.load(f)["values"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if on_disk != modified:
+            # Edited by hand since it was catalogued
+            self.db.execute(
+                "UPDATE presets SET modified = ? WHERE tool = ? AND name = ?", (on_disk, self.tool, name)
+            )
+            self.db.commit()
+        values = {k: _normalise(v) for k, v in values.items()}
+        self._cache[name] = (on_disk, values)
+        return dict(values)
+
+    def thumbnail(self, name):
+        row = self.db.execute(
+            "SELECT thumbnail FROM presets WHERE tool = ? AND name = ?", (self.tool, name)
+        ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, name):
+        row = self.db.execute(
+            "SELECT file FROM presets WHERE tool = ? AND name = ?", (self.tool, name)
+        ).fetchone()
+        if row is None:
+            return False
+        self._drop_file(row[0], name)
+        self.db.execute("DELETE FROM presets WHERE tool = ? AND name = ?", (self.tool, name))
+        self.db.commit()
+        self._cache.pop(name, None)
+        return True
+
+    def _drop_file(self, path, name):
+        # Files named before the hash suffix could be shared by several presets
+        shared = self.db.execute(
+            "SELECT count(*) FROM presets WHERE file = ? AND NOT (tool = ? AND name = ?)", (path, self.tool, name)
+        ).fetchone()[0]
+        if not shared:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,165 @@
+"""
+Time-of-day timeline for the UE Lighting Tool (TestLight).
+
+Keyframes hold sun colour, sky colour, intensity, time of day and atmospherics.
+The timeline bakes them into lookup tables (one NumPy array per channel, one
+row per frame), so scrubbing or playing back only indexes into arrays.
+
+TimelinePlayer is driven by a frame-locked QTimer: the frame shown is derived
+from wall-clock time (late ticks drop frames instead of drifting) and each
+frame goes through the facade's apply_changes(), so only channels that differ
+from the cached scene state are sent to Unreal.
+"""
+
+import numpy as np
+from PySide6 import QtCore
+
+from lighting_math import unwrap_hours
+
+# channel name -> number of components per frame
+CHANNELS = {
+    "sun": 3,
+    "sky": 3,
+    "intensity": 1,
+    "time": 1,
+    "atmos": 1,
+}
+
+# LUT values are rounded to what the engine can meaningfully show, so
+# "changed since last frame" is an exact comparison.
+_DECIMALS = {
+    "sun": 0,
+    "sky": 0,
+    "intensity": 0,
+    "time": 2,
+    "atmos": 3,
+}
+
+
+# ---------------- Keyframes + baking ----------------
+class Timeline:
+    """Keyframed lighting values baked into per-frame lookup tables"""
+    def __init__(self, duration=24.0, fps=30):
+        self.duration = float(duration)
+        self.fps = int(fps)
+        self.keys = {}  # seconds -> {channel: tuple}
+        self._luts = None
+
+    @property
+    def frame_count(self):
+        return int(round(self.duration * self.fps)) + 1
+
+    def frame_to_seconds(self, frame):
+        return frame / float(self.fps)
+
+    def seconds_to_frame(self, seconds):
+        return max(0, min(self.frame_count - 1, int(round(seconds * self.fps))))
+
+    def set_key(self, seconds, sun, sky, intensity, time_hours, atmos):
+        seconds = min(max(float(seconds), 0.0), self.duration)
+        self.keys[seconds] = {
+            "sun": tuple(float(c) for c in sun),
+            "sky": tuple(float(c) for c in sky),
+            "intensity": (float(intensity),),
+            "time": (float(time_hours),),
+            "atmos": (float(atmos),),
+        }
+        self._luts = None
+
+    def remove_key(self, seconds):
+        if self.keys.pop(float(seconds), None) is not None:
+            self._luts = None
+
+    def clear(self):
+        self.keys.clear()
+        self._luts = None
+
+    def bake(self):
+        """Interpolate every channel for every frame in one vectorised pass."""
+        if not self.keys:
+            self._luts = None
+            return None
+        times = np.array(sorted(self.keys), dtype=np.float64)
+        frame_times = np.arange(self.frame_count, dtype=np.float64) / self.fps
+        luts = {}
+        for channel, width in CHANNELS.items():
+            values = np.array([self.keys[t][channel] for t in times], dtype=np.float64).reshape(len(times), width)
+            if channel == "time":
+                # Keyframes 22h -> 2h should pass midnight, not rewind through noon
+                values[:, 0] = unwrap_hours(values[:, 0])
+            lut = np.empty((self.frame_count, width), dtype=np.float64)
+            for col in range(width):
+                lut[:, col] = np.interp(frame_times, times, values[:, col])
+            if channel == "time":
+                lut %= 24.0
+            luts[channel] = np.round(lut, _DECIMALS[channel])
+        self._luts = luts
+        return luts
+
+    def sample(self, frame):
+        """Return {channel: value} for a frame; colours as int tuples, scalars as floats."""
+        if self._luts is None and self.bake() is None:
+            return None
+        frame = max(0, min(self.frame_count - 1, int(frame)))
+        out = {}
+        for channel, lut in self._luts.items():
+            row = lut[frame]
+            if CHANNELS[channel] == 1:
+                out[channel] = float(row[0])
+            else:
+                out[channel] = tuple(int(c) for c in row)
+        return out
+
+
+# ---------------- Playback ----------------
+class TimelinePlayer(QtCore.QObject):
+    """Frame-locked playback that hands each frame to facade.apply_changes()"""
+    frame_changed = QtCore.Signal(int, dict)
+
+    def __init__(self, timeline, facade=None, parent=None):
+        super().__init__(parent)
+        self.timeline = timeline
+        self.facade = facade
+        self.frame = 0
+        self.loop = True
+        self._start_frame = 0
+        self._clock = QtCore.QElapsedTimer()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def is_playing(self):
+        return self._timer.isActive()
+
+    def play(self):
+        if self.timeline.sample(self.frame) is None:
+            return False
+        self._start_frame = self.frame
+        self._clock.start()
+        self._timer.start(max(1, int(1000 / self.timeline.fps)))
+        return True
+
+    def stop(self):
+        self._timer.stop()
+
+    def seek(self, frame):
+        values = self.timeline.sample(frame)
+        if values is None:
+            return
+        self.frame = max(0, min(self.timeline.frame_count - 1, int(frame)))
+        if self.facade is not None:
+            self.facade.apply_changes(values)
+        self.frame_changed.emit(self.frame, values)
+
+    def _tick(self):
+        count = self.timeline.frame_count
+        elapsed_frames = int(self._clock.elapsed() * self.timeline.fps / 1000)
+        frame = self._start_frame + elapsed_frames
+        if frame >= count:
+            if not self.loop:
+                self.stop()
+                self.seek(count - 1)
+                return
+            frame %= count
+        if frame != self.frame:
+            self.seek(frame)
@@ -0,0 +1,92 @@
+"""
+Declarative editor menu registration for the Blueprint Generator tools.
+
+A module describes its menu entries as a list of dicts and hands them to
+register_manifest() in one call:
+
+    MENU_ENTRIES = [
+        {"menu": "LevelEditor.MainMenu.Tools", "section": "BlueprintGenerator",
+         "name": "GenerateBlueprints", "label": "Generate Blueprints",
+         "tooltip": "...", "command": "import BPGenerator_07; BPGenerator_07.launch_window()"},
+        {"menu": "LevelEditor.MainMenu", "section": "PythonTools",
+         "name": "BlueprintGenerator", "label": "Blueprint Generator", "submenu": True},
+    ]
+    menu_manifest.register_manifest("MyTool", MENU_ENTRIES)
+
+All entries are added in a batch followed by a single refresh_all_widgets().
+What was registered is remembered per owner outside the calling module, so
+re-running or hot-reloading a script with an unchanged manifest does nothing,
+and entries dropped from a manifest are removed instead of left behind.
+"""
+
+import hashlib
+import json
+
+import unreal
+
+import menu_registry
+import tool_log
+
+log = tool_log.get_logger("Menus")
+
+# Kept on the unreal module so it survives importlib.reload() of this module
+# and re-running the tool scripts: owner -> (signature, [(menu, section, name)])
+_STATE_ATTR = "_bpg_registered_menu_manifests"
+
+
+def _registered():
+    state = getattr(unreal, _STATE_ATTR, None)
+    if state is None:
+        state = {}
+        setattr(unreal, _STATE_ATTR, state)
+    return state
+
+
+def _signature(entries):
+    return hashlib.sha1(json.dumps(entries, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _add_entry(tool_menus, owner, spec):
+    menu = menu_registry.find_menu(spec["menu"]) or tool_menus.extend_menu(spec["menu"])
+    if spec.get("submenu"):
+        menu.add_sub_menu(owner, spec["section"], spec["name"], spec["label"], spec.get("tooltip", ""))
+        return
+    entry = unreal.ToolMenuEntry(name=spec["name"], type=unreal.MultiBlockType.MENU_ENTRY)
+    entry.set_label(spec["label"])
+    entry.set_tool_tip(spec.get("tooltip", ""))
+    entry.set_string_command(unreal.ToolMenuStringCommandType.PYTHON, "", spec["command"])
+    menu.add_menu_entry(spec["section"], entry)
+
+
+def register_manifest(owner, entries, force=False):
+    """Register all entries of a manifest; returns False when it was already up to date."""
+    registered = _registered()
+    signature = _signature(entries)
+    previous = registered.get(owner)
+    if previous and previous[0] == signature and not force:
+        return False
+
+    tool_menus = unreal.ToolMenus.get()
+    keys = [(e["menu"], e["section"], e["name"]) for e in entries]
+    for stale in set(previous[1] if previous else ()) - set(keys):
+        tool_menus.remove_entry(*stale)
+    for spec in entries:
+        try:
+            _add_entry(tool_menus, owner, spec)
+        except Exception as e:
+            log.warning("Could not register menu entry %s: %s", spec.get("name"), e)
+    tool_menus.refresh_all_widgets()
+
+    registered[owner] = (signature, keys)
+    return True
+
+
+def unregister_manifest(owner):
+    previous = _registered().pop(owner, None)
+    if not previous:
+        return False
+    tool_menus = unreal.ToolMenus.get()
+    for key in previous[1]:
+        tool_menus.remove_entry(*key)
+    tool_menus.refresh_all_widgets()
+    return True
@@ -0,0 +1,59 @@
+"""
+Registered ToolMenus explorer for the Blueprint Generator scripts.
+
+Menus are discovered by iterating the live ToolMenu objects once, instead of
+probing guessed transient paths ("/Engine/Transient.ToolMenu_0:RegisteredMenu_N")
+with unreal.find_object. The name -> menu map is cached; lookups and prefix
+searches after the first call are dictionary/bisect operations.
+"""
+
+import bisect
+
+import unreal
+
+_menus = None        # menu name -> ToolMenu
+_sorted_names = []   # sorted keys of _menus, for prefix search
+
+
+def refresh():
+    """Rebuild the cache in one pass over all ToolMenu objects."""
+    global _menus, _sorted_names
+    menus = {}
+    for menu in unreal.ObjectIterator(unreal.ToolMenu):
+        name = str(menu.menu_name)
+        if name == "None":
+            continue
+        menus[name] = menu
+    _menus = menus
+    _sorted_names = sorted(menus)
+    return _menus
+
+
+def get_menus(refresh_cache=False):
+    if _menus is None or refresh_cache:
+        refresh()
+    return _menus
+
+
+def find_menu(name):
+    """Cached lookup; falls back to ToolMenus for menus registered after the last refresh."""
+    menus = get_menus()
+    menu = menus.get(name)
+    if menu is None:
+        menu = unreal.ToolMenus.get().find_menu(name)
+        if menu is not None:
+            menus[name] = menu
+            bisect.insort(_sorted_names, name)
+    return menu
+
+
+def search_menus(prefix=""):
+    """All registered menu names starting with prefix, e.g. 'LevelEditor.MainMenu'."""
+    get_menus()
+    start = bisect.bisect_left(_sorted_names, prefix)
+    found = []
+    for name in _sorted_names[start:]:
+        if not name.startswith(prefix):
+            break
+        found.append(name)
+    return found
@@ -0,0 +1,105 @@
+"""
+Shared fixtures for the tool tests.
+
+The editor's ``unreal`` module doesn't exist outside Unreal, so a stand-in is
+put in sys.modules before any tool module is imported. Attributes are
+MagicMocks created on first use; the few names the tools use as types
+(isinstance checks, default arguments) are real classes. Private names
+raise AttributeError like the real module, so state the tools keep on
+``unreal`` (``_bpg_*``) starts out missing in every test.
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+class FakeUnreal(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = mock.MagicMock(name=f"unreal.{name}")
+        setattr(self, name, value)
+        return value
+
+
+class Name(str):
+    pass
+
+
+unreal = FakeUnreal("unreal")
+unreal.Name = Name
+for _type in ("Actor", "StaticMesh", "StaticMeshActor", "StaticMeshComponent", "SkeletalMesh"):
+    setattr(unreal, _type, type(_type, (), {}))
+sys.modules["unreal"] = unreal
+
+ticks = {}  # handle -> callback, for the slate ticks currently registered
+
+
+def _register_tick(fn):
+    handle = max(ticks, default=0) + 1
+    ticks[handle] = fn
+    return handle
+
+
+unreal.register_slate_post_tick_callback = _register_tick
+unreal.unregister_slate_post_tick_callback = lambda handle: ticks.pop(handle, None)
+
+
+@pytest.fixture(autouse=True)
+def fake_unreal(tmp_path):
+    """The stand-in unreal module, with Saved/ under tmp_path and no state left from other tests."""
+    for name in [n for n in vars(unreal) if n.startswith("_bpg")]:
+        delattr(unreal, name)
+    unreal.Paths.project_saved_dir.return_value = str(tmp_path)
+    unreal.EditorAssetLibrary.reset_mock(return_value=True, side_effect=True)
+    unreal.AssetRegistryHelpers.reset_mock(return_value=True, side_effect=True)
+    ticks.clear()
+    return unreal
+
+
+class AssetData:
+    """Just enough of unreal.AssetData for the registry-only code paths"""
+    def __init__(self, object_path, asset_class="StaticMesh", tags=None):
+        package, self.asset_name = object_path.split(".", 1)
+        self.package_name = package
+        self.asset_class_path = types.SimpleNamespace(package_name="/Script/Engine", asset_name=asset_class)
+        self.tags = tags or {}
+
+    def get_tag_value(self, tag):
+        return self.tags.get(tag)
+
+    def is_valid(self):
+        return True
+
+
+class Asset:
+    """A loaded asset: path, name and class path"""
+    def __init__(self, object_path, class_path="/Script/Engine.StaticMesh"):
+        self.path = object_path
+        self.class_path = class_path
+
+    def get_path_name(self):
+        return self.path
+
+    def get_name(self):
+        return self.path.rsplit(".", 1)[-1]
+
+    def get_class(self):
+        return types.SimpleNamespace(get_path_name=lambda: self.class_path, get_name=lambda: self.class_path.rsplit(".", 1)[-1])
+
+
+def load_script(name):
+    """Import one of the tool scripts that have no .py extension (TestLight)."""
+    loader = importlib.machinery.SourceFileLoader(name, os.path.join(ROOT, name))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,98 @@
+import types
+from unittest import mock
+
+import pytest
+
+import bp_audit
+import bp_manifest
+
+ROCK = "/Game/M/Rock.Rock"
+BP = "/Game/GeneratedBlueprints/Rock_BP.Rock_BP"
+
+
+class Mesh:
+    def __init__(self, path):
+        self.path = path
+
+    def get_path_name(self):
+        return self.path
+
+
+class Component(bp_audit.unreal.StaticMeshComponent):
+    def __init__(self, name, mesh, x=0.0, yaw=0.0):
+        self.name = name
+        self.props = {
+            "static_mesh": Mesh(mesh) if mesh else None,
+            "relative_location": types.SimpleNamespace(x=x, y=0.0, z=0.0),
+            "relative_rotation": types.SimpleNamespace(roll=0.0, pitch=0.0, yaw=yaw),
+            "relative_scale3d": types.SimpleNamespace(x=1.0, y=1.0, z=1.0),
+        }
+
+    def get_name(self):
+        return self.name
+
+    def get_editor_property(self, name):
+        return self.props[name]
+
+
+@pytest.fixture
+def blueprint(fake_unreal, monkeypatch, tmp_path):
+    """Install a Blueprint whose component tree is the components passed to the returned function."""
+    fake_unreal.Paths.convert_relative_path_to_full.return_value = str(tmp_path)
+
+    def build(*components):
+        handles = ["root"] + [f"h{i}" for i in range(len(components))]
+        by_handle = dict(zip(handles[1:], components))
+        bfl = mock.Mock()
+        bfl.get_data.side_effect = lambda handle: handle
+        bfl.get_object.side_effect = by_handle.get
+        monkeypatch.setattr(fake_unreal, "SubobjectDataBlueprintFunctionLibrary", bfl)
+        subsystem = mock.Mock()
+        subsystem.k2_gather_subobject_data_for_blueprint.return_value = handles
+        return subsystem
+    return build
+
+
+def per_asset_manifest(bp_path=BP):
+    manifest = bp_manifest.load_manifest()
+    bp_manifest.record_blueprint(manifest, bp_path, ROCK, "/Script/Engine.StaticMesh", {})
+    return manifest
+
+
+def kinds(record):
+    return [f["kind"] for f in record["findings"]]
+
+
+def test_stacked_copies_of_the_mesh_are_duplicates(blueprint):
+    subsystem = blueprint(Component("A", ROCK), Component("B", ROCK), Component("C", ROCK))
+    record = bp_audit.inspect_blueprint(BP, per_asset_manifest(), subsystem)
+    assert kinds(record) == ["duplicate", "duplicate"]
+
+
+def test_same_mesh_in_other_places_is_not_a_duplicate(blueprint):
+    subsystem = blueprint(Component("A", ROCK), Component("B", ROCK, x=200.0), Component("C", ROCK, yaw=90.0))
+    record = bp_audit.inspect_blueprint(BP, per_asset_manifest(), subsystem)
+    assert kinds(record) == []
+
+
+def test_harvested_blueprints_are_never_inspected(blueprint, fake_unreal):
+    harvested = "/Game/GeneratedBlueprints/Harvest_Fence_BP.Harvest_Fence_BP"
+    subsystem = blueprint(Component("A", ROCK), Component("B", ROCK), Component("C", ROCK))
+    manifest = bp_manifest.load_manifest()
+    bp_manifest.record_consolidated(manifest, harvested, [ROCK], {"output_mode": "harvest"})
+    for bp_path in (harvested, "/Game/GeneratedBlueprints/Manual_BP.Manual_BP"):
+        record = bp_audit.inspect_blueprint(bp_path, manifest, subsystem)
+        assert record["skipped"] and record["findings"] == []
+    fake_unreal.EditorAssetLibrary.load_asset.assert_not_called()
+
+
+def test_meshless_component_next_to_the_mesh_is_an_orphan(blueprint):
+    subsystem = blueprint(Component("Empty", None), Component("Rock", ROCK))
+    assert kinds(bp_audit.inspect_blueprint(BP, per_asset_manifest(), subsystem)) == ["orphan"]
+
+
+def test_missing_mesh_is_restored_from_the_manifest_source(blueprint):
+    subsystem = blueprint(Component("Empty", None))
+    record = bp_audit.inspect_blueprint(BP, per_asset_manifest(), subsystem)
+    assert kinds(record) == ["missing_mesh"]
+    assert record["findings"][0]["source"] == ROCK
@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+import bp_dashboard
+import bp_handlers
+import bp_queue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    q = bp_queue.JobQueue(os.path.join(str(tmp_path), "jobs.db"))
+    monkeypatch.setitem(bp_queue._state, "queue", q)
+    yield q
+    q.close()
+
+
+def test_ring_keeps_the_newest_values_in_order():
+    ring = bp_dashboard.Ring(3)
+    assert ring.values() == [] and ring.last() == 0.0
+    for value in (1.0, 2.0, 3.0, 4.0):
+        ring.push(value)
+    assert ring.values() == [2.0, 3.0, 4.0] and ring.last() == 4.0
+
+
+def test_report_covers_only_what_ran_since_the_sampler_started(queue, monkeypatch):
+    totals = {"save": [10, 100.0], "compile": [10, 300.0]}
+    monkeypatch.setattr(bp_handlers, "STAGE_TOTALS", totals)
+    sampler = bp_dashboard.Sampler()
+    totals["save"] = [14, 140.0]
+    totals["compile"] = [14, 420.0]
+    queue.enqueue("job", ["/Game/M/Rock.Rock"], {})
+    sampler.sample()
+
+    report = sampler.report()
+    assert report["assets"] == 4
+    assert report["stages"]["compile"] == {"count": 4, "total_ms": 120.0, "mean_ms": 30.0, "share_pct": 75.0}
+    assert report["stages"]["load"]["mean_ms"] is None
+    assert report["queue"]["pending"] == 1
+    assert report["series"]["compile_ms"] == [30.0]
+
+
+def test_export_report_writes_json_under_saved(queue, tmp_path):
+    path = bp_dashboard.export_report(bp_dashboard.Sampler())
+    assert path.startswith(str(tmp_path))
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f)["assets"] == 0
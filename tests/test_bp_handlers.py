@@ -0,0 +1,90 @@
+import pytest
+
+import bp_handlers
+import bp_manifest
+import bp_scc
+from conftest import Asset, AssetData
+
+
+class Blueprint:
+    def __init__(self, path):
+        self.path = path
+
+    def get_path_name(self):
+        return self.path
+
+
+@pytest.fixture
+def handler(fake_unreal, monkeypatch):
+    """The StaticMesh handler with Blueprint creation replaced; records the folder of each create."""
+    handler = bp_handlers.HANDLERS["/Script/Engine.StaticMesh"]
+    created = []
+
+    def create_blueprint(asset, template, folder):
+        created.append((asset.get_path_name(), folder))
+        path = handler.blueprint_path(asset, folder)
+        return Blueprint(path), "Created."
+
+    monkeypatch.setattr(handler, "make_template", lambda options: {"options": options, "timings": {}, "failed_settings": set()})
+    monkeypatch.setattr(handler, "create_blueprint", create_blueprint)
+    monkeypatch.setattr(handler, "accepts", lambda asset: True)
+    monkeypatch.setattr(bp_scc, "provider", lambda: None)
+    handler.created = created
+    return handler
+
+
+def test_generate_sources_attributes_outcomes_by_source_path(fake_unreal, handler):
+    existing = {"/Game/A/Rock.Rock", "/Game/B/Rock.Rock"}
+    loads = []
+    fake_unreal.EditorAssetLibrary.find_asset_data.side_effect = lambda path: AssetData(path) if path in existing else None
+    fake_unreal.EditorAssetLibrary.load_asset.side_effect = lambda path: loads.append(path) or Asset(path)
+
+    steps = bp_handlers.generate_sources(
+        ["/Game/A/Rock.Rock", "/Game/B/Rock.Rock", "/Game/C/Gone.Gone"], {"layout": "mirror"}, "/Game/BP", chunk_size=1
+    )
+    done, total, outcomes = next(steps)
+    assert (done, total) == (1, 3)
+    assert outcomes == [("/Game/C/Gone.Gone", None, bp_handlers.MISSING_SOURCE)]
+    assert loads == []  # nothing is loaded before the first chunk runs
+
+    done, _, outcomes = next(steps)
+    assert done == 2 and loads == ["/Game/A/Rock.Rock"]
+    assert [(source, bp.get_path_name()) for source, bp, _ in outcomes] == [("/Game/A/Rock.Rock", "/Game/BP/A/Rock_BP.Rock_BP")]
+
+    done, _, outcomes = next(steps)
+    assert done == 3
+    assert [(source, bp.get_path_name()) for source, bp, _ in outcomes] == [("/Game/B/Rock.Rock", "/Game/BP/B/Rock_BP.Rock_BP")]
+    with pytest.raises(StopIteration):
+        next(steps)
+
+    manifest = bp_manifest.load_manifest()
+    assert manifest["sources"] == {
+        "/Game/A/Rock.Rock": ["/Game/BP/A/Rock_BP.Rock_BP"],
+        "/Game/B/Rock.Rock": ["/Game/BP/B/Rock_BP.Rock_BP"],
+    }
+
+
+def test_generate_sources_reports_unhandled_classes(fake_unreal, handler):
+    fake_unreal.EditorAssetLibrary.find_asset_data.side_effect = lambda path: AssetData(path, asset_class="DataTable")
+    steps = bp_handlers.generate_sources(["/Game/D/Table.Table"], {}, "/Game/BP")
+    assert next(steps)[2] == [("/Game/D/Table.Table", None, bp_handlers.NO_HANDLER)]
+    assert list(steps) == []
+    assert handler.created == []
+
+
+def test_generate_sources_uses_the_callers_batch(fake_unreal, handler):
+    fake_unreal.EditorAssetLibrary.find_asset_data.side_effect = AssetData
+    fake_unreal.EditorAssetLibrary.load_asset.side_effect = Asset
+    provider = bp_scc.FakeProvider()
+    batch = bp_scc.SourceControlBatch([], "/Game/BP", scc=provider)
+    list(bp_handlers.generate_sources(["/Game/A/Rock.Rock"], {}, "/Game/BP", scc=batch))
+    assert batch.targets == ["/Game/BP/Rock_BP"]
+    assert provider.submitted == [] and batch.to_add == ["/Game/BP/Rock_BP"]  # left for the caller to finish
+
+
+def test_generate_sources_uses_planned_folders(fake_unreal, handler):
+    fake_unreal.EditorAssetLibrary.find_asset_data.side_effect = AssetData
+    fake_unreal.EditorAssetLibrary.load_asset.side_effect = Asset
+    options = {"layout": "mirror", "folders": {"/Game/A/Rock.Rock": "/Game/BP/Planned"}}
+    list(bp_handlers.generate_sources(["/Game/A/Rock.Rock", "/Game/B/Tree.Tree"], options, "/Game/BP"))
+    assert handler.created == [("/Game/A/Rock.Rock", "/Game/BP/Planned"), ("/Game/B/Tree.Tree", "/Game/BP/B")]
@@ -0,0 +1,81 @@
+import bp_harvest
+
+
+class Mesh:
+    def __init__(self, path):
+        self.path = path
+
+    def get_path_name(self):
+        return self.path
+
+
+ROCK, TREE = Mesh("/Game/M/Rock.Rock"), Mesh("/Game/M/Tree.Tree")
+
+
+def record(mesh, x, y=0.0, z=0.0, yaw=0.0, materials=()):
+    return (None, mesh, (x, y, z), (0.0, 0.0, yaw), (1.0, 1.0, 1.0), materials)
+
+
+def test_actors_within_radius_are_clustered_transitively():
+    records = [record(ROCK, 0), record(TREE, 90), record(ROCK, 180), record(ROCK, 5000)]
+    clusters = bp_harvest.cluster_records(records, radius=100.0, min_size=2)
+    assert sorted(sorted(c) for c in clusters) == [[0, 1, 2]]
+
+
+def test_small_clusters_are_dropped():
+    records = [record(ROCK, 0), record(TREE, 50), record(ROCK, 5000)]
+    assert bp_harvest.cluster_records(records, radius=100.0, min_size=3) == []
+    assert sorted(len(c) for c in bp_harvest.cluster_records(records, radius=100.0, min_size=1)) == [1, 2]
+
+
+def test_clusters_across_grid_cells():
+    # Neighbouring cells are searched, so a pair straddling a cell edge still joins
+    records = [record(ROCK, 99.0, 99.0), record(TREE, 101.0, 101.0)]
+    assert len(bp_harvest.cluster_records(records, radius=100.0, min_size=2)) == 1
+
+
+def test_equal_layouts_share_a_signature_wherever_they_are():
+    records = [record(ROCK, 0), record(TREE, 50), record(ROCK, 1000), record(TREE, 1050)]
+    pivot_a, sig_a = bp_harvest.cluster_layout(records, [0, 1])
+    pivot_b, sig_b = bp_harvest.cluster_layout(records, [3, 2])
+    assert sig_a == sig_b
+    assert pivot_a == (25, 0, 0) and pivot_b == (1025, 0, 0)
+
+
+def test_rotated_layouts_differ():
+    records = [record(ROCK, 0), record(TREE, 50), record(ROCK, 1000, yaw=90.0), record(TREE, 1050)]
+    assert bp_harvest.cluster_layout(records, [0, 1])[1] != bp_harvest.cluster_layout(records, [2, 3])[1]
+
+
+def test_patterns_group_clusters_by_signature():
+    records = [record(ROCK, 0), record(TREE, 50), record(ROCK, 1000), record(TREE, 1050), record(ROCK, 3000), record(ROCK, 3050)]
+    clusters = bp_harvest.cluster_records(records, radius=100.0, min_size=2)
+    patterns = bp_harvest._patterns(records, clusters)
+    assert sorted(len(uses) for uses in patterns.values()) == [1, 2]
+
+
+def test_blueprints_are_built_from_exact_transforms():
+    records = [record(ROCK, 0.0, yaw=22.5), record(TREE, 500.3)]
+    pivot, parts = bp_harvest.cluster_parts(records, [0, 1])
+    assert pivot == (250.15, 0.0, 0.0)
+    assert parts[0][1] == (-250.15, 0.0, 0.0) and parts[0][2] == (0.0, 0.0, 22.5)
+    # The signature is rounded, but only to group clusters
+    assert bp_harvest.cluster_layout(records, [0, 1])[0] == pivot
+
+
+def test_override_materials_are_part_of_the_layout():
+    red, blue = ("/Game/Mat/Red.Red",), ("/Game/Mat/Blue.Blue",)
+    records = [record(ROCK, 0, materials=red), record(TREE, 50), record(ROCK, 1000, materials=blue), record(TREE, 1050)]
+    assert bp_harvest.cluster_layout(records, [0, 1])[1] != bp_harvest.cluster_layout(records, [2, 3])[1]
+    _, parts = bp_harvest.cluster_parts(records, [0, 1])
+    assert parts[0][4] == red
+
+
+def test_names_picked_in_one_run_never_repeat():
+    class AssetTools:
+        def create_unique_asset_name(self, base, suffix):
+            return base, base.rsplit("/", 1)[-1]  # nothing exists yet
+
+    rock_layout = (("/Game/M/Rock.Rock", (0, 0, 0), (0, 0, 0), (1.0, 1.0, 1.0), ()),)
+    rotated = (("/Game/M/Rock.Rock", (0, 0, 0), (0, 0, 90), (1.0, 1.0, 1.0), ()),)
+    assert bp_harvest._blueprint_names([rock_layout, rotated], "/Game/BP", AssetTools()) == ["Harvest_Rock_BP", "Harvest_Rock_1_BP"]
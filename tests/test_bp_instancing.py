@@ -0,0 +1,20 @@
+import bp_instancing
+from conftest import unreal
+
+
+def mesh(path):
+    m = unreal.StaticMesh()
+    m.get_path_name = lambda: path
+    return m
+
+
+def test_plan_only_never_creates_assets(fake_unreal):
+    bp, report = bp_instancing.consolidate([mesh("/Game/M/Rock.Rock")], {"plan_only": True})
+    assert bp is None and "plan only" in report["error"]
+    fake_unreal.AssetToolsHelpers.get_asset_tools.return_value.create_asset.assert_not_called()
+    fake_unreal.EditorAssetLibrary.save_loaded_asset.assert_not_called()
+
+
+def test_nothing_to_consolidate():
+    bp, report = bp_instancing.consolidate([object()], {})
+    assert bp is None and report == {"error": "No static meshes to consolidate."}
@@ -0,0 +1,69 @@
+import collections
+
+import pytest
+
+import bp_layout
+
+
+def test_flat_keeps_everything_in_the_root():
+    assert bp_layout.assign(["/Game/A/Rock.Rock"], "/Game/BP", {}) == {"/Game/A/Rock.Rock": "/Game/BP"}
+
+
+def test_hash_buckets_fit_the_fanout():
+    folders = bp_layout.assign(["/Game/A/Rock.Rock", "/Game/B/rock.rock"], "/Game/BP", {"layout": "hash", "max_fanout": 256}, 20000)
+    folder = folders["/Game/A/Rock.Rock"]
+    assert folder.startswith("/Game/BP/") and len(folder.split("/")[-1]) == 2
+    # Bucketed by name, case-insensitively
+    assert folders["/Game/B/rock.rock"] == folder
+
+
+def test_hash_shape_follows_the_asset_count():
+    assert bp_layout.hash_shape(100, 500) == (1,)
+    assert bp_layout.hash_shape(20000, 500) == (2,)
+    assert bp_layout.hash_shape(20000, 16) == (1, 1, 1)
+    assert bp_layout.hash_shape(200000, 500) == (2, 1)
+
+
+@pytest.mark.parametrize("fanout", [16, 100, 500])
+def test_hash_leaves_stay_under_the_fanout(fanout):
+    sources = [f"/Game/M/SM_{i}.SM_{i}" for i in range(20000)]
+    folders = bp_layout.assign(sources, "/Game/BP", {"layout": "hash", "max_fanout": fanout})
+    sizes = collections.Counter(folders.values())
+    assert max(sizes.values()) <= fanout
+    # Not thousands of near-empty folders either
+    assert sum(sizes.values()) / len(sizes) >= fanout / 32.0
+
+
+def test_hash_bucket_only_moves_at_a_capacity_step():
+    source = "/Game/M/SM_Rock.SM_Rock"
+    folder = bp_layout.assign([source], "/Game/BP", {"layout": "hash"}, 1000)[source]
+    assert bp_layout.assign([source], "/Game/BP", {"layout": "hash"}, 3000)[source] == folder
+
+
+def test_mirror_follows_source_folders(fake_unreal):
+    registry = fake_unreal.AssetRegistryHelpers.get_asset_registry.return_value
+    registry.get_assets_by_path.return_value = ["asset"] * 3
+    folders = bp_layout.assign(["/Game/Props/Rock.Rock", "/Game/Rock2.Rock2"], "/Game/BP", {"layout": "mirror"})
+    assert folders == {"/Game/Props/Rock.Rock": "/Game/BP/Props", "/Game/Rock2.Rock2": "/Game/BP"}
+
+
+def test_mirror_splits_folders_over_the_fanout(fake_unreal):
+    registry = fake_unreal.AssetRegistryHelpers.get_asset_registry.return_value
+    registry.get_assets_by_path.return_value = ["asset"] * 25
+    sources = [f"/Game/Props/SM_{i}.SM_{i}" for i in range(25)]
+    folders = bp_layout.assign(sources, "/Game/BP", {"layout": "mirror", "max_fanout": 10})
+    for folder in folders.values():
+        assert folder.startswith("/Game/BP/Props/b")
+    assert max(collections.Counter(folders.values()).values()) <= 16
+    # The bucket doesn't depend on how big the source folder has grown
+    registry.get_assets_by_path.return_value = ["asset"] * 60
+    assert bp_layout.assign(sources, "/Game/BP", {"layout": "mirror", "max_fanout": 10}) == folders
+
+
+def test_ensure_folders_creates_only_missing_ones(fake_unreal):
+    registry = fake_unreal.AssetRegistryHelpers.get_asset_registry.return_value
+    registry.get_sub_paths.return_value = ["/Game/BP/Props"]
+    made = bp_layout.ensure_folders(["/Game/BP", "/Game/BP/Props", "/Game/BP/Walls", "/Game/BP/Walls"], "/Game/BP")
+    assert made == 1
+    fake_unreal.EditorAssetLibrary.make_directory.assert_called_once_with("/Game/BP/Walls")
+    registry.get_sub_paths.assert_called_once()
@@ -0,0 +1,96 @@
+import pytest
+
+import bp_manifest
+from conftest import AssetData
+
+
+class Handler:
+    suffix = "_BP"
+
+
+HANDLERS = {"/Script/Engine.StaticMesh": Handler()}
+
+
+@pytest.fixture
+def manifest():
+    return bp_manifest.load_manifest()
+
+
+def test_options_hash_ignores_options_that_dont_change_the_blueprint():
+    base = {"collision_preset": "BlockAll"}
+    assert bp_manifest.options_hash(base) == bp_manifest.options_hash(dict(base, plan_only=True, collision_rules={"x": 1}))
+    assert bp_manifest.options_hash(base) != bp_manifest.options_hash({"collision_preset": "NoCollision"})
+
+
+def test_build_plan_actions(fake_unreal, manifest):
+    options = {"collision_preset": "BlockAll"}
+    bp_manifest.record_blueprint(manifest, "/Game/BP/Same_BP.Same_BP", "/Game/M/Same.Same", "c", options)
+    bp_manifest.record_blueprint(manifest, "/Game/BP/Old_BP.Old_BP", "/Game/M/Old.Old", "c", {"collision_preset": "x"})
+    exists = {"/Game/BP/Same_BP.Same_BP", "/Game/BP/Old_BP.Old_BP", "/Game/BP/Foreign_BP.Foreign_BP"}
+    fake_unreal.EditorAssetLibrary.does_asset_exist.side_effect = lambda path: path in exists
+
+    plan = bp_manifest.build_plan(
+        [AssetData(p) for p in ("/Game/M/New.New", "/Game/M/Same.Same", "/Game/M/Old.Old", "/Game/M/Foreign.Foreign",
+                                "/Game/M/Bad.Bad")]
+        + [AssetData("/Game/M/Table.Table", asset_class="DataTable")],
+        options, "/Game/BP", HANDLERS, manifest, invalid={"/Game/M/Bad.Bad": ["no LODs"]},
+    )
+    rows = {row["source"].rsplit(".", 1)[-1]: row for row in plan["rows"]}
+    assert rows["New"]["action"] == "create"
+    assert (rows["Same"]["action"], rows["Same"]["reason"]) == ("skip", "up to date")
+    assert (rows["Old"]["action"], rows["Old"]["reason"]) == ("update", "options changed")
+    assert (rows["Foreign"]["action"], rows["Foreign"]["reason"]) == ("update", "not in manifest")
+    assert (rows["Bad"]["action"], rows["Bad"]["reason"]) == ("skip", "invalid: no LODs")
+    assert (rows["Table"]["action"], rows["Table"]["reason"]) == ("skip", "no handler")
+    assert plan["counts"] == {"create": 1, "update": 2, "skip": 3}
+    assert "plan_only" not in plan["options"]
+    assert plan["estimate_s"] > 0
+    # Planning never writes anything
+    fake_unreal.EditorAssetLibrary.save_loaded_asset.assert_not_called()
+
+
+def test_build_plan_uses_layout_folders(fake_unreal, manifest):
+    fake_unreal.EditorAssetLibrary.does_asset_exist.return_value = False
+    plan = bp_manifest.build_plan([AssetData("/Game/M/Rock.Rock")], {}, "/Game/BP", HANDLERS, manifest,
+                                  folders={"/Game/M/Rock.Rock": "/Game/BP/M"})
+    assert plan["rows"][0]["bp"] == "/Game/BP/M/Rock_BP.Rock_BP"
+
+
+def test_plan_round_trips_through_json(fake_unreal, manifest, tmp_path):
+    fake_unreal.EditorAssetLibrary.does_asset_exist.return_value = False
+    plan = bp_manifest.build_plan([AssetData("/Game/M/Rock.Rock")], {}, "/Game/BP", HANDLERS, manifest)
+    path = bp_manifest.write_plan(plan, str(tmp_path / "plan.json"))
+    assert bp_manifest.read_plan(path) == plan
+
+
+def test_reverse_index_follows_records(manifest):
+    bp_manifest.record_blueprint(manifest, "/Game/BP/A.A", "/Game/M/Rock.Rock", "c", {})
+    bp_manifest.record_blueprint(manifest, "/Game/BP/B.B", "/Game/M/Rock.Rock", "c", {})
+    assert bp_manifest.dependents(manifest, "/Game/M/Rock.Rock") == ["/Game/BP/A.A", "/Game/BP/B.B"]
+    # Rebuilt from another source moves it in the index
+    bp_manifest.record_blueprint(manifest, "/Game/BP/B.B", "/Game/M/Tree.Tree", "c", {})
+    assert bp_manifest.dependents(manifest, "/Game/M/Rock.Rock") == ["/Game/BP/A.A"]
+    bp_manifest.forget_blueprint(manifest, "/Game/BP/A.A")
+    assert manifest["sources"] == {"/Game/M/Tree.Tree": ["/Game/BP/B.B"]}
+
+
+def test_consolidated_blueprints_are_indexed_under_every_mesh(manifest):
+    bp_manifest.record_consolidated(manifest, "/Game/BP/C.C", ["/Game/M/B.B", "/Game/M/A.A"], {"output_mode": "hism"})
+    entry = manifest["blueprints"]["/Game/BP/C.C"]
+    assert entry["sources"] == ["/Game/M/A.A", "/Game/M/B.B"] and entry["output"] == "hism"
+    assert bp_manifest.dependents(manifest, "/Game/M/B.B") == ["/Game/BP/C.C"]
+    saved = dict(manifest)
+    del saved["sources"]
+    bp_manifest.rebuild_index(saved)
+    assert saved["sources"] == {"/Game/M/A.A": ["/Game/BP/C.C"], "/Game/M/B.B": ["/Game/BP/C.C"]}
+    bp_manifest.forget_blueprint(manifest, "/Game/BP/C.C")
+    assert manifest["sources"] == {}
+
+
+def test_manifest_without_index_is_rebuilt_on_load(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    manifest = bp_manifest.load_manifest(path)
+    bp_manifest.record_blueprint(manifest, "/Game/BP/A.A", "/Game/M/Rock.Rock", "c", {})
+    del manifest["sources"]
+    bp_manifest.save_manifest(manifest, path)
+    assert bp_manifest.load_manifest(path)["sources"] == {"/Game/M/Rock.Rock": ["/Game/BP/A.A"]}
@@ -0,0 +1,199 @@
+import os
+
+import pytest
+
+import bp_handlers
+import bp_manifest
+import bp_queue
+import bp_scc
+from conftest import ticks
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    q = bp_queue.JobQueue(os.path.join(str(tmp_path), "jobs.db"))
+    monkeypatch.setitem(bp_queue._state, "queue", q)
+    monkeypatch.setitem(bp_queue._state, "run", None)
+    monkeypatch.setitem(bp_queue._state, "batches", {})
+    yield q
+    q.close()
+
+
+class Blueprint:
+    def __init__(self, path):
+        self.path = path
+
+    def get_path_name(self):
+        return self.path
+
+
+class RecordingBatch:
+    finished = []
+
+    def __init__(self, targets, destination, submit=False, description=None, scc=None):
+        self.destination = destination
+
+    def finish(self, ok=True):
+        RecordingBatch.finished.append((self.destination, ok))
+
+
+def test_enqueue_merges_duplicate_pending_work(queue):
+    assert queue.enqueue("a", ["/Game/M/Rock.Rock", "/Game/M/Tree.Tree"], {"x": 1}) == (2, 0)
+    assert queue.enqueue("b", ["/Game/M/Rock.Rock"], {"x": 1}) == (0, 1)
+    # Other options or destination are other work
+    assert queue.enqueue("c", ["/Game/M/Rock.Rock"], {"x": 2}) == (1, 0)
+    assert queue.enqueue("d", ["/Game/M/Rock.Rock"], {"x": 1}, "/Game/Other") == (1, 0)
+    assert queue.stats()["pending"] == 4
+
+
+def test_duplicate_raises_priority_of_pending_item(queue):
+    queue.enqueue("bulk", ["/Game/M/Rock.Rock"], {}, priority=bp_queue.BULK)
+    queue.enqueue("other", ["/Game/M/Tree.Tree"], {"y": 1}, priority=bp_queue.BULK)
+    queue.enqueue("ui", ["/Game/M/Rock.Rock"], {}, priority=bp_queue.INTERACTIVE)
+    assert queue.stats()["interactive"] == 1
+    run = queue.take_run()
+    assert [item["source"] for item in run] == ["/Game/M/Rock.Rock"]
+
+
+def test_interactive_work_runs_before_bulk(queue):
+    queue.enqueue("bulk", ["/Game/M/A.A", "/Game/M/B.B"], {}, priority=bp_queue.BULK)
+    queue.enqueue("ui", ["/Game/M/C.C"], {"ui": True}, priority=bp_queue.INTERACTIVE)
+    assert [item["job"] for item in queue.take_run()] == ["ui"]
+    assert [item["job"] for item in queue.take_run()] == ["bulk", "bulk"]
+    assert queue.take_run() == []
+
+
+def test_runs_never_mix_jobs(queue):
+    queue.enqueue("one", ["/Game/M/A.A"], {})
+    queue.enqueue("two", ["/Game/M/B.B"], {})
+    assert {item["job"] for item in queue.take_run()} == {"one"}
+    assert {item["job"] for item in queue.take_run()} == {"two"}
+
+
+def test_running_items_are_requeued_on_restart(tmp_path, queue):
+    queue.enqueue("job", ["/Game/M/A.A"], {})
+    queue.take_run()
+    reopened = bp_queue.JobQueue(os.path.join(str(tmp_path), "jobs.db"))
+    assert reopened.stats()["pending"] == 1
+    reopened.close()
+
+
+def test_results_are_attributed_by_source_path(queue, monkeypatch):
+    sources = ["/Game/A/Rock.Rock", "/Game/B/Rock.Rock"]
+
+    def generate_sources(paths, options, destination, chunk_size=25, scc=None):
+        yield 0, len(paths), []
+        # Same asset name in two folders, reported in the opposite order
+        yield 2, len(paths), [(path, Blueprint(path.split(".")[0] + "_BP"), "Created.") for path in reversed(paths)]
+
+    monkeypatch.setattr(bp_handlers, "generate_sources", generate_sources)
+    monkeypatch.setattr(bp_scc, "SourceControlBatch", RecordingBatch)
+    RecordingBatch.finished = []
+    delivered = []
+    monkeypatch.setitem(bp_queue._state, "listeners", [lambda job, outcomes: delivered.append((job, outcomes))])
+
+    queue.enqueue("job", sources, {})
+    for _ in range(4):
+        bp_queue._on_tick(0.0)
+
+    items = queue.job_items("job")
+    assert [(i["source"], i["state"], i["blueprint"]) for i in items] == [
+        ("/Game/A/Rock.Rock", "done", "/Game/A/Rock_BP"),
+        ("/Game/B/Rock.Rock", "done", "/Game/B/Rock_BP"),
+    ]
+    assert sum(len(outcomes) for _, outcomes in delivered) == 2
+    # One source control batch for the job, finished once it had nothing left
+    assert RecordingBatch.finished == [(bp_handlers.DESTINATION_FOLDER, True)]
+
+
+def test_unreported_sources_fail_instead_of_vanishing(queue, monkeypatch):
+    def generate_sources(paths, options, destination, chunk_size=25, scc=None):
+        yield 0, len(paths), []
+
+    monkeypatch.setattr(bp_handlers, "generate_sources", generate_sources)
+    monkeypatch.setattr(bp_scc, "SourceControlBatch", RecordingBatch)
+    queue.enqueue("job", ["/Game/A/Rock.Rock"], {})
+    for _ in range(3):
+        bp_queue._on_tick(0.0)
+    assert [i["state"] for i in queue.job_items("job")] == ["failed"]
+
+
+def test_start_registers_one_tick_across_reloads(queue):
+    import importlib
+
+    def scheduler_ticks():
+        return [fn for fn in ticks.values() if fn.__module__ == "bp_queue"]
+
+    bp_queue.start()
+    bp_queue.start()
+    assert len(scheduler_ticks()) == 1
+    reloaded = importlib.reload(bp_queue)
+    reloaded._state["queue"] = queue
+    reloaded.start()
+    assert scheduler_ticks() == [reloaded._on_tick]
+    reloaded.stop()
+    assert scheduler_ticks() == []
+
+
+def test_plan_rows_are_queued_with_their_planned_folders(queue, monkeypatch):
+    plan = {
+        "destination": "/Game/BP", "options": {"x": 1, "collision_rules": {"/Game/M/Rock": {"complexity": "default"}}},
+        "rows": [
+            {"source": "/Game/M/Rock.Rock", "action": "create", "bp": "/Game/BP/3f/Rock_BP.Rock_BP"},
+            {"source": "/Game/M/Tree.Tree", "action": "update", "bp": "/Game/BP/a0/Tree_BP.Tree_BP"},
+            {"source": "/Game/M/Bush.Bush", "action": "skip", "reason": "up to date"},
+        ],
+    }
+    assert bp_queue.enqueue_plan(plan, "ui") == (2, 0)
+    assert [i["source"] for i in queue.job_items("ui")] == ["/Game/M/Rock.Rock", "/Game/M/Tree.Tree"]
+
+    started = []
+
+    def generate_sources(paths, options, destination, chunk_size=25, scc=None):
+        started.append((paths, options, destination))
+        yield 0, len(paths), []
+
+    monkeypatch.setattr(bp_handlers, "generate_sources", generate_sources)
+    monkeypatch.setattr(bp_scc, "SourceControlBatch", RecordingBatch)
+    items = queue.take_run()
+    assert items[0]["options"]["folders"] == {"/Game/M/Rock.Rock": "/Game/BP/3f"}
+    next(bp_queue._start_run(items)["steps"])
+    paths, options, destination = started[0]
+    assert destination == "/Game/BP" and options["x"] == 1
+    assert options["folders"] == {"/Game/M/Rock.Rock": "/Game/BP/3f", "/Game/M/Tree.Tree": "/Game/BP/a0"}
+    assert list(options["collision_rules"]) == ["/Game/M/Rock"]
+
+
+def test_stats_are_counted_again_only_when_items_change(queue):
+    statements = []
+    queue.db.set_trace_callback(statements.append)
+    queue.enqueue("job", ["/Game/M/Rock.Rock", "/Game/M/Tree.Tree"], {})
+    assert queue.stats()["pending"] == 2
+    statements.clear()
+    for _ in range(5):
+        assert queue.stats()["pending"] == 2
+    assert statements == []  # dashboard samples don't touch the database
+
+    items = queue.take_run()
+    assert (queue.stats()["pending"], queue.stats()["running"]) == (0, 2)
+    queue.finish([(items[0]["id"], "/Game/BP/Rock_BP", "Created."), (items[1]["id"], None, "Failed.")])
+    stats = queue.stats()
+    assert (stats["running"], stats["done"], stats["failed"]) == (0, 1, 1)
+    assert stats["per_second"] > 0
+
+
+def test_opening_the_queue_purges_old_items(tmp_path, queue, monkeypatch):
+    queue.enqueue("old", ["/Game/M/Rock.Rock"], {})
+    queue.enqueue("new", ["/Game/M/Tree.Tree"], {})
+    old, new = queue.take_run(), queue.take_run()
+    queue.finish([(old[0]["id"], "/Game/BP/Rock_BP", "Created."), (new[0]["id"], "/Game/BP/Tree_BP", "Created.")])
+    queue.db.execute("UPDATE items SET finished = finished - ? WHERE job = 'old'", (bp_queue.PURGE_AFTER + 60,))
+    queue.db.commit()
+    queue.close()
+
+    monkeypatch.setattr(bp_manifest, "data_dir", lambda: str(tmp_path))
+    monkeypatch.setitem(bp_queue._state, "queue", None)
+    reopened = bp_queue.get_queue()
+    assert reopened.job_items("old") == [] and len(reopened.job_items("new")) == 1
+    assert reopened.stats()["done"] == 1
+    reopened.close()
@@ -0,0 +1,95 @@
+import importlib
+import os
+
+import pytest
+
+import bp_layout
+import bp_manifest
+import bp_queue
+import bp_refresh
+from conftest import ticks
+
+ROCK = "/Game/M/Rock.Rock"
+BP = "/Game/BP/Props/Rock_BP.Rock_BP"
+
+
+@pytest.fixture
+def manifest():
+    manifest = bp_manifest.load_manifest()
+    bp_manifest.record_blueprint(manifest, BP, ROCK, "/Script/Engine.StaticMesh", {"ccd": True}, "/Game/BP")
+    return manifest
+
+
+@pytest.fixture
+def registry(fake_unreal):
+    """Set the packages that reference the source, and which assets still exist."""
+    asset_registry = fake_unreal.AssetRegistryHelpers.get_asset_registry.return_value
+
+    def set_up(referencers, existing=()):
+        asset_registry.get_referencers.return_value = list(referencers)
+        fake_unreal.EditorAssetLibrary.does_asset_exist.side_effect = lambda path: path in existing
+    return set_up
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    q = bp_queue.JobQueue(os.path.join(str(tmp_path), "jobs.db"))
+    monkeypatch.setitem(bp_queue._state, "queue", q)
+    yield q
+    q.close()
+
+
+def test_indexed_blueprints_that_reference_the_source_are_affected(manifest, registry):
+    registry(["/Game/BP/Props/Rock_BP", "/Game/Maps/Level"])
+    assert bp_refresh.affected([ROCK], manifest) == {ROCK: [BP]}
+
+
+def test_deleted_blueprints_are_dropped_from_the_manifest(manifest, registry):
+    registry([])
+    assert bp_refresh.affected([ROCK], manifest) == {}
+    assert BP not in manifest["blueprints"] and ROCK not in manifest["sources"]
+
+
+def test_hand_edited_blueprints_are_left_alone(manifest, registry):
+    registry([], existing={BP})
+    assert bp_refresh.affected([ROCK], manifest) == {}
+    assert BP in manifest["blueprints"]
+
+
+def test_referencers_missing_from_the_index_are_picked_up(manifest, registry):
+    manifest["sources"] = {}
+    registry(["/Game/BP/Props/Rock_BP"])
+    assert bp_refresh.affected([ROCK], manifest) == {ROCK: [BP]}
+    assert manifest["sources"][ROCK] == [BP]
+
+
+def test_refresh_queues_with_the_recorded_options_and_destination(manifest, registry, queue):
+    bp_manifest.save_manifest(manifest)
+    registry(["/Game/BP/Props/Rock_BP"])
+    job, queued = bp_refresh.refresh([ROCK])
+    assert queued == 1
+    item = queue.take_run()[0]
+    assert (item["job"], item["source"], item["destination"], item["options"]) == (job, ROCK, "/Game/BP", {"ccd": True})
+
+
+def test_regeneration_goes_back_to_the_recorded_folder(manifest):
+    # A mirror layout would now pick another folder; the Blueprint is rebuilt where it is
+    assert bp_manifest.recorded_folders(manifest, [ROCK, "/Game/M/Tree.Tree"], "/Game/BP") == {ROCK: "/Game/BP/Props"}
+    assert bp_manifest.recorded_folders(manifest, [ROCK], "/Game/Other") == {}
+    folders = bp_layout.assign([ROCK, "/Game/M/Tree.Tree"], "/Game/BP", {"layout": "hash"},
+                               recorded=bp_manifest.recorded_folders(manifest, [ROCK], "/Game/BP"))
+    assert folders[ROCK] == "/Game/BP/Props" and folders["/Game/M/Tree.Tree"] != "/Game/BP/Props"
+
+
+def test_reload_replaces_the_reimport_hook(fake_unreal, monkeypatch):
+    monkeypatch.setattr(bp_queue, "start", lambda: None)
+    delegate = fake_unreal.get_editor_subsystem.return_value.on_asset_reimport
+    bp_refresh.install()
+    old_hook = bp_refresh._on_reimport
+    reloaded = importlib.reload(bp_refresh)
+    reloaded.install()
+    reloaded.install()
+    delegate.remove_callable.assert_called_once_with(old_hook)
+    assert [fn for fn in ticks.values() if fn.__module__ == "bp_refresh"] == [reloaded._on_tick]
+    reloaded.uninstall()
+    assert [fn for fn in ticks.values() if fn.__module__ == "bp_refresh"] == []
@@ -0,0 +1,91 @@
+import io
+import json
+import os
+
+import pytest
+
+import bp_handlers
+import bp_queue
+import bp_remote
+from conftest import AssetData
+
+
+class Wire(io.BytesIO):
+    """wfile that hands back the JSON replies written to it"""
+    def replies(self):
+        return [json.loads(line) for line in self.getvalue().decode("utf-8").splitlines()]
+
+
+def serve(*requests, then=None):
+    """Feed requests to a connection; then() runs on the game thread side while it is still open."""
+    def lines():
+        for request in requests:
+            yield (request if isinstance(request, bytes) else json.dumps(request).encode("utf-8")) + b"\n"
+        if then is not None:
+            then()
+
+    handler = bp_remote._Handler.__new__(bp_remote._Handler)
+    handler.rfile = lines()
+    handler.wfile = Wire()
+    handler.handle()
+    return handler.wfile
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    q = bp_queue.JobQueue(os.path.join(str(tmp_path), "jobs.db"))
+    monkeypatch.setitem(bp_queue._state, "queue", q)
+    monkeypatch.setattr(bp_remote, "_open_jobs", {})
+    yield q
+    q.close()
+    while not bp_remote._inbox.empty():
+        bp_remote._inbox.get_nowait()
+
+
+@pytest.fixture
+def registry(fake_unreal):
+    """find_asset_data that knows /Game/M/Rock and /Game/M/Tree by package or object path"""
+    known = {"/Game/M/Rock": "/Game/M/Rock.Rock", "/Game/M/Tree": "/Game/M/Tree.Tree"}
+    known.update({v: v for v in list(known.values())})
+    fake_unreal.EditorAssetLibrary.find_asset_data.side_effect = lambda path: AssetData(known[path]) if path in known else None
+
+
+def test_ping_status_and_bad_requests():
+    wire = serve({"cmd": "ping"}, {"cmd": "status"}, b"not json", {"cmd": "dance"})
+    events = [reply["event"] for reply in wire.replies()]
+    assert events == ["pong", "status", "error", "error"]
+    assert "dance" in wire.replies()[-1]["message"]
+
+
+def test_generate_is_queued_with_object_paths(queue, registry):
+    wire = serve({"cmd": "generate", "assets": ["/Game/M/Rock", "/Game/M/Rock.Rock", "/Game/M/Tree", "/Game/Gone"]},
+                 then=lambda: bp_remote._on_tick(0.0))
+    queued = wire.replies()[0]
+    assert queued["event"] == "queued" and queued["added"] == 2 and queued["rejected"] == ["/Game/Gone"]
+    assert [i["source"] for i in queue.job_items(queued["job"])] == ["/Game/M/Rock.Rock", "/Game/M/Tree.Tree"]
+
+
+def test_progress_then_done_with_every_result(queue, registry):
+    def generate_run():
+        bp_remote._on_tick(0.0)
+        items = queue.take_run()
+        outcomes = [(items[0]["id"], "/Game/BP/Rock_BP.Rock_BP", "Created."), (items[1]["id"], None, bp_handlers.NO_HANDLER)]
+        queue.finish(outcomes)
+        bp_remote._on_outcomes(items[0]["job"], outcomes)
+
+    wire = serve({"cmd": "generate", "assets": ["/Game/M/Rock", "/Game/M/Tree", "/Game/Gone"]}, then=generate_run)
+    job = wire.replies()[0]["job"]
+    progress, done = wire.replies()[1:]
+    assert (progress["event"], progress["done"], progress["total"], progress["failed"]) == ("progress", 2, 2, 1)
+    assert done["event"] == "done" and done["unsupported"] == ["/Game/M/Tree.Tree"]
+    assert [(r["asset"], r["blueprint"]) for r in done["results"]] == [
+        ("/Game/M/Rock.Rock", "/Game/BP/Rock_BP.Rock_BP"), ("/Game/M/Tree.Tree", None), ("/Game/Gone", None),
+    ]
+    assert job not in bp_remote._open_jobs
+
+
+def test_request_with_nothing_new_finishes_at_once(queue, registry):
+    wire = serve({"cmd": "generate", "assets": ["/Game/Gone"]}, then=lambda: bp_remote._on_tick(0.0))
+    queued, done = wire.replies()
+    assert queued["added"] == 0 and done["event"] == "done"
+    assert done["results"] == [{"asset": "/Game/Gone", "blueprint": None, "message": bp_handlers.MISSING_SOURCE}]
@@ -0,0 +1,116 @@
+from unittest import mock
+
+import bp_rules
+from conftest import AssetData
+
+
+def tags(name="SM_Crate", triangles=500, lods=3, prims=1, size=(100.0, 100.0, 100.0)):
+    return {"name": name, "path": f"/Game/Props/{name}", "triangles": triangles, "lods": lods,
+            "collision_prims": prims, "size": size}
+
+
+def test_read_mesh_tags_from_registry_only():
+    ad = AssetData("/Game/Props/SM_Crate.SM_Crate",
+                   tags={"Triangles": "1200", "LODs": "4", "CollisionPrims": "2", "ApproxSize": "10x20x30"})
+    assert bp_rules.read_mesh_tags(ad) == {
+        "name": "SM_Crate", "path": "/Game/Props/SM_Crate", "triangles": 1200, "lods": 4,
+        "collision_prims": 2, "size": (10.0, 20.0, 30.0),
+    }
+
+
+def test_read_mesh_tags_defaults_for_missing_or_malformed_tags():
+    ad = AssetData("/Game/Props/SM_Odd.SM_Odd", tags={"Triangles": "lots", "ApproxSize": "10xbad"})
+    read = bp_rules.read_mesh_tags(ad)
+    assert (read["triangles"], read["lods"], read["collision_prims"], read["size"]) == (0, 1, 0, None)
+
+
+def test_tool_options_are_the_starting_point():
+    rules = bp_rules.collision_rules(tags(), {"collision_preset": "BlockAll", "generate_overlap": True})
+    assert rules["collision_preset"] == "BlockAll"
+    assert rules["generate_overlap"] is True
+    assert rules["simulate_physics"] is False
+    assert rules["complexity"] == "default"
+
+
+def test_debris_and_no_collision_names_get_no_collision():
+    assert bp_rules.collision_rules(tags(size=(5.0, 5.0, 5.0)), {"enable_gravity": True})["collision_preset"] == "NoCollision"
+    rules = bp_rules.collision_rules(tags(name="SM_Leaves_Decor"), {"enable_gravity": True})
+    assert rules["collision_preset"] == "NoCollision" and rules["simulate_physics"] is False
+
+
+def test_physics_props_by_name_unless_too_large():
+    assert bp_rules.collision_rules(tags(name="SM_Barrel_Phys"), {})["simulate_physics"] is True
+    rules = bp_rules.collision_rules(tags(name="SM_Ship_Phys", size=(5000.0, 100.0, 100.0)), {})
+    assert rules["simulate_physics"] is False
+    assert any("too large" in reason for reason in rules["reasons"])
+
+
+def test_dense_mesh_without_simple_collision_never_uses_complex_as_simple():
+    rules = bp_rules.collision_rules(tags(triangles=50000, prims=0), {"enable_gravity": True})
+    assert rules["complexity"] == "default"
+    assert rules["needs_simple_collision"] is True
+    assert rules["simulate_physics"] is False
+    assert bp_rules.collision_rules(tags(triangles=200, prims=0), {})["complexity"] == "complex_as_simple"
+
+
+def test_simple_collision_option_sets_simple_as_complex():
+    assert bp_rules.collision_rules(tags(), {"simple_collision": True})["complexity"] == "simple_as_complex"
+
+
+def test_complexity_is_not_a_component_setting():
+    settings = bp_rules.component_settings(bp_rules.collision_rules(tags(triangles=200, prims=0), {}))
+    assert "collision_complexity" not in settings
+    assert settings["collision_profile_name"] == "BlockAllDynamic"
+
+
+class Mesh:
+    def __init__(self, complexity):
+        flag = getattr(bp_rules.unreal.CollisionTraceFlag, bp_rules.COMPLEXITY[complexity])
+        self.body_setup = mock.Mock(**{"get_editor_property.return_value": flag})
+
+    def get_editor_property(self, name):
+        return getattr(self, name)
+
+
+def test_complexity_mismatch_is_reported_from_the_mesh():
+    assert bp_rules.mesh_complexity(Mesh("complex_as_simple")) == "complex_as_simple"
+    assert bp_rules.complexity_mismatch(Mesh("default"), "complex_as_simple") == "default"
+    assert bp_rules.complexity_mismatch(Mesh("complex_as_simple"), "complex_as_simple") is None
+    # Dense meshes: complex-as-simple is the trap; an artist's simple-as-complex is fine
+    assert bp_rules.complexity_mismatch(Mesh("complex_as_simple"), "default") == "complex_as_simple"
+    assert bp_rules.complexity_mismatch(Mesh("simple_as_complex"), "default") is None
+    assert bp_rules.complexity_mismatch(object(), "simple_as_complex") is None
+
+
+def test_size_classes():
+    assert bp_rules.size_class(tags(size=(10.0, 10.0, 10.0))) == "tiny"
+    assert bp_rules.size_class(tags(size=(10.0, 900.0, 10.0))) == "medium"
+    assert bp_rules.size_class(tags(size=(100000.0, 1.0, 1.0))) == "huge"
+    assert bp_rules.size_class(tags(size=None)) == "medium"
+
+
+def test_render_rules_only_apply_size_class_when_enabled():
+    tiny = tags(size=(10.0, 10.0, 10.0))
+    plain = bp_rules.render_rules(tiny, {})
+    assert plain["cast_shadow"] is True and plain["cull_distance"] == 0.0 and not plain["nanite_fallback"]
+    sized = bp_rules.render_rules(tiny, {"render_rules": True})
+    assert sized["cast_shadow"] is False and sized["cull_distance"] == 3000.0 and sized["nanite_fallback"]
+
+
+def test_explicit_options_win_and_min_lod_is_clamped():
+    rules = bp_rules.render_rules(tags(lods=2), {"render_rules": True, "cull_distance": 500, "min_lod": 5})
+    assert rules["cull_distance"] == 500.0
+    assert rules["min_lod"] == 1  # past the last LOD the mesh would vanish
+
+
+def test_wants_render_rules_skips_untouched_runs():
+    assert not bp_rules.wants_render_rules({"cast_shadow": True})
+    assert bp_rules.wants_render_rules({"cast_shadow": False})
+    assert bp_rules.wants_render_rules({"nanite_fallback": True})
+
+
+def test_render_settings_map_to_component_properties():
+    settings = bp_rules.render_settings(bp_rules.render_rules(tags(lods=3), {"min_lod": 1, "nanite_fallback": True}))
+    assert settings["override_min_lod"] is True and settings["min_lod"] == 1
+    assert settings["disallow_nanite"] is True
+    assert "override_materials" not in settings
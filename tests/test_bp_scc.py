@@ -0,0 +1,105 @@
+from unittest import mock
+
+from bp_scc import FakeProvider, FakeState, SourceControlBatch
+
+
+def provider_with(**files):
+    scc = FakeProvider()
+    scc.files.update(files)
+    return scc
+
+
+class RecordingProvider(FakeProvider):
+    def __init__(self):
+        super().__init__()
+        self.queried = []
+        self.checkouts = []
+        self.added = []
+
+    def query(self, packages):
+        self.queried.append(list(packages))
+        return super().query(packages)
+
+    def check_out(self, packages):
+        self.checkouts.append(list(packages))
+        return super().check_out(packages)
+
+    def mark_for_add(self, packages):
+        self.added.append(list(packages))
+        return super().mark_for_add(packages)
+
+
+def test_only_target_packages_are_queried():
+    scc = RecordingProvider()
+    with SourceControlBatch(["/Game/BP/A_BP.A_BP", "/Game/BP/B_BP.B_BP"], "/Game/BP", scc=scc):
+        pass
+    assert scc.queried == [["/Game/BP/A_BP", "/Game/BP/B_BP"]]
+
+
+def test_add_queries_each_package_once():
+    scc = RecordingProvider()
+    batch = SourceControlBatch([], "/Game/BP", scc=scc)
+    batch.add(["/Game/BP/A_BP.A_BP"])
+    batch.add(["/Game/BP/A_BP.A_BP", "/Game/BP/B_BP.B_BP"])
+    batch.add(["/Game/BP/B_BP.B_BP"])
+    assert scc.queried == [["/Game/BP/A_BP"], ["/Game/BP/B_BP"]]
+    assert batch.targets == ["/Game/BP/A_BP", "/Game/BP/B_BP"]
+
+
+def test_checkout_only_for_controlled_packages_not_checked_out():
+    scc = RecordingProvider()
+    scc.files.update({
+        "/Game/BP/Old_BP": FakeState(controlled=True),
+        "/Game/BP/Mine_BP": FakeState(controlled=True, checked_out=True),
+        "/Game/BP/Added_BP": FakeState(controlled=True, added=True),
+        "/Game/BP/Theirs_BP": FakeState(controlled=True, other=True),
+    })
+    targets = [f"/Game/BP/{name}.{name}" for name in ("Old_BP", "Mine_BP", "Added_BP", "Theirs_BP", "New_BP")]
+    batch = SourceControlBatch(targets, "/Game/BP", scc=scc)
+    batch.add(targets)
+    assert scc.checkouts == [["/Game/BP/Old_BP"]]
+    assert batch.to_add == ["/Game/BP/New_BP"]
+
+
+def test_finish_marks_for_add_only_packages_that_were_written(fake_unreal):
+    fake_unreal.EditorAssetLibrary.does_asset_exist.side_effect = lambda pkg: pkg != "/Game/BP/Failed_BP"
+    scc = RecordingProvider()
+    with SourceControlBatch(["/Game/BP/New_BP.New_BP", "/Game/BP/Failed_BP.Failed_BP"], "/Game/BP", scc=scc):
+        pass
+    assert scc.added == [["/Game/BP/New_BP"]]
+
+
+def test_submit_is_one_call_for_the_whole_batch(fake_unreal):
+    fake_unreal.EditorAssetLibrary.does_asset_exist.return_value = True
+    scc = provider_with(**{"/Game/BP/Old_BP": FakeState(controlled=True)})
+    batch = SourceControlBatch(["/Game/BP/Old_BP.Old_BP"], "/Game/BP", submit=True, scc=scc)
+    batch.add(["/Game/BP/Old_BP.Old_BP", "/Game/BP/New_BP.New_BP"])
+    batch.add(["/Game/BP/Other_BP.Other_BP"])
+    batch.finish()
+    assert len(scc.submitted) == 1
+    description, packages = scc.submitted[0]
+    assert sorted(packages) == ["/Game/BP/New_BP", "/Game/BP/Old_BP", "/Game/BP/Other_BP"]
+    assert "2 added, 1 updated" in description
+    # query, query, checkout, mark_for_add, submit
+    assert scc.round_trips == 5
+
+
+def test_failed_batch_is_not_submitted(fake_unreal):
+    fake_unreal.EditorAssetLibrary.does_asset_exist.return_value = True
+    scc = FakeProvider()
+    try:
+        with SourceControlBatch(["/Game/BP/New_BP.New_BP"], "/Game/BP", submit=True, scc=scc):
+            raise RuntimeError("save failed")
+    except RuntimeError:
+        pass
+    assert scc.submitted == []
+    assert scc.files["/Game/BP/New_BP"].is_added
+
+
+def test_no_provider_is_a_no_op(fake_unreal, monkeypatch):
+    monkeypatch.delenv("BPGEN_FAKE_SCC", raising=False)
+    monkeypatch.setattr(fake_unreal, "SourceControl", mock.Mock(**{"is_enabled.return_value": False}))
+    with SourceControlBatch(["/Game/BP/A_BP.A_BP"], "/Game/BP") as batch:
+        pass
+    assert batch.scc is None and batch.targets == []
+    fake_unreal.EditorAssetLibrary.does_asset_exist.assert_not_called()
@@ -0,0 +1,31 @@
+from unittest import mock
+
+import pytest
+
+import bp_session
+
+
+@pytest.fixture
+def session(fake_unreal, monkeypatch):
+    monkeypatch.setitem(bp_session._session, "current", None)
+    monkeypatch.setattr(fake_unreal, "BlueprintFactory", mock.Mock(side_effect=mock.Mock))
+    monkeypatch.setattr(fake_unreal, "SystemLibrary", mock.Mock(**{"is_valid.return_value": True}))
+    return fake_unreal
+
+
+def test_one_factory_per_parent_class(session):
+    handles = bp_session.get()
+    actor = handles.factory(session.Actor)
+    assert handles.factory(session.Actor) is actor
+    assert handles.factory(session.StaticMeshActor) is not actor
+    actor.set_editor_property.assert_called_once_with("parent_class", session.Actor)
+    assert session.BlueprintFactory.call_count == 2
+
+
+def test_session_is_reused_until_its_handles_go_stale(session):
+    first = bp_session.get()
+    first.factory(session.Actor)
+    assert bp_session.get() is first
+    session.SystemLibrary.is_valid.return_value = False
+    second = bp_session.get()
+    assert second is not first and second.factory(session.Actor) is not first.factory(session.Actor)
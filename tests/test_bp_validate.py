@@ -0,0 +1,58 @@
+import struct
+
+import bp_validate
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+GOOD = struct.pack("<I", bp_validate.PACKAGE_MAGIC) + b"\0" * 64
+
+
+def test_missing_tags_are_not_problems():
+    assert bp_validate._tag_problems("StaticMesh", {}) == []
+    assert bp_validate._tag_problems("StaticMesh", {"LODs": None, "Triangles": ""}) == []
+
+
+def test_present_bad_tags_are_problems():
+    problems = bp_validate._tag_problems("StaticMesh", {"LODs": "0", "Triangles": "0", "Materials": "2", "ApproxSize": "0x0x0"})
+    assert problems == ["no LODs", "no triangles", "zero bounds"]
+
+
+def test_malformed_tags_are_reported_not_raised():
+    problems = bp_validate._tag_problems("StaticMesh", {"Triangles": "many", "ApproxSize": "10xbad"})
+    assert problems == ["unreadable Triangles tag", "unreadable ApproxSize tag"]
+
+
+def test_other_classes_are_not_tag_checked():
+    assert bp_validate._tag_problems("SoundWave", {"LODs": "0"}) == []
+
+
+def test_check_file_header(tmp_path):
+    assert bp_validate._check_file(write(tmp_path / "good.uasset", GOOD), None)[2] == []
+    assert bp_validate._check_file(write(tmp_path / "bad.uasset", b"nope"), None)[2] == ["not a valid package file (bad header)"]
+    assert bp_validate._check_file(str(tmp_path / "gone.uasset"), None) == (None, None, ["package file missing on disk"])
+
+
+def test_unreadable_file_is_a_problem(tmp_path):
+    folder = tmp_path / "folder.uasset"
+    folder.mkdir()
+    stamp, digest, problems = bp_validate._check_file(str(folder), None)
+    assert digest is None and problems[0].startswith("package file unreadable")
+
+
+def test_unchanged_file_reuses_the_cached_hash(tmp_path):
+    path = write(tmp_path / "good.uasset", GOOD)
+    stamp, digest, _ = bp_validate._check_file(path, None)
+    assert bp_validate._check_file(path, stamp + [digest]) == (stamp, digest, None)
+
+
+def test_hash_covers_size_and_mtime_not_just_the_header(tmp_path):
+    path = write(tmp_path / "good.uasset", GOOD)
+    _, first, _ = bp_validate._check_file(path, None)
+    write(path, GOOD + b"more")
+    _, second, _ = bp_validate._check_file(path, None)
+    assert first != second
@@ -0,0 +1,97 @@
+import importlib
+import os
+
+import pytest
+
+import bp_queue
+import bp_watch
+from conftest import AssetData, ticks
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    q = bp_queue.JobQueue(os.path.join(str(tmp_path), "jobs.db"))
+    monkeypatch.setitem(bp_queue._state, "queue", q)
+    yield q
+    q.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(bp_watch.time, "time", lambda: now[0])
+    return now
+
+
+def imported(*names, folder="/Game/Imports"):
+    for name in names:
+        bp_watch._on_asset_added(AssetData(f"{folder}/{name}.{name}"))
+
+
+def watch_ticks():
+    return [fn for fn in ticks.values() if fn.__module__ == "bp_watch"]
+
+
+def pending_sources(queue):
+    return sorted(row[0] for row in queue.db.execute("SELECT source FROM items WHERE state = 'pending'"))
+
+
+def test_a_burst_is_queued_once_it_goes_quiet(queue, clock):
+    bp_watch.start(paths=["/Game/Imports"])
+    imported("Rock")
+    imported("Elsewhere", folder="/Game/Other")
+    bp_watch._on_asset_added(AssetData("/Game/Imports/Table.Table", asset_class="DataTable"))
+    clock[0] += 1.0
+    imported("Tree")
+    clock[0] += 1.5
+    bp_watch._on_tick(0.0)
+    assert pending_sources(queue) == []  # last event 1.5 s ago, still in the burst
+    clock[0] += bp_watch.DEBOUNCE_S
+    bp_watch._on_tick(0.0)
+    assert pending_sources(queue) == ["/Game/Imports/Rock.Rock", "/Game/Imports/Tree.Tree"]
+    assert bp_watch._state()["job"] is None
+
+
+def test_a_burst_that_never_settles_is_flushed_after_max_wait(queue, clock):
+    bp_watch.start(paths=["/Game/Imports"])
+    for i in range(int(bp_watch.MAX_WAIT_S) + 1):
+        imported(f"Rock{i:02d}")
+        bp_watch._on_tick(0.0)
+        clock[0] += 1.0
+    assert len(pending_sources(queue)) == int(bp_watch.MAX_WAIT_S) + 1
+
+
+def test_full_queue_holds_the_burst_back(queue, clock, monkeypatch):
+    monkeypatch.setattr(bp_watch, "HIGH_WATER", 3)
+    monkeypatch.setattr(bp_watch, "BATCH_SIZE", 2)
+    queue.enqueue("ui", ["/Game/M/Busy.Busy"], {})
+    bp_watch.start(paths=["/Game/Imports"])
+    imported("A", "B", "C", "D")
+    clock[0] += bp_watch.DEBOUNCE_S
+
+    bp_watch._on_tick(0.0)
+    assert len(pending_sources(queue)) == 3  # two of the four, up to the high water mark
+    bp_watch._on_tick(0.0)
+    assert len(pending_sources(queue)) == 3 and len(bp_watch._state()["pending"]) == 2
+
+    # One item generated: one more goes in
+    items = queue.take_run()
+    queue.finish([(item["id"], "/Game/BP/Done_BP", "Created.") for item in items])
+    bp_watch._on_tick(0.0)
+    assert list(bp_watch._state()["pending"]) == ["/Game/Imports/D.D"]
+
+
+def test_reload_replaces_the_running_watch(queue):
+    bp_watch.start(paths=["/Game/Imports"])
+    old_tick, old_added = bp_watch._on_tick, bp_watch._on_asset_added
+    registry = bp_watch.unreal.AssetRegistryHelpers.get_asset_registry.return_value
+
+    reloaded = importlib.reload(bp_watch)
+    assert reloaded.is_running()
+    reloaded.start()
+    assert watch_ticks() == [reloaded._on_tick] and reloaded._on_tick is not old_tick
+    registry.on_asset_added.remove_callable.assert_called_once_with(old_added)
+    assert reloaded._state()["hooks"][0] == (registry.on_asset_added, reloaded._on_asset_added)
+
+    reloaded.stop()
+    assert watch_ticks() == [] and not reloaded.is_running()
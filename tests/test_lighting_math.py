@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import lighting_math
+
+
+def test_normalize_rgb_broadcasts():
+    assert lighting_math.normalize_rgb((255, 0, 51)).tolist() == pytest.approx([1.0, 0.0, 0.2])
+    assert lighting_math.normalize_rgb(np.zeros((10, 3))).shape == (10, 3)
+
+
+def test_kelvin_to_rgb():
+    assert lighting_math.kelvin_to_rgb(6600).tolist() == pytest.approx([255.0, 255.0, 255.0], abs=2.0)
+    warm = lighting_math.kelvin_to_rgb(1500)
+    assert warm[0] == 255.0 and warm[2] == 0.0 and warm[1] < 150.0
+    cool = lighting_math.kelvin_to_rgb(15000)
+    assert cool[2] == 255.0 and cool[0] < 255.0
+    assert lighting_math.kelvin_to_rgb([1000, 5000, 40000, 90000]).shape == (4, 3)
+    # Clamped to the fitted range
+    assert lighting_math.kelvin_to_rgb(90000).tolist() == lighting_math.kelvin_to_rgb(40000).tolist()
+
+
+def test_time_to_pitch_matches_the_tools_mapping():
+    assert lighting_math.time_to_pitch([0.0, 12.0, 24.0]).tolist() == [-80.0, 0.0, 80.0]
+
+
+def test_unwrap_hours_is_continuous_across_midnight():
+    assert lighting_math.unwrap_hours([22.0, 2.0, 6.0]).tolist() == [22.0, 26.0, 30.0]
+    assert lighting_math.unwrap_hours([5.0]).tolist() == [5.0]
+    # Half a day apart is ambiguous: time of day moves forward
+    assert lighting_math.unwrap_hours([6.0, 18.0, 6.0]).tolist() == [6.0, 18.0, 30.0]
+    assert lighting_math.unwrap_hours([2.0, 22.0]).tolist() == [2.0, -2.0]
+
+
+def test_brightness_curve():
+    assert lighting_math.brightness([0.0, 12.0, 24.0]).tolist() == pytest.approx([0.0, 1.0, 0.0])
+
+
+def test_sky_gradient_tints_only_at_sunrise_and_sunset():
+    base = (0.6, 0.45, 1.0)
+    top, bottom = lighting_math.sky_gradient_hsv([6.0, 12.0, 19.0], base)
+    assert top.shape == (3, 3)
+    assert top[0].tolist() == pytest.approx(lighting_math.SUNRISE_TOP)
+    assert top[2].tolist() == pytest.approx(lighting_math.SUNSET_TOP)
+    assert top[1][0] == pytest.approx(base[0])
+
+
+def test_solar_position_equinox():
+    day = lighting_math.day_of_year(3, 20)
+    noon, _ = lighting_math.solar_position(0.0, day, 12.0)
+    assert noon == pytest.approx(90.0, abs=3.0)
+    midnight, _ = lighting_math.solar_position(0.0, day, 0.0)
+    assert midnight < -80.0
+    # Morning sun is in the east, afternoon in the west
+    _, morning = lighting_math.solar_position(51.5, day, 9.0)
+    _, afternoon = lighting_math.solar_position(51.5, day, 15.0)
+    assert 90.0 < morning < 180.0 and 180.0 < afternoon < 270.0
+
+
+def test_solar_position_broadcasts_over_timeline_samples():
+    elevation, azimuth = lighting_math.solar_position(51.5, 172, np.linspace(0.0, 24.0, 1000))
+    assert elevation.shape == azimuth.shape == (1000,)
+    assert elevation.max() == pytest.approx(90.0 - 51.5 + 23.44, abs=1.0)
+
+
+def test_sun_rotation_points_the_light_away_from_the_sun():
+    pitch, yaw = lighting_math.sun_rotation(30.0, 270.0)
+    assert (float(pitch), float(yaw)) == (-30.0, 90.0)
+
+
+def test_day_of_year():
+    assert lighting_math.day_of_year(1, 1) == 1
+    assert lighting_math.day_of_year(12, 31) == 365
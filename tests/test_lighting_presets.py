@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from lighting_presets import PresetStore, diff_state
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PresetStore("Test", root=str(tmp_path))
+    yield store
+    store.close()
+
+
+def test_names_that_sanitise_alike_keep_their_own_files(store):
+    for name in ("a b", "a_b", "a/b"):
+        store.save(name, {"sun": (1, 2, 3), "label": name})
+    assert store.names() == ["a b", "a/b", "a_b"]
+    assert [store.load(name)["label"] for name in ("a b", "a_b", "a/b")] == ["a b", "a_b", "a/b"]
+    store.delete("a b")
+    assert store.load("a_b")["label"] == "a_b"
+    assert store.load("a/b")["label"] == "a/b"
+
+
+def test_round_trip_normalises_lists_to_tuples(store):
+    store.save("Dusk", {"sun": [255, 120, 40], "time": 19.5})
+    store._cache.clear()
+    assert store.load("Dusk") == {"sun": (255, 120, 40), "time": 19.5}
+
+
+def test_hand_edited_file_is_reloaded(store):
+    store.save("Noon", {"time": 12.0})
+    path = store._file_for("Noon")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"name": "Noon", "tool": "Test", "values": {"time": 13.0}}, f)
+    os.utime(path, (1, 1))
+    assert store.load("Noon") == {"time": 13.0}
+
+
+def test_presets_are_per_tool(tmp_path, store):
+    store.save("Shared", {"time": 1.0})
+    other = PresetStore("Other", root=str(tmp_path))
+    assert other.names() == [] and other.load("Shared") is None
+    other.close()
+
+
+def test_legacy_shared_file_survives_until_unused(tmp_path, store):
+    legacy = os.path.join(str(tmp_path), "Test__a_b.json")
+    with open(legacy, "w", encoding="utf-8") as f:
+        json.dump({"values": {"time": 1.0}}, f)
+    for name in ("a b", "a_b"):
+        store.db.execute("INSERT INTO presets (tool, name, file, modified, thumbnail) VALUES (?, ?, ?, 0, NULL)",
+                         ("Test", name, legacy))
+    store.save("a b", {"time": 2.0})
+    assert os.path.exists(legacy)  # still what "a_b" points at
+    store.save("a_b", {"time": 3.0})
+    assert not os.path.exists(legacy)
+    assert (store.load("a b"), store.load("a_b")) == ({"time": 2.0}, {"time": 3.0})
+
+
+def test_diff_state_only_returns_changes():
+    current = {"sun": (255, 200, 120), "time": 12.0}
+    assert diff_state(current, {"sun": [255, 200, 120], "time": 13.0, "atmos": 0.1}) == {"time": 13.0, "atmos": 0.1}
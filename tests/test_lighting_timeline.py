@@ -0,0 +1,45 @@
+import pytest
+
+from conftest import load_script
+from lighting_timeline import Timeline, TimelinePlayer
+
+
+@pytest.fixture(scope="module")
+def test_light():
+    """The lighting tool script, for its stand-in facade"""
+    return load_script("TestLight")
+
+
+def timeline(*keys, duration=4.0):
+    t = Timeline(duration=duration, fps=1)
+    for seconds, time_hours in keys:
+        t.set_key(seconds, (255, 200, 120), (150, 180, 255), 1000.0, time_hours, 0.2)
+    return t
+
+
+def test_time_wraps_forward_through_midnight():
+    t = timeline((0.0, 22.0), (4.0, 2.0))
+    assert [t.sample(f)["time"] for f in range(t.frame_count)] == [22.0, 23.0, 0.0, 1.0, 2.0]
+
+
+def test_time_does_not_wrap_within_a_day():
+    t = timeline((0.0, 6.0), (4.0, 18.0))
+    assert [t.sample(f)["time"] for f in range(t.frame_count)] == [6.0, 9.0, 12.0, 15.0, 18.0]
+
+
+def test_playback_pushes_only_changed_channels(test_light):
+    facade = test_light.StandInFacade()
+    player = TimelinePlayer(timeline((0.0, 22.0), (4.0, 2.0)), facade)
+    pushed = []
+    for name in ("set_sun_color", "set_sun_intensity", "set_sun_time", "apply_sky_color", "apply_atmospherics"):
+        setter = getattr(facade, name)
+        setattr(facade, name, lambda value, name=name, setter=setter: pushed.append(name) or setter(value))
+
+    player.seek(0)
+    assert sorted(pushed) == ["apply_atmospherics", "apply_sky_color", "set_sun_color", "set_sun_intensity", "set_sun_time"]
+    del pushed[:]
+    player.seek(1)
+    assert pushed == ["set_sun_time"] and facade.state["time"] == 23.0
+    del pushed[:]
+    player.seek(1)
+    assert pushed == []
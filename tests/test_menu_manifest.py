@@ -0,0 +1,38 @@
+from unittest import mock
+
+import pytest
+
+import menu_manifest
+import menu_registry
+
+ACTION = {"menu": "LevelEditor.MainMenu.Edit", "section": "EditMain", "name": "MyEdit", "label": "My Edit",
+          "command": "print('edit')"}
+SUBMENU = {"menu": "LevelEditor.MainMenu", "section": "PythonTools", "name": "BlueprintGenerator",
+           "label": "Blueprint Generator", "submenu": True}
+
+
+@pytest.fixture
+def tool_menus(fake_unreal, monkeypatch):
+    menus = {}
+    monkeypatch.setattr(menu_registry, "find_menu", lambda name: menus.setdefault(name, mock.Mock(name=name)))
+    tool_menus = mock.Mock()
+    monkeypatch.setattr(fake_unreal, "ToolMenus", mock.Mock(**{"get.return_value": tool_menus}))
+    tool_menus.menus = menus
+    return tool_menus
+
+
+def test_unchanged_manifest_registers_once(tool_menus):
+    assert menu_manifest.register_manifest("Tool", [ACTION, SUBMENU])
+    assert not menu_manifest.register_manifest("Tool", [dict(ACTION), dict(SUBMENU)])
+    assert tool_menus.menus["LevelEditor.MainMenu.Edit"].add_menu_entry.call_count == 1
+    assert tool_menus.menus["LevelEditor.MainMenu"].add_sub_menu.call_count == 1
+    assert tool_menus.refresh_all_widgets.call_count == 1
+
+
+def test_dropped_entries_are_removed(tool_menus):
+    menu_manifest.register_manifest("Tool", [ACTION, SUBMENU])
+    assert menu_manifest.register_manifest("Tool", [ACTION])
+    tool_menus.remove_entry.assert_called_once_with("LevelEditor.MainMenu", "PythonTools", "BlueprintGenerator")
+    assert menu_manifest.unregister_manifest("Tool")
+    tool_menus.remove_entry.assert_called_with("LevelEditor.MainMenu.Edit", "EditMain", "MyEdit")
+    assert not menu_manifest.unregister_manifest("Tool")
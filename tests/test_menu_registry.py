@@ -0,0 +1,39 @@
+import types
+from unittest import mock
+
+import pytest
+
+import menu_registry
+
+NAMES = ["LevelEditor.MainMenu.Tools", "None", "ContentBrowser.AssetContextMenu", "LevelEditor.MainMenu",
+         "LevelEditor.MainMenu.Edit", "LevelEditor.LevelEditorToolBar"]
+
+
+@pytest.fixture
+def menus(fake_unreal, monkeypatch):
+    monkeypatch.setattr(menu_registry, "_menus", None)
+    monkeypatch.setattr(menu_registry, "_sorted_names", [])
+    fake_unreal.ObjectIterator.reset_mock()
+    fake_unreal.ObjectIterator.side_effect = lambda cls: iter([types.SimpleNamespace(menu_name=n) for n in NAMES])
+    return fake_unreal
+
+
+def test_prefix_search_over_one_enumeration(menus):
+    assert menu_registry.search_menus("LevelEditor.MainMenu") == [
+        "LevelEditor.MainMenu", "LevelEditor.MainMenu.Edit", "LevelEditor.MainMenu.Tools",
+    ]
+    assert menu_registry.search_menus("ContentBrowser") == ["ContentBrowser.AssetContextMenu"]
+    assert menu_registry.search_menus("Nope") == []
+    assert len(menu_registry.search_menus()) == len(NAMES) - 1  # unnamed menus are left out
+    assert menus.ObjectIterator.call_count == 1
+
+
+def test_menus_registered_later_are_found_and_listed(menus, monkeypatch):
+    menu_registry.get_menus()
+    late = types.SimpleNamespace(menu_name="LevelEditor.MainMenu.Window")
+    tool_menus = mock.Mock(**{"find_menu.side_effect": lambda name: late if name == late.menu_name else None})
+    monkeypatch.setattr(menus, "ToolMenus", mock.Mock(**{"get.return_value": tool_menus}))
+    assert menu_registry.find_menu("LevelEditor.MainMenu.Window") is late
+    assert menu_registry.find_menu("LevelEditor.MainMenu.Missing") is None
+    assert "LevelEditor.MainMenu.Window" in menu_registry.search_menus("LevelEditor.MainMenu.W")
+    assert menus.ObjectIterator.call_count == 1
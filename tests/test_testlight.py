@@ -0,0 +1,39 @@
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from conftest import load_script  # noqa: E402
+
+STATE = {"sun": (255, 200, 120), "sky": (150, 180, 255), "intensity": 1000.0, "time": 12.0, "atmos": 0.2}
+
+
+@pytest.fixture(scope="module")
+def test_light():
+    return load_script("TestLight")
+
+
+def test_stand_in_scene_only_writes_what_changed(test_light):
+    facade = test_light.StandInFacade()
+    facade.apply_changes(STATE)
+    assert facade.state == STATE and facade.scene["intensity"] == 1000.0
+    writes = facade.writes
+    facade.apply_changes(STATE)
+    assert facade.writes == writes
+    facade.apply_changes(dict(STATE, intensity=2000.0))
+    assert facade.writes == writes + 1 and facade.scene["intensity"] == 2000.0
+    facade.invalidate()
+    facade.apply_changes(STATE)
+    assert facade.writes > writes + 1
+
+
+def test_benchmark_appends_one_summary_per_run(test_light, tmp_path, capsys):
+    history = tmp_path / "benchmarks.jsonl"
+    for _ in range(2):
+        summary = test_light.run_benchmark(applies=3, storm_ticks=5, preset_switches=3, history_path=str(history))
+    rows = [json.loads(line) for line in history.read_text().splitlines()]
+    assert len(rows) == 2 and rows[-1] == summary
+    assert summary["applies_per_s"] > 0 and summary["storm_frame"]["max_ms"] >= summary["storm_frame"]["median_ms"]
+    assert summary["storm_writes_per_tick"] <= 2.0  # one sun time + one sun colour write per drag tick
+    assert "Previous run" in capsys.readouterr().out
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+import shiboken6
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import QTimer  # noqa: E402
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+import tool_host  # noqa: E402
+
+
+@pytest.fixture
+def factory():
+    built = []
+
+    def build():
+        widget = QWidget()
+        widget.timer = QTimer(widget)
+        widget.timer.start(1000)
+        built.append(widget)
+        return widget
+    build.built = built
+    yield build
+    for widget in built:
+        if shiboken6.isValid(widget):
+            widget.deleteLater()
+
+
+def test_relaunch_shows_the_warm_window(factory):
+    first = tool_host.launch("tool", factory, parent_to_slate=False)
+    first.close()
+    assert not first.isVisible() and tool_host.get("tool") is first
+    assert tool_host.launch("tool", factory, parent_to_slate=False) is first
+    assert first.isVisible() and len(factory.built) == 1
+
+
+def test_timers_pause_while_hidden(factory):
+    widget = tool_host.launch("tool", factory, parent_to_slate=False)
+    widget.hide()
+    assert not widget.timer.isActive()
+    tool_host.launch("tool", factory, parent_to_slate=False)
+    assert widget.timer.isActive()
+
+
+def test_edited_source_rebuilds_the_window(factory, tmp_path):
+    source = tmp_path / "tool.py"
+    source.write_text("# v1")
+    first = tool_host.launch("tool", factory, source=str(source), parent_to_slate=False)
+    os.utime(source, (0, os.path.getmtime(source) + 10))
+    second = tool_host.launch("tool", factory, source=str(source), parent_to_slate=False)
+    assert second is not first and len(factory.built) == 2
+    assert tool_host.get("tool") is second
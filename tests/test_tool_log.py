@@ -0,0 +1,69 @@
+import json
+from unittest import mock
+
+import pytest
+
+import tool_log
+
+
+@pytest.fixture
+def log():
+    for name in ("_ring", "_pending"):
+        getattr(tool_log, name).clear()
+    tool_log._suppressed.clear()
+    tool_log._windows.clear()
+    return tool_log.get_logger("TestLog", tool_log.INFO)
+
+
+def test_messages_are_buffered_until_flush(log, fake_unreal):
+    fake_unreal.log.reset_mock()
+    log.info("built %s", "SM_Rock_BP")
+    fake_unreal.log.assert_not_called()
+    tool_log.flush()
+    fake_unreal.log.assert_called_once_with("[TestLog] built SM_Rock_BP")
+
+
+def test_below_level_is_dropped(log):
+    log.debug("noise %d", 1)
+    assert tool_log.recent() == []
+
+
+def test_rate_limit_per_template(log):
+    for i in range(tool_log.RATE_LIMIT + 25):
+        log.info("tick %d", i)
+    log.info("other")
+    kept = tool_log.recent(1000)
+    assert len(kept) == tool_log.RATE_LIMIT + 1
+    assert tool_log._suppressed[("TestLog", "tick %d")] == 25
+
+
+def test_suppressed_count_is_reported_on_flush(log, fake_unreal):
+    for i in range(tool_log.RATE_LIMIT + 3):
+        log.info("tick %d", i)
+    tool_log.flush()
+    with open(tool_log.log_path(), encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    summary = [row for row in rows if row.get("suppressed")]
+    assert len(summary) == 1 and summary[0]["suppressed"] == 3
+    assert tool_log._suppressed == {}
+
+
+def test_window_resets_after_a_second(log, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(tool_log.time, "time", lambda: now[0])
+    for i in range(tool_log.RATE_LIMIT + 5):
+        log.info("tick %d", i)
+    now[0] += 1.0
+    log.info("tick %d", -1)
+    assert tool_log.recent(1)[-1] == "[TestLog] tick -1"
+
+
+def test_errors_flush_immediately(log):
+    with mock.patch.object(tool_log, "flush") as flush:
+        log.error("broke")
+    flush.assert_called_once()
+
+
+def test_bad_format_args_dont_raise(log):
+    log.info("%d items", "many")
+    assert tool_log.recent(1) == ["[TestLog] %d items ('many',)"]
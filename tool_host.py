@@ -0,0 +1,121 @@
+"""
+Single-instance host for the generator and lighting tool windows.
+
+launch(key, factory) keeps one warm window per tool key. Relaunching shows and
+raises the existing window instead of closing it and rebuilding the widget
+tree, stylesheet and timers; a new window is only built when the tool's
+source file changed since the current one was created (i.e. the script was
+edited and re-run) or the old window was destroyed.
+
+Hosted windows are hidden rather than deleted on close, and the QTimers they
+own are paused while hidden so they don't keep polling the editor.
+"""
+
+import os
+import sys
+
+import shiboken6
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
+from PySide6.QtWidgets import QApplication
+
+import tool_log
+
+try:
+    import unreal
+    UNREAL_AVAILABLE = True
+except Exception:
+    UNREAL_AVAILABLE = False
+
+log = tool_log.get_logger("ToolHost")
+
+# Kept on the unreal module so warm windows survive importlib.reload() of this
+# module; outside Unreal a module-level dict is all there is
+_STATE_ATTR = "_bpg_hosted_windows"
+_local_instances = {}
+
+
+def _instances():
+    """key -> (widget, source stamp)"""
+    if not UNREAL_AVAILABLE:
+        return _local_instances
+    instances = getattr(unreal, _STATE_ATTR, None)
+    if instances is None:
+        instances = {}
+        setattr(unreal, _STATE_ATTR, instances)
+    return instances
+
+
+def _source_stamp(source):
+    if not source:
+        return None
+    try:
+        return os.path.getmtime(source)
+    except OSError:
+        return None
+
+
+class _TimerPauser(QObject):
+    """Stops a window's timers when it is hidden and restarts them when shown"""
+    def __init__(self, widget):
+        super().__init__(widget)
+        self._paused = []
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Hide:
+            self._paused = [t for t in obj.findChildren(QTimer) if t.isActive()]
+            for t in self._paused:
+                t.stop()
+        elif event.type() == QEvent.Show:
+            for t in self._paused:
+                if shiboken6.isValid(t):
+                    t.start()
+            self._paused = []
+        return False
+
+
+def get(key):
+    entry = _instances().get(key)
+    if entry and shiboken6.isValid(entry[0]):
+        return entry[0]
+    return None
+
+
+def launch(key, factory, source=None, parent_to_slate=True):
+    """Show the warm instance for key, building it with factory() only when needed."""
+    if not QApplication.instance():
+        QApplication(sys.argv)
+
+    stamp = _source_stamp(source)
+    entry = _instances().get(key)
+    if entry:
+        widget, built_from = entry
+        if shiboken6.isValid(widget) and built_from == stamp:
+            widget.show()
+            widget.raise_()
+            widget.activateWindow()
+            return widget
+        discard(key)
+
+    widget = factory()
+    widget.setAttribute(Qt.WA_DeleteOnClose, False)
+    widget.installEventFilter(_TimerPauser(widget))
+    widget.show()
+    widget.raise_()
+    widget.activateWindow()
+
+    if parent_to_slate and UNREAL_AVAILABLE:
+        try:
+            unreal.parent_external_window_to_slate(widget.winId())
+        except Exception as e:
+            log.warning("Could not parent to slate: %s", e)
+
+    _instances()[key] = (widget, stamp)
+    return widget
+
+
+def discard(key):
+    """Close and delete the hosted window for key, if any."""
+    entry = _instances().pop(key, None)
+    if entry and shiboken6.isValid(entry[0]):
+        entry[0].close()
+        entry[0].deleteLater()
@@ -0,0 +1,193 @@
+"""
+Buffered, structured logging for the generator and lighting tools.
+
+    log = tool_log.get_logger("BPGenerator")
+    log.info("Created %s", bp_name, asset=asset_path)
+
+Records go into an in-memory ring buffer instead of straight to the Output
+Log. flush() writes everything pending in one batch: one Output Log call per
+level (or stdout outside Unreal) and one append to a JSONL file. Flushing
+happens on a slate tick every FLUSH_INTERVAL seconds inside the editor, when
+FLUSH_AT records are pending, immediately for errors, and at exit.
+
+A call below the logger's level returns after one integer compare; message
+%-args are only formatted at flush time, so pass them as args rather than
+pre-formatting with f-strings in hot paths. Each (logger, message template)
+is rate limited to RATE_LIMIT records per second; the rest are counted and
+reported as "suppressed" on the next flush.
+"""
+
+import atexit
+import collections
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import unreal
+    UNREAL_AVAILABLE = True
+except Exception:
+    UNREAL_AVAILABLE = False
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error"}
+
+RING_SIZE = 5000       # records kept in memory for recent()
+FLUSH_AT = 200         # pending records that trigger a flush
+FLUSH_INTERVAL = 0.5   # seconds between slate-tick flushes
+RATE_LIMIT = 50        # records per second per (logger, template)
+
+_lock = threading.Lock()
+_ring = collections.deque(maxlen=RING_SIZE)
+_pending = []
+_suppressed = collections.Counter()
+_windows = {}          # (logger, template) -> [window start, count]
+_loggers = {}
+_tick = {"handle": None, "last": 0.0}
+
+
+def log_path():
+    if UNREAL_AVAILABLE:
+        root = os.path.join(unreal.Paths.project_saved_dir(), "BlueprintGenerator")
+    else:
+        root = os.path.join(os.path.expanduser("~"), ".ue_lighting_tool")
+    return os.path.join(root, "logs", "tools.jsonl")
+
+
+class Logger:
+    def __init__(self, name, level=INFO):
+        self.name = name
+        self.level = level
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def debug(self, msg, *args, **fields):
+        if DEBUG >= self.level:
+            _emit(self.name, DEBUG, msg, args, fields)
+
+    def info(self, msg, *args, **fields):
+        if INFO >= self.level:
+            _emit(self.name, INFO, msg, args, fields)
+
+    def warning(self, msg, *args, **fields):
+        if WARNING >= self.level:
+            _emit(self.name, WARNING, msg, args, fields)
+
+    def error(self, msg, *args, **fields):
+        if ERROR >= self.level:
+            _emit(self.name, ERROR, msg, args, fields)
+
+
+def get_logger(name, level=None):
+    """One shared Logger per name; level=None keeps the current one (INFO, or LOG_LEVEL_<NAME> from the environment)."""
+    logger = _loggers.get(name)
+    if logger is None:
+        env = os.environ.get(f"LOG_LEVEL_{name.upper()}", "").upper()
+        default = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR}.get(env, INFO)
+        logger = _loggers[name] = Logger(name, default)
+        _install_tick()
+    if level is not None:
+        logger.level = level
+    return logger
+
+
+def _emit(name, level, msg, args, fields):
+    now = time.time()
+    key = (name, msg)
+    with _lock:
+        window = _windows.get(key)
+        if window is None or now - window[0] >= 1.0:
+            window = _windows[key] = [now, 0]
+        window[1] += 1
+        if window[1] > RATE_LIMIT:
+            _suppressed[key] += 1
+            return
+        record = (now, level, name, msg, args, fields)
+        _ring.append(record)
+        _pending.append(record)
+        due = level >= ERROR or len(_pending) >= FLUSH_AT
+    if due:
+        flush()
+
+
+def _format(record):
+    _, level, name, msg, args, _ = record
+    try:
+        text = msg % args if args else msg
+    except (TypeError, ValueError):
+        text = f"{msg} {args}"
+    return f"[{name}] {text}"
+
+
+def flush():
+    """Write pending records to the Output Log (batched per level) and the JSONL file."""
+    with _lock:
+        if not _pending and not _suppressed:
+            return
+        batch = _pending[:]
+        del _pending[:]
+        suppressed = dict(_suppressed)
+        _suppressed.clear()
+
+    lines = {DEBUG: [], INFO: [], WARNING: [], ERROR: []}
+    rows = []
+    for record in batch:
+        text = _format(record)
+        lines[record[1]].append(text)
+        row = {"ts": round(record[0], 3), "level": LEVEL_NAMES[record[1]], "logger": record[2], "msg": text}
+        if record[5]:
+            row.update(record[5])
+        rows.append(row)
+    for (name, msg), count in suppressed.items():
+        text = f"[{name}] suppressed {count} more like: {msg}"
+        lines[WARNING].append(text)
+        rows.append({"ts": round(time.time(), 3), "level": "warning", "logger": name, "msg": text, "suppressed": count})
+
+    for level, texts in lines.items():
+        if not texts:
+            continue
+        text = "\n".join(texts)
+        if not UNREAL_AVAILABLE:
+            print(text, file=sys.stderr if level >= WARNING else sys.stdout)
+        elif level >= ERROR:
+            unreal.log_error(text)
+        elif level >= WARNING:
+            unreal.log_warning(text)
+        else:
+            unreal.log(text)
+
+    try:
+        path = log_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(row, default=str) + "\n" for row in rows))
+    except OSError:
+        pass
+
+
+def recent(count=100, level=DEBUG):
+    """Last count records at or above level, formatted, oldest first (from the ring buffer)."""
+    with _lock:
+        records = [r for r in _ring if r[1] >= level]
+    return [_format(r) for r in records[-count:]]
+
+
+def _on_tick(delta_seconds):
+    now = time.time()
+    if now - _tick["last"] >= FLUSH_INTERVAL:
+        _tick["last"] = now
+        flush()
+
+
+def _install_tick():
+    if _tick["handle"] is None and UNREAL_AVAILABLE:
+        try:
+            _tick["handle"] = unreal.register_slate_post_tick_callback(_on_tick)
+        except Exception:
+            _tick["handle"] = False  # no slate (commandlet); rely on FLUSH_AT and atexit
+
+
+atexit.register(flush)